@@ -0,0 +1,45 @@
+"""
+HWPX 직접 추출과 PDF 변환 경로 비교 벤치마크
+
+사용법:
+    python benchmarks/bench_hwpx_extraction.py [페이지수 ...]
+
+같은 본문을 가진 합성 HWPX와 합성 PDF에 대해 추출 시간, 최대 메모리, 추출 글자 수를 출력한다.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import document_extractor
+from synthetic_docs import make_synthetic_hwpx, make_synthetic_pdf
+
+
+def measure(extractor, data):
+    """추출 함수 실행 시간(초), 최대 메모리(MB), 결과 글자 수 반환"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    text = extractor(data)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return elapsed, peak, len(text)
+
+
+def main(page_counts):
+    print(f"{'페이지':>6} {'형식':>6} {'시간(초)':>10} {'메모리(MB)':>10} {'글자 수':>10}")
+    for num_pages in page_counts:
+        routes = [
+            ("pdf", make_synthetic_pdf(num_pages), lambda data: document_extractor.extract_text_from_pdf(data, max_workers=1)),
+            ("hwpx", make_synthetic_hwpx(num_pages), document_extractor.extract_text_from_hwpx),
+        ]
+        for label, data, extractor in routes:
+            elapsed, peak, chars = measure(extractor, data)
+            print(f"{num_pages:>6} {label:>6} {elapsed:>10.3f} {peak:>10.1f} {chars:>10,}")
+
+
+if __name__ == "__main__":
+    counts = [int(arg) for arg in sys.argv[1:]] or [50, 200]
+    main(counts)
@@ -0,0 +1,46 @@
+"""
+PDF 텍스트 추출 병렬화 벤치마크
+
+사용법:
+    python benchmarks/bench_pdf_extraction.py [페이지수 ...]
+
+합성 PDF에 대해 작업 프로세스 수별 추출 시간과 단일 프로세스 대비 속도 향상을 출력한다.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import document_extractor
+from synthetic_docs import make_synthetic_pdf
+
+
+def time_extraction(data, max_workers, repeat=3):
+    """주어진 작업자 수로 추출을 반복 실행하여 최소 소요 시간(초) 반환"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        document_extractor.extract_pdf_pages(data, max_workers=max_workers)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(page_counts):
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cpu_count} & set(range(1, cpu_count + 1)))
+
+    print(f"CPU 코어 수: {cpu_count}")
+    print(f"{'페이지':>6} {'작업자':>6} {'시간(초)':>10} {'속도향상':>8} {'코어당':>8}")
+    for num_pages in page_counts:
+        data = make_synthetic_pdf(num_pages)
+        baseline = time_extraction(data, max_workers=1)
+        for workers in worker_counts:
+            elapsed = baseline if workers == 1 else time_extraction(data, max_workers=workers)
+            speedup = baseline / elapsed
+            print(f"{num_pages:>6} {workers:>6} {elapsed:>10.3f} {speedup:>7.2f}x {speedup / workers:>7.2f}x")
+
+
+if __name__ == "__main__":
+    counts = [int(arg) for arg in sys.argv[1:]] or [200, 500]
+    main(counts)
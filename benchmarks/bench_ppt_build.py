@@ -0,0 +1,167 @@
+"""
+PPT 생성 경로 벤치마크 (create_enhanced_ppt, extract_slides_from_text, fallback_parse_document)
+
+사용법:
+    python benchmarks/bench_ppt_build.py [--slides 10 100 500] [--repeat 3]
+                                         [--save 결과.json] [--compare 기준.json] [--tolerance 0.25]
+
+합성 슬라이드 계획(한국어 불릿 길이 분포 반영)을 템플릿별로 PPT로 만들고,
+같은 계획을 AI 응답 형식과 공문서 형식 텍스트로 바꿔 파싱 함수도 측정한다.
+각 항목의 시간(초, 반복 중 최솟값), 최대 메모리(MB), 출력 크기(바이트)를 출력하며
+--save로 JSON 기준값을 저장하고 --compare로 기준값 대비 느려지거나 메모리가 늘어난 항목을 찾는다.
+기준값보다 tolerance 비율 이상 나빠진 항목이 있으면 종료 코드 1을 반환한다.
+"""
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ppt_generator import ENHANCED_TEMPLATES, create_enhanced_ppt, extract_slides_from_text, fallback_parse_document
+
+# 불릿을 만들 때 이어 붙이는 문구 (공문서 보고서 문체)
+PHRASES = [
+    "남양주시", "도시재생 뉴딜사업", "추진 배경", "세부 추진 일정", "예산 편성 현황", "주민 설명회 개최",
+    "관계 부서 협의", "국비 및 도비 확보", "시설 개선", "민원 처리 기간 단축", "사업 효과 분석",
+    "향후 계획 수립", "교통 혼잡 완화", "공공시설 확충", "데이터 기반 행정", "만족도 조사 결과",
+]
+
+# 불릿 길이 범위 (글자 수) - 실제 보고서 불릿은 대체로 20~90자
+MIN_BULLET_CHARS = 20
+MAX_BULLET_CHARS = 90
+
+
+def make_bullet(rng, slide, point):
+    """글자 수가 무작위(고정 시드)인 한국어 불릿 생성"""
+    target = rng.randint(MIN_BULLET_CHARS, MAX_BULLET_CHARS)
+    words = [f"{slide}-{point}."]
+    while len(" ".join(words)) < target:
+        words.append(rng.choice(PHRASES))
+    return " ".join(words)
+
+
+def make_slide_plan(num_slides, bullets_per_slide=6, seed=0):
+    """합성 슬라이드 계획 생성 (첫 슬라이드는 제목 슬라이드, 슬라이드당 불릿 3개~bullets_per_slide개)"""
+    rng = random.Random(seed)
+    slides = [{"title": "남양주시 종합계획 보고", "content": ["2025년 기획예산과"]}]
+    for slide in range(1, num_slides):
+        count = rng.randint(3, bullets_per_slide)
+        slides.append({
+            "title": f"{slide}. 주요 추진 사업",
+            "content": [make_bullet(rng, slide, point) for point in range(1, count + 1)],
+        })
+    return slides
+
+
+def plan_to_ai_text(slides):
+    """슬라이드 계획을 AI 응답 형식 텍스트로 변환 (extract_slides_from_text 입력)"""
+    parts = []
+    for number, slide in enumerate(slides, 1):
+        parts.append(f"슬라이드 {number}: {slide['title']}")
+        parts.extend(f"• {point}" for point in slide["content"])
+    return "\n".join(parts)
+
+
+def plan_to_document(slides):
+    """슬라이드 계획을 공문서 형식 텍스트로 변환 (fallback_parse_document 입력)"""
+    parts = [slides[0]["title"], slides[0]["content"][0]]
+    for slide in slides[1:]:
+        parts.append(f"■ {slide['title']}")
+        parts.extend(f"○ {point}" for point in slide["content"])
+    return "\n".join(parts)
+
+
+def output_size(result):
+    """결과 크기 (PPT는 파일 바이트, 슬라이드 리스트는 JSON 바이트)"""
+    if isinstance(result, io.BytesIO):
+        return len(result.getvalue())
+    return len(json.dumps(result, ensure_ascii=False).encode("utf-8"))
+
+
+def measure(func, args, repeat):
+    """실행 시간(초, 최솟값), 최대 메모리(MB), 출력 크기(바이트) 측정"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    # 메모리는 시간 측정과 분리해 한 번 더 실행 (tracemalloc 오버헤드 제외)
+    # tracemalloc은 파이썬 할당만 추적하므로 lxml 내부(C) 메모리는 포함되지 않음
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return best, peak, output_size(result)
+
+
+def run_cases(slide_counts, repeat):
+    """모든 측정 항목 실행 결과 리스트"""
+    results = []
+    for num_slides in slide_counts:
+        slides = make_slide_plan(num_slides)
+        cases = [(f"create_enhanced_ppt[{name}]", create_enhanced_ppt, (slides, name)) for name in ENHANCED_TEMPLATES]
+        cases.append(("extract_slides_from_text", extract_slides_from_text, (plan_to_ai_text(slides),)))
+        cases.append(("fallback_parse_document", fallback_parse_document, (plan_to_document(slides),)))
+        for case, func, args in cases:
+            seconds, peak_mb, size = measure(func, args, repeat)
+            results.append({"case": case, "slides": num_slides, "seconds": seconds, "peak_mb": peak_mb, "bytes": size})
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """기준값 대비 시간이나 메모리가 tolerance 비율 이상 늘어난 항목 리스트"""
+    previous = {(item["case"], item["slides"]): item for item in baseline["results"]}
+    regressions = []
+    for item in results:
+        base = previous.get((item["case"], item["slides"]))
+        if not base:
+            continue
+        for metric in ("seconds", "peak_mb"):
+            if base[metric] > 0 and item[metric] > base[metric] * (1 + tolerance):
+                regressions.append((item["case"], item["slides"], metric, base[metric], item[metric]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PPT 생성 경로 벤치마크")
+    parser.add_argument("--slides", type=int, nargs="+", default=[10, 100, 500], help="슬라이드 수 목록")
+    parser.add_argument("--repeat", type=int, default=3, help="시간 측정 반복 횟수")
+    parser.add_argument("--save", help="결과를 저장할 JSON 기준값 경로")
+    parser.add_argument("--compare", help="비교할 JSON 기준값 경로")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 증가 비율 (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    create_enhanced_ppt(make_slide_plan(2))  # 준비 실행 (템플릿 컴파일·글꼴 색인)
+    results = run_cases(args.slides, args.repeat)
+
+    print(f"{'항목':<32} {'슬라이드':>8} {'시간(초)':>10} {'메모리(MB)':>10} {'출력(바이트)':>12}")
+    for item in results:
+        print(f"{item['case']:<32} {item['slides']:>8} {item['seconds']:>10.3f} {item['peak_mb']:>10.1f} {item['bytes']:>12,}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"created": time.strftime("%Y-%m-%d %H:%M:%S"), "repeat": args.repeat, "results": results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"\n기준값 저장: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n성능 저하 {len(regressions)}건 (허용 {args.tolerance:.0%}):")
+            for case, num_slides, metric, before, after in regressions:
+                print(f"  {case} {num_slides}장 {metric}: {before:.3f} → {after:.3f}")
+            return 1
+        print(f"\n기준값 대비 성능 저하 없음 (허용 {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
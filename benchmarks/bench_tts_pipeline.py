@@ -0,0 +1,217 @@
+"""
+TTS 파이프라인 벤치마크 (조각 나누기, 동시 합성, 오디오 캐시, 음성 압축, 일괄 변환, 공통 문장 중복 제거)
+
+사용법:
+    python benchmarks/bench_tts_pipeline.py [--chars 2000 10000 50000] [--workers 1 2 4 8]
+                                            [--latency 0.2] [--latency-per-char 0.0005] [--repeat 3]
+                                            [--save 결과.json] [--compare 기준.json] [--tolerance 0.25]
+
+네트워크 없이 tts_engine의 로컬 합성 엔진(LocalEngine)으로 TTS 서비스 응답 지연을 흉내 내어
+synthesize_chunked, compact_audio, synthesize_batch를 실제 화면과 같은 경로로 실행한다.
+각 항목의 시간(초, 반복 중 최솟값), 엔진 호출 수, 합성 글자 수, 출력 크기(바이트)를 출력하며
+--save로 JSON 기준값을 저장하고 --compare로 기준값 대비 느려진 항목을 찾는다.
+기준값보다 tolerance 비율 이상 느려진 항목이 있으면 종료 코드 1을 반환한다.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tts_engine
+from tts_engine import (AudioCache, LocalEngine, SynthesisWindow, chunk_text, compact_audio, find_shared_sentences,
+                        synthesize_batch, synthesize_chunked)
+
+# 문장을 만들 때 이어 붙이는 문구 (안내 방송 문체)
+PHRASES = [
+    "남양주시", "도시재생 뉴딜사업", "주민 설명회", "관계 부서 협의", "시설 개선 공사", "민원 처리 기간",
+    "교통 혼잡 완화", "공공시설 확충", "방역 수칙 준수", "재난 안전 문자", "시민 여러분께서는",
+    "읍면동 행정복지센터", "참여를 부탁드립니다", "일정이 변경되었습니다", "자세한 사항은",
+]
+
+# 문장 길이 범위 (글자 수)
+MIN_SENTENCE_CHARS = 20
+MAX_SENTENCE_CHARS = 80
+
+# 일괄 변환 항목 수와 항목당 글자 수
+BATCH_ITEMS = 20
+BATCH_ITEM_CHARS = 1500
+
+# 안내 방송 일괄 변환의 고정 인사말과 맺음말 (공통 문장 중복 제거 측정용)
+OPENING = ("안녕하십니까, 남양주시에서 시민 여러분께 알려드립니다. "
+           "지금부터 이번 주 주요 소식을 전해 드리겠습니다. 방송을 끝까지 잘 들어 주시기 바랍니다.")
+CLOSING = ("자세한 사항은 남양주시 홈페이지나 가까운 읍면동 행정복지센터로 문의하시기 바랍니다. "
+           "시민 여러분의 많은 관심과 협조를 부탁드립니다. 감사합니다.")
+BOILERPLATE_BODY_CHARS = 300
+
+# 이보다 짧은 항목(초)은 측정 오차가 커서 시간 비교에서 제외
+MIN_COMPARE_SECONDS = 0.01
+
+
+def make_text(num_chars, seed=0):
+    """글자 수가 num_chars 근처인 한국어 안내문 생성 (고정 시드)"""
+    rng = random.Random(seed)
+    sentences = []
+    length = 0
+    while length < num_chars:
+        target = rng.randint(MIN_SENTENCE_CHARS, MAX_SENTENCE_CHARS)
+        words = [f"{len(sentences) + 1}번"]
+        while len(" ".join(words)) < target:
+            words.append(rng.choice(PHRASES))
+        sentence = " ".join(words) + "."
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(sentences)
+
+
+def edit_one_sentence(text):
+    """가운데 문장 하나만 바꾼 텍스트 (캐시 재사용률 측정용)"""
+    sentences = tts_engine.split_sentences(text)
+    middle = len(sentences) // 2
+    sentences[middle] = sentences[middle].replace("번", "번 수정", 1)
+    return " ".join(sentences)
+
+
+def measure(func, repeat, engine, prepare=None):
+    """실행 시간(초, 최솟값)과 마지막 실행의 엔진 호출 수, 합성 글자 수, 출력 크기(바이트) 측정"""
+    best = float("inf")
+    for _ in range(repeat):
+        if prepare:
+            prepare()
+        engine.reset_stats()
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    size = len(result[0] if isinstance(result, tuple) else result)
+    return best, engine.calls, engine.chars, size
+
+
+def run_cases(char_counts, worker_counts, engine, repeat):
+    """모든 측정 항목 실행 결과 리스트"""
+    synthesize = lambda chunk: engine.synthesize(chunk, "local", "ko")
+    cache_params = ("local", "local", "ko", 1.0)
+    cache_dir = tempfile.mkdtemp(prefix="bench_tts_")
+    state = {"cache": AudioCache(cache_dir)}
+
+    def clear_cache():
+        """캐시 폴더를 비우고 빈 캐시로 교체"""
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        state["cache"] = AudioCache(cache_dir)
+
+    results = []
+    try:
+        for num_chars in char_counts:
+            text = make_text(num_chars)
+            edited = edit_one_sentence(text)
+            cases = [("chunk_text", 0, lambda: "".join(chunk_text(text)).encode("utf-8"), None)]
+            for workers in worker_counts:
+                cases.append(("synthesize_chunked[cold]", workers,
+                              lambda w=workers: synthesize_chunked(text, synthesize, max_workers=w), None))
+            workers = max(worker_counts)
+            run = lambda source: synthesize_chunked(source, synthesize, max_workers=workers,
+                                                    cache=state["cache"], cache_params=cache_params)
+            cases.append(("synthesize_chunked[cache_fill]", workers, lambda: run(text), clear_cache))
+            cases.append(("synthesize_chunked[cache_hit]", workers, lambda: run(text), lambda: run(text)))
+            cases.append(("synthesize_chunked[one_edit]", workers, lambda: run(edited),
+                          lambda: (clear_cache(), run(text))))
+            # 압축: 출력 크기를 cold 항목과 비교 (무음 정리만, ffmpeg 재인코딩 제외)
+            cases.append(("compact_audio[trim]", 0, lambda: compact_audio(state["audio"])[0],
+                          lambda: state.update(audio=run(text))))
+            for case, case_workers, func, prepare in cases:
+                seconds, calls, chars, size = measure(func, repeat, engine, prepare)
+                results.append({"case": case, "chars": num_chars, "workers": case_workers, "seconds": seconds,
+                                "calls": calls, "synth_chars": chars, "bytes": size})
+
+        # 일괄 변환: 항목 안의 조각과 항목 사이 모두 동시에 처리
+        items = [{"name": f"안내{number}", "text": make_text(BATCH_ITEM_CHARS, seed=number), "voice": ""}
+                 for number in range(BATCH_ITEMS)]
+        workers = max(worker_counts)
+        synthesize_item = lambda item: synthesize_chunked(item["text"], synthesize, max_workers=workers)
+        seconds, calls, chars, size = measure(lambda: synthesize_batch(items, synthesize_item), repeat, engine)
+        results.append({"case": f"synthesize_batch[{BATCH_ITEMS}]", "chars": BATCH_ITEM_CHARS * BATCH_ITEMS,
+                        "workers": workers, "seconds": seconds, "calls": calls, "synth_chars": chars, "bytes": size})
+
+        # 고정 인사말·맺음말이 있는 안내 방송 일괄 변환: 공통 문장 중복 제거 전후
+        items = [{"name": f"방송{number}", "voice": "",
+                  "text": f"{OPENING} {make_text(BOILERPLATE_BODY_CHARS, seed=number)} {CLOSING}"}
+                 for number in range(BATCH_ITEMS)]
+        total_chars = sum(len(item["text"]) for item in items)
+        shared = find_shared_sentences([item["text"] for item in items])
+        for case, dedup in (("synthesize_batch[boilerplate]", False), ("synthesize_batch[boilerplate+dedup]", True)):
+            def run_batch(dedup=dedup):
+                window = SynthesisWindow()
+                synthesize_item = lambda item: synthesize_chunked(item["text"], synthesize, max_workers=workers,
+                                                                  shared=shared if dedup else None, window=window,
+                                                                  cache_params=cache_params)
+                return synthesize_batch(items, synthesize_item)
+            seconds, calls, chars, size = measure(run_batch, repeat, engine)
+            results.append({"case": case, "chars": total_chars, "workers": workers, "seconds": seconds,
+                            "calls": calls, "synth_chars": chars, "bytes": size})
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """기준값 대비 시간이 tolerance 비율 이상 늘었거나 엔진 호출이 늘어난 항목 리스트 (아주 짧은 항목은 시간 비교 제외)"""
+    previous = {(item["case"], item["chars"], item["workers"]): item for item in baseline["results"]}
+    regressions = []
+    for item in results:
+        base = previous.get((item["case"], item["chars"], item["workers"]))
+        if not base:
+            continue
+        if base["seconds"] >= MIN_COMPARE_SECONDS and item["seconds"] > base["seconds"] * (1 + tolerance):
+            regressions.append((item["case"], item["chars"], item["workers"], "seconds", base["seconds"], item["seconds"]))
+        if item["calls"] > base["calls"]:
+            regressions.append((item["case"], item["chars"], item["workers"], "calls", base["calls"], item["calls"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TTS 파이프라인 벤치마크 (로컬 합성 엔진)")
+    parser.add_argument("--chars", type=int, nargs="+", default=[2000, 10000, 50000], help="텍스트 글자 수 목록")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="동시 합성 수 목록")
+    parser.add_argument("--latency", type=float, default=0.2, help="요청당 응답 지연(초)")
+    parser.add_argument("--latency-per-char", type=float, default=0.0005, help="글자당 추가 응답 지연(초)")
+    parser.add_argument("--repeat", type=int, default=3, help="시간 측정 반복 횟수")
+    parser.add_argument("--save", help="결과를 저장할 JSON 기준값 경로")
+    parser.add_argument("--compare", help="비교할 JSON 기준값 경로")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 증가 비율 (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    engine = LocalEngine(latency=args.latency, latency_per_char=args.latency_per_char)
+    results = run_cases(args.chars, args.workers, engine, args.repeat)
+
+    print(f"지연: 요청당 {args.latency}초 + 글자당 {args.latency_per_char}초\n")
+    print(f"{'항목':<36} {'글자':>7} {'동시':>4} {'시간(초)':>9} {'호출':>5} {'합성 글자':>9} {'출력(바이트)':>12}")
+    for item in results:
+        print(f"{item['case']:<36} {item['chars']:>7} {item['workers']:>4} {item['seconds']:>9.3f} "
+              f"{item['calls']:>5} {item['synth_chars']:>9,} {item['bytes']:>12,}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"created": time.strftime("%Y-%m-%d %H:%M:%S"), "repeat": args.repeat,
+                       "latency": args.latency, "latency_per_char": args.latency_per_char, "results": results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"\n기준값 저장: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n성능 저하 {len(regressions)}건 (허용 {args.tolerance:.0%}):")
+            for case, num_chars, workers, metric, before, after in regressions:
+                print(f"  {case} {num_chars}자 동시 {workers} {metric}: {before:.3f} → {after:.3f}")
+            return 1
+        print(f"\n기준값 대비 성능 저하 없음 (허용 {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
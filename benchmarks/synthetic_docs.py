@@ -0,0 +1,119 @@
+"""벤치마크용 합성 문서 생성 도구"""
+import io
+import zipfile
+from xml.sax.saxutils import escape
+
+# 페이지마다 반복되는 머리글/바닥글과 본문 줄 (Helvetica 기본 폰트로 표현 가능한 ASCII)
+HEADER_LINE = "Namyangju City Comprehensive Plan 2025"
+FOOTER_LINE = "Namyangju City Hall - Planning Division"
+BODY_LINE = "Section {page}.{line} budget allocation and schedule for the municipal program item {line}"
+
+
+def _escape_pdf_text(text):
+    """PDF 문자열 리터럴 이스케이프"""
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_synthetic_pdf(num_pages, lines_per_page=40):
+    """
+    텍스트 레이어가 있는 합성 PDF 생성
+
+    Parameters:
+    num_pages (int): 페이지 수
+    lines_per_page (int): 페이지당 본문 줄 수
+
+    Returns:
+    bytes: PDF 파일 바이트
+    """
+    objects = []
+
+    def add_object(body):
+        objects.append(body)
+        return len(objects)
+
+    catalog_id = add_object(None)
+    pages_id = add_object(None)
+    font_id = add_object(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    page_ids = []
+    for page in range(1, num_pages + 1):
+        lines = [HEADER_LINE]
+        lines.extend(BODY_LINE.format(page=page, line=line) for line in range(1, lines_per_page + 1))
+        lines.append(FOOTER_LINE)
+        lines.append(f"- {page} -")
+
+        commands = ["BT", "/F1 9 Tf", "11 TL", "40 800 Td"]
+        for line in lines:
+            commands.append(f"({_escape_pdf_text(line)}) Tj T*")
+        commands.append("ET")
+        stream = "\n".join(commands).encode("latin-1")
+
+        content_id = add_object(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        page_ids.append(add_object(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (pages_id, font_id, content_id)
+        ))
+
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[catalog_id - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id
+    objects[pages_id - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    output = io.BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+
+    xref_offset = output.tell()
+    output.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        output.write(b"%010d 00000 n \n" % offset)
+    output.write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, catalog_id, xref_offset))
+    return output.getvalue()
+
+
+# HWPX 네임스페이스 선언
+HWPX_NAMESPACES = (
+    'xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section" '
+    'xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph"'
+)
+
+
+def _hwpx_paragraph(text):
+    return f'<hp:p><hp:run><hp:t>{escape(text)}</hp:t></hp:run></hp:p>'
+
+
+def _hwpx_table(rows):
+    cells = "".join(
+        "<hp:tr>" + "".join(f"<hp:tc><hp:subList>{_hwpx_paragraph(cell)}</hp:subList></hp:tc>" for cell in row) + "</hp:tr>"
+        for row in rows
+    )
+    return f"<hp:p><hp:run><hp:tbl>{cells}</hp:tbl></hp:run></hp:p>"
+
+
+def make_synthetic_hwpx(num_pages, lines_per_page=40, pages_per_section=50):
+    """
+    make_synthetic_pdf와 같은 본문을 가진 합성 HWPX 생성 (페이지마다 예산 표 1개 포함)
+
+    Parameters:
+    num_pages (int): 페이지 수 (HWPX에는 페이지 개념이 없으므로 같은 분량의 단락으로 구성)
+    lines_per_page (int): 페이지당 본문 줄 수
+    pages_per_section (int): 섹션 파일 하나에 담을 페이지 수
+
+    Returns:
+    bytes: HWPX 파일 바이트
+    """
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("mimetype", "application/hwp+zip", compress_type=zipfile.ZIP_STORED)
+        for section, first_page in enumerate(range(1, num_pages + 1, pages_per_section)):
+            parts = [f'<?xml version="1.0" encoding="UTF-8"?><hs:sec {HWPX_NAMESPACES}>']
+            for page in range(first_page, min(first_page + pages_per_section, num_pages + 1)):
+                parts.append(_hwpx_paragraph(HEADER_LINE))
+                parts.extend(_hwpx_paragraph(BODY_LINE.format(page=page, line=line)) for line in range(1, lines_per_page + 1))
+                parts.append(_hwpx_table([["item", "budget", "schedule"], [f"program {page}", "1,000", "2025-Q1"]]))
+                parts.append(_hwpx_paragraph(FOOTER_LINE))
+            parts.append("</hs:sec>")
+            archive.writestr(f"Contents/section{section}.xml", "".join(parts))
+    return output.getvalue()
@@ -3,9 +3,9 @@ import openai
 from openai import OpenAI
 import google.generativeai as genai
 import os
-import tempfile
-import PyPDF2
 from dotenv import load_dotenv
+import document_extractor
+import text_normalizer
 
 def run():
     # API 키 로드
@@ -98,25 +98,17 @@ def run():
     audience_options = ["시민", "공무원", "기업인", "학생", "어르신", "외국인", "관광객", "주민", "참석자"]
     situation_options = ["일반적 상황", "공식 행사", "내부 회의", "시민 설명회", "기자회견", "교육 세미나", "토론회", "기타"]
     
-    # PDF 텍스트 추출 함수
-    def extract_text_from_pdf(pdf_file):
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            temp_file.write(pdf_file.read())
-            temp_path = temp_file.name
-        
-        text = ""
+    # PDF/HWPX 텍스트 추출 함수
+    def extract_text_from_file(uploaded_file):
         try:
-            with open(temp_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    text += page.extract_text()
+            # 반복 머리글/바닥글·쪽 번호 등을 정리하여 프롬프트 토큰 절감
+            join_lines = document_extractor.get_extension(uploaded_file.name) in document_extractor.HARD_WRAP_EXTENSIONS
+            text, stats = text_normalizer.normalize_pages(document_extractor.extract_pages(uploaded_file), join_lines)
+            st.caption(text_normalizer.format_stats(stats))
+            return text
         except Exception as e:
-            st.error(f"PDF 파일 읽기 오류: {str(e)}")
-        finally:
-            os.unlink(temp_path)
-        
-        return text
+            st.error(f"파일 읽기 오류: {str(e)}")
+            return ""
 
     # OpenAI API 호출 함수
     def generate_content_with_openai(options, document_text, temperature):
@@ -188,22 +180,22 @@ def run():
 
     # 메인 레이아웃
     st.title("📝 AI문서자료 대본 변환기")
-    st.caption("PDF 문서(공고/안내/계획/보고 등)를 업로드하여 발표대본, 시나리오, 회의진행문 등으로 변환해보세요.")
+    st.caption("PDF 또는 한글(HWPX) 문서(공고/안내/계획/보고 등)를 업로드하여 발표대본, 시나리오, 회의진행문 등으로 변환해보세요.")
     
     # 문서 입력 영역
     st.subheader("문서 업로드 또는 텍스트 입력")
     
     # 파일 업로드 또는 텍스트 입력 선택
-    input_method = st.radio("입력 방식 선택", ["PDF 파일 업로드", "직접 텍스트 입력"])
+    input_method = st.radio("입력 방식 선택", ["문서 파일 업로드 (PDF/HWPX)", "직접 텍스트 입력"])
     
-    if input_method == "PDF 파일 업로드":
-        uploaded_file = st.file_uploader("PDF 파일을 업로드하세요", type=["pdf"])
+    if input_method == "문서 파일 업로드 (PDF/HWPX)":
+        uploaded_file = st.file_uploader("PDF 또는 한글(HWPX) 파일을 업로드하세요", type=["pdf", "hwpx"])
         if uploaded_file is not None:
-            with st.spinner("PDF 내용을 추출하는 중..."):
-                extracted_text = extract_text_from_pdf(uploaded_file)
+            with st.spinner("문서 내용을 추출하는 중..."):
+                extracted_text = extract_text_from_file(uploaded_file)
                 if extracted_text:
                     st.session_state.doc_converter_content = extracted_text
-                    st.success("PDF 내용이 추출되었습니다.")
+                    st.success("문서 내용이 추출되었습니다.")
                     st.text_area("추출된 텍스트", value=st.session_state.doc_converter_content, height=250)
     else:
         st.session_state.doc_converter_content = st.text_area(
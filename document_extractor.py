@@ -0,0 +1,656 @@
+import io
+import os
+import re
+import hashlib
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import text_normalizer
+
+# PyPDF2 패키지 체크
+try:
+    import PyPDF2
+    pdf_available = True
+except ImportError:
+    pdf_available = False
+
+def supported_types():
+    """현재 환경에서 추출 가능한 파일 확장자 목록"""
+    types = ["txt", "docx", "hwpx"]
+    if pdf_available:
+        types.append("pdf")
+    return types
+
+
+def _read_bytes(source):
+    """업로드 파일(BytesIO/UploadedFile) 또는 bytes에서 원본 바이트 가져오기"""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if hasattr(source, "getvalue"):
+        return source.getvalue()
+    # 일반 파일 객체는 처음부터 읽기
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source.read()
+
+
+# 캐시에 페이지 리스트를 저장할 때 사용하는 페이지 구분 문자 (폼 피드)
+PAGE_BREAK = "\f"
+
+# 이 페이지 수 미만의 PDF는 프로세스 풀 없이 바로 추출 (풀 기동 비용이 더 큼)
+PARALLEL_PAGE_THRESHOLD = 40
+
+# 작업자 하나에 맡길 최소 페이지 수
+MIN_PAGES_PER_WORKER = 10
+
+# 진행률 표시용 병렬 추출에서 작업자 하나당 나눌 구간 수 (구간이 끝날 때마다 진행률 갱신)
+PROGRESS_RANGES_PER_WORKER = 4
+
+
+def _extract_page_range(data, start, end):
+    """PDF 바이트에서 [start, end) 범위 페이지 텍스트 추출 (프로세스 풀 작업 함수)"""
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+    return [pdf_reader.pages[i].extract_text() or "" for i in range(start, end)]
+
+
+def _split_page_ranges(num_pages, num_workers):
+    """전체 페이지를 작업자 수에 맞춰 연속된 구간으로 분할"""
+    chunk_size = max(MIN_PAGES_PER_WORKER, -(-num_pages // num_workers))
+    return [(start, min(start + chunk_size, num_pages)) for start in range(0, num_pages, chunk_size)]
+
+
+def extract_pdf_pages(source, max_workers=None):
+    """
+    PDF 파일의 페이지별 텍스트를 리스트로 추출
+
+    페이지 수가 PARALLEL_PAGE_THRESHOLD 이상이면 페이지 구간을 나누어
+    ProcessPoolExecutor로 병렬 추출한 뒤 원래 순서대로 합친다.
+
+    Parameters:
+    source: UploadedFile, BytesIO 또는 bytes
+    max_workers (int, optional): 작업 프로세스 수. None이면 CPU 코어 수, 1이면 병렬 처리 안 함
+
+    Returns:
+    list: 페이지 순서대로 정렬된 텍스트 리스트
+    """
+    if not pdf_available:
+        raise RuntimeError("PDF 파일을 읽으려면 PyPDF2 패키지가 필요합니다.")
+
+    data = _read_bytes(source)
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+    num_pages = len(pdf_reader.pages)
+    num_workers = max_workers or os.cpu_count() or 1
+
+    if num_pages < PARALLEL_PAGE_THRESHOLD or num_workers < 2:
+        return [page.extract_text() or "" for page in pdf_reader.pages]
+
+    page_ranges = _split_page_ranges(num_pages, num_workers)
+    try:
+        with ProcessPoolExecutor(max_workers=min(num_workers, len(page_ranges))) as executor:
+            futures = [executor.submit(_extract_page_range, data, start, end) for start, end in page_ranges]
+            # 제출 순서대로 결과를 모아 페이지 순서 유지
+            pages = []
+            for future in futures:
+                pages.extend(future.result())
+            return pages
+    except (OSError, RuntimeError):
+        # 프로세스 생성이 막힌 환경에서는 단일 프로세스로 대체
+        return [page.extract_text() or "" for page in pdf_reader.pages]
+
+
+def extract_text_from_pdf(source, separator="\n\n", max_workers=None):
+    """PDF 파일에서 텍스트 추출 (디스크에 쓰지 않고 메모리에서 직접 처리)"""
+    # 페이지 텍스트를 리스트에 모은 뒤 한 번에 결합 (문자열 += 반복 방지)
+    return separator.join(extract_pdf_pages(source, max_workers=max_workers))
+
+
+def count_pdf_pages(source):
+    """PDF 파일의 전체 페이지 수"""
+    if not pdf_available:
+        raise RuntimeError("PDF 파일을 읽으려면 PyPDF2 패키지가 필요합니다.")
+    return len(PyPDF2.PdfReader(io.BytesIO(_read_bytes(source))).pages)
+
+
+def iter_pdf_pages(source, start=0, end=None):
+    """
+    PDF 페이지를 하나씩 추출하며 (페이지 번호, 텍스트)를 순서대로 반환하는 제너레이터
+
+    요청한 범위 밖의 페이지와, 소비자가 중간에 멈춘 뒤의 페이지는 파싱하지 않는다.
+
+    Parameters:
+    source: UploadedFile, BytesIO 또는 bytes
+    start (int): 시작 페이지 인덱스 (0부터)
+    end (int, optional): 끝 페이지 인덱스 (포함하지 않음). None이면 마지막 페이지까지
+    """
+    if not pdf_available:
+        raise RuntimeError("PDF 파일을 읽으려면 PyPDF2 패키지가 필요합니다.")
+
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(_read_bytes(source)))
+    num_pages = len(pdf_reader.pages)
+    end = num_pages if end is None else min(end, num_pages)
+    for index in range(start, end):
+        yield index, pdf_reader.pages[index].extract_text() or ""
+
+
+def iter_pdf_pages_parallel(source, start=0, end=None, max_workers=None):
+    """
+    PDF 페이지를 구간별로 병렬 추출하며 (페이지 번호, 텍스트)를 순서대로 반환하는 제너레이터
+
+    범위가 PARALLEL_PAGE_THRESHOLD 이상이면 페이지 구간을 ProcessPoolExecutor에 나누어 맡기고,
+    앞 구간부터 끝나는 대로 페이지를 내보낸다. 소비자가 중간에 멈추면 대기 중인 구간은 취소한다.
+    범위가 작거나 프로세스를 만들 수 없으면 iter_pdf_pages로 한 페이지씩 추출한다.
+
+    Parameters:
+    source: UploadedFile, BytesIO 또는 bytes
+    start (int): 시작 페이지 인덱스 (0부터)
+    end (int, optional): 끝 페이지 인덱스 (포함하지 않음). None이면 마지막 페이지까지
+    max_workers (int, optional): 작업 프로세스 수. None이면 CPU 코어 수, 1이면 병렬 처리 안 함
+    """
+    data = _read_bytes(source)
+    num_pages = count_pdf_pages(data)
+    end = num_pages if end is None else min(end, num_pages)
+    num_workers = max_workers or os.cpu_count() or 1
+    if end - start < PARALLEL_PAGE_THRESHOLD or num_workers < 2:
+        yield from iter_pdf_pages(data, start, end)
+        return
+
+    page_ranges = [
+        (start + range_start, start + range_end)
+        for range_start, range_end in _split_page_ranges(end - start, num_workers * PROGRESS_RANGES_PER_WORKER)
+    ]
+    next_page = start
+    executor = None
+    try:
+        executor = ProcessPoolExecutor(max_workers=min(num_workers, len(page_ranges)))
+        futures = [executor.submit(_extract_page_range, data, range_start, range_end)
+                   for range_start, range_end in page_ranges]
+        # 제출 순서대로 결과를 받아 페이지 순서 유지
+        for future in futures:
+            for page_text in future.result():
+                yield next_page, page_text
+                next_page += 1
+    except (OSError, RuntimeError):
+        # 프로세스 생성이 막힌 환경에서는 남은 페이지를 단일 프로세스로 추출
+        yield from iter_pdf_pages(data, next_page, end)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# WordprocessingML 네임스페이스 태그
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_BODY = W_NS + "body"
+W_P = W_NS + "p"
+W_TBL = W_NS + "tbl"
+W_TR = W_NS + "tr"
+W_TC = W_NS + "tc"
+W_T = W_NS + "t"
+W_TAB = W_NS + "tab"
+W_BR = W_NS + "br"
+W_CR = W_NS + "cr"
+
+
+def _docx_paragraph_text(paragraph):
+    """w:p 요소의 텍스트 (탭·줄바꿈 포함)"""
+    parts = []
+    for node in paragraph.iter():
+        if node.tag == W_T:
+            parts.append(node.text or "")
+        elif node.tag == W_TAB:
+            parts.append("\t")
+        elif node.tag in (W_BR, W_CR):
+            parts.append("\n")
+    return "".join(parts)
+
+
+def _cell_text(paragraph_texts):
+    """셀 안의 여러 단락(중첩 표 포함)을 마크다운 표에 넣을 한 줄로 합침"""
+    text = " ".join(text.strip() for text in paragraph_texts)
+    return " ".join(text.split()).replace("|", "\\|")
+
+
+def _rows_to_markdown(rows):
+    """셀 텍스트 행 리스트를 마크다운 표 문자열로 변환 (첫 행을 머리글로 사용)"""
+    rows = [cells for cells in rows if cells]
+    if not rows:
+        return ""
+
+    width = max(len(cells) for cells in rows)
+    lines = []
+    for index, cells in enumerate(rows):
+        cells = cells + [""] * (width - len(cells))
+        lines.append("| " + " | ".join(cells) + " |")
+        if index == 0:
+            lines.append("|" + " --- |" * width)
+    return "\n".join(lines)
+
+
+def _docx_table_markdown(table):
+    """w:tbl 요소를 마크다운 표 문자열로 변환"""
+    return _rows_to_markdown([
+        [_cell_text(_docx_paragraph_text(p) for p in cell.iter(W_P)) for cell in row.findall(W_TC)]
+        for row in table.findall(W_TR)
+    ])
+
+
+def _blocks_to_text(blocks):
+    """(종류, 텍스트) 블록을 본문 텍스트로 결합 (표 앞뒤에 빈 줄 추가)"""
+    lines = []
+    for kind, text in blocks:
+        if kind == "table":
+            if text:
+                lines.extend(["", text, ""])
+        else:
+            lines.append(text)
+    return "\n".join(lines).strip("\n")
+
+
+def iter_docx_blocks(source):
+    """
+    DOCX 본문을 문서 순서대로 (종류, 텍스트) 형태로 반환하는 제너레이터
+
+    python-docx 객체 모델을 만들지 않고 word/document.xml을 zip에서 바로
+    iterparse로 읽는다. 처리한 본문 요소는 즉시 트리에서 제거하므로
+    문서 크기와 관계없이 메모리 사용량이 일정하게 유지된다.
+
+    Yields:
+    tuple: ("paragraph", 단락 텍스트) 또는 ("table", 마크다운 표)
+    """
+    with zipfile.ZipFile(io.BytesIO(_read_bytes(source))) as archive:
+        with archive.open("word/document.xml") as xml_file:
+            body = None
+            depth = 0
+            for event, element in ET.iterparse(xml_file, events=("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if element.tag == W_BODY:
+                        body = element
+                    continue
+
+                depth -= 1
+                # 본문 바로 아래 요소(단락, 표, 콘텐츠 컨트롤 등)가 닫힐 때만 처리
+                if body is None or depth != 2:
+                    continue
+                if element.tag == W_P:
+                    yield "paragraph", _docx_paragraph_text(element)
+                elif element.tag == W_TBL:
+                    yield "table", _docx_table_markdown(element)
+                else:
+                    for paragraph in element.iter(W_P):
+                        yield "paragraph", _docx_paragraph_text(paragraph)
+                body.remove(element)
+
+
+def extract_text_from_docx(source):
+    """Word 파일에서 텍스트 추출 (표는 마크다운으로 변환하여 본문 순서대로 포함)"""
+    return _blocks_to_text(iter_docx_blocks(source))
+
+
+# HWPX 섹션 파일 이름 패턴 (Contents/section0.xml, section1.xml, ...)
+HWPX_SECTION = re.compile(r"^Contents/section(\d+)\.xml$")
+
+
+def _local_name(tag):
+    """네임스페이스를 제외한 태그 이름 (HWPX는 버전에 따라 네임스페이스가 다름)"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _hwpx_text(text_element):
+    """hp:t 요소의 텍스트 (안쪽 탭·줄바꿈 요소 포함)"""
+    parts = [text_element.text or ""]
+    for child in text_element:
+        name = _local_name(child.tag)
+        if name == "tab":
+            parts.append("\t")
+        elif name == "lineBreak":
+            parts.append("\n")
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def _hwpx_cell_texts(cell):
+    """
+    hp:tc 셀의 단락 텍스트 리스트
+
+    셀 자신의 hp:subList 단락만 읽고, 단락 안의 중첩 표는 한 줄로 펼쳐 넣는다.
+    (중첩 표의 텍스트를 셀 단락 텍스트로 한 번 더 읽지 않음)
+    """
+    texts = []
+    for sub_list in cell:
+        if _local_name(sub_list.tag) != "subList":
+            continue
+        for paragraph in sub_list:
+            if _local_name(paragraph.tag) == "p":
+                texts.extend(text for _, text in _hwpx_paragraph_blocks(paragraph, render_table=_hwpx_table_inline))
+    return texts
+
+
+def _hwpx_table_rows(table, render_cell):
+    """hp:tbl 요소를 행별 셀 값 리스트로 변환 (render_cell: 셀 단락 텍스트 리스트 -> 셀 값)"""
+    return [
+        [render_cell(_hwpx_cell_texts(cell)) for cell in row if _local_name(cell.tag) == "tc"]
+        for row in table if _local_name(row.tag) == "tr"
+    ]
+
+
+def _hwpx_table_markdown(table):
+    """hp:tbl 요소를 마크다운 표 문자열로 변환"""
+    return _rows_to_markdown(_hwpx_table_rows(table, _cell_text))
+
+
+def _hwpx_table_inline(table):
+    """셀 안의 중첩 표를 한 줄 텍스트로 펼침 ([칸 / 칸; 칸 / 칸] 형태)"""
+    rows = _hwpx_table_rows(table, lambda texts: " ".join(" ".join(texts).split()))
+    rows = [" / ".join(cells) for cells in rows if any(cells)]
+    return "[" + "; ".join(rows) + "]" if rows else ""
+
+
+def _hwpx_paragraph_blocks(paragraph, render_table=_hwpx_table_markdown):
+    """본문 단락을 (종류, 텍스트) 블록으로 분해 (단락 안에 끼어 있는 표를 render_table로 변환해 순서대로 분리)"""
+    blocks = []
+    parts = []
+
+    def walk(node):
+        name = _local_name(node.tag)
+        if name == "tbl":
+            if "".join(parts).strip():
+                blocks.append(("paragraph", "".join(parts)))
+            parts.clear()
+            blocks.append(("table", render_table(node)))
+        elif name == "t":
+            parts.append(_hwpx_text(node))
+        else:
+            for child in node:
+                walk(child)
+
+    walk(paragraph)
+    if parts or not blocks:
+        blocks.append(("paragraph", "".join(parts)))
+    return blocks
+
+
+def iter_hwpx_blocks(source):
+    """
+    HWPX(한글) 본문을 문서 순서대로 (종류, 텍스트) 형태로 반환하는 제너레이터
+
+    zip 컨테이너의 Contents/sectionN.xml을 순서대로 iterparse로 읽고,
+    처리한 최상위 단락은 즉시 트리에서 제거하여 메모리 사용량을 일정하게 유지한다.
+
+    Yields:
+    tuple: ("paragraph", 단락 텍스트) 또는 ("table", 마크다운 표)
+    """
+    with zipfile.ZipFile(io.BytesIO(_read_bytes(source))) as archive:
+        sections = sorted(
+            (int(match.group(1)), name)
+            for name in archive.namelist()
+            for match in [HWPX_SECTION.match(name)] if match
+        )
+        if not sections:
+            raise ValueError("HWPX 파일에서 본문 섹션을 찾을 수 없습니다.")
+
+        for _, section_name in sections:
+            with archive.open(section_name) as xml_file:
+                root = None
+                depth = 0
+                for event, element in ET.iterparse(xml_file, events=("start", "end")):
+                    if event == "start":
+                        depth += 1
+                        if root is None:
+                            root = element
+                        continue
+
+                    depth -= 1
+                    # 섹션 바로 아래 단락이 닫힐 때만 처리
+                    if depth != 1:
+                        continue
+                    if _local_name(element.tag) == "p":
+                        yield from _hwpx_paragraph_blocks(element)
+                    root.remove(element)
+
+
+def extract_text_from_hwpx(source):
+    """한글(HWPX) 파일에서 텍스트 추출 (표는 마크다운으로 변환하여 본문 순서대로 포함)"""
+    return _blocks_to_text(iter_hwpx_blocks(source))
+
+
+def extract_text_from_txt(source, encoding="utf-8"):
+    """텍스트 파일에서 텍스트 추출"""
+    return _read_bytes(source).decode(encoding)
+
+
+# 확장자별 추출 함수 매핑
+EXTRACTORS = {
+    "pdf": extract_text_from_pdf,
+    "docx": extract_text_from_docx,
+    "hwpx": extract_text_from_hwpx,
+    "txt": extract_text_from_txt,
+}
+
+
+# 줄 폭에서 강제로 줄바꿈되어 끊긴 줄을 다시 이어야 하는 형식 (DOCX/HWPX는 문단 단위라 제외)
+HARD_WRAP_EXTENSIONS = {"pdf", "txt"}
+
+
+def get_extension(filename):
+    """파일 이름에서 소문자 확장자 추출 (점 제외)"""
+    return os.path.splitext(filename)[1].lower().lstrip(".")
+
+
+class ExtractionCache:
+    """
+    추출 결과 캐시 클래스
+    업로드 바이트의 SHA-256 해시를 키로 메모리(LRU)와 선택적 디스크에 텍스트를 보관
+    """
+    def __init__(self, max_entries=32, cache_dir=None):
+        """
+        추출 캐시 초기화
+
+        Parameters:
+        max_entries (int): 메모리에 보관할 최대 문서 수
+        cache_dir (str, optional): 디스크 캐시 폴더 경로. None이면 메모리만 사용
+        """
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(data, extension, page_range=None):
+        """파일 바이트와 확장자(및 페이지 범위)로 캐시 키 생성"""
+        digest = hashlib.sha256(data).hexdigest()
+        if page_range:
+            return f"{digest}_p{page_range[0]}-{page_range[1]}.{extension}"
+        return f"{digest}.{extension}"
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, key + ".txt")
+
+    def get(self, key):
+        """캐시된 텍스트 조회 (없으면 None)"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        if self.cache_dir:
+            try:
+                with open(self._disk_path(key), "r", encoding="utf-8") as file:
+                    text = file.read()
+            except OSError:
+                return None
+            # 디스크에서 찾은 항목은 메모리 캐시로 승격
+            self._remember(key, text)
+            return text
+        return None
+
+    def put(self, key, text):
+        """추출 텍스트를 캐시에 저장"""
+        self._remember(key, text)
+        if self.cache_dir:
+            try:
+                with open(self._disk_path(key), "w", encoding="utf-8") as file:
+                    file.write(text)
+            except OSError as e:
+                print(f"추출 캐시 저장 오류: {e}")
+
+    def _remember(self, key, text):
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """메모리 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+
+# 프로세스 전체에서 공유하는 추출 캐시 (EXTRACTION_CACHE_DIR 설정 시 디스크 캐시 사용)
+extraction_cache = ExtractionCache(cache_dir=os.getenv("EXTRACTION_CACHE_DIR") or None)
+
+
+def extract_pages(uploaded_file, filename=None, use_cache=True):
+    """
+    업로드된 문서에서 페이지별 텍스트 리스트 추출
+
+    같은 파일을 여러 도구에서 반복 업로드해도 다시 추출하지 않도록
+    파일 내용의 SHA-256 해시로 결과를 캐시한다.
+    PDF가 아닌 문서는 전체를 한 페이지로 취급한다.
+
+    Parameters:
+    uploaded_file: Streamlit UploadedFile, BytesIO 또는 bytes
+    filename (str, optional): 확장자 판별용 파일 이름. 없으면 uploaded_file.name 사용
+    use_cache (bool): 추출 캐시 사용 여부
+
+    Returns:
+    list: 페이지별 텍스트 리스트
+    """
+    name = filename or getattr(uploaded_file, "name", "")
+    extension = get_extension(name)
+    extractor = EXTRACTORS.get(extension)
+    if extractor is None:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {extension or name}")
+
+    data = _read_bytes(uploaded_file)
+    key = ExtractionCache.make_key(data, extension)
+    if use_cache:
+        cached = extraction_cache.get(key)
+        if cached is not None:
+            return cached.split(PAGE_BREAK)
+
+    pages = extract_pdf_pages(data) if extension == "pdf" else [extractor(data)]
+    if use_cache:
+        extraction_cache.put(key, PAGE_BREAK.join(pages))
+    return pages
+
+
+def extract_text(uploaded_file, filename=None, use_cache=True, separator="\n\n"):
+    """
+    업로드된 문서에서 텍스트 추출
+
+    Parameters:
+    uploaded_file: Streamlit UploadedFile, BytesIO 또는 bytes
+    filename (str, optional): 확장자 판별용 파일 이름. 없으면 uploaded_file.name 사용
+    use_cache (bool): 추출 캐시 사용 여부
+    separator (str): 페이지 사이 구분 문자열
+
+    Returns:
+    str: 추출된 텍스트
+    """
+    return separator.join(extract_pages(uploaded_file, filename, use_cache))
+
+
+def _finish_pages(pages, normalize, separator, join_lines=True):
+    """페이지 리스트를 최종 텍스트로 변환 (정리 옵션 시 절감 토큰 안내 표시)"""
+    if not normalize:
+        return separator.join(pages)
+
+    import streamlit as st
+
+    text, stats = text_normalizer.normalize_pages(pages, join_lines)
+    st.caption(text_normalizer.format_stats(stats))
+    return text
+
+
+def extract_text_with_progress(uploaded_file, key, preview_pages=2, separator="\n\n", normalize=False):
+    """
+    업로드 문서를 페이지 단위로 추출하면서 진행률과 앞부분 미리보기를 표시하는 Streamlit UI
+
+    PDF는 페이지 범위를 선택할 수 있고, 페이지가 많으면 구간별로 병렬 추출하며 진행률을 표시한다.
+    추출 중 '추출 중지'를 누르면 그때까지 추출된 페이지만 사용한다. 그 외 형식은 extract_pages와 동일하게 처리한다.
+
+    Parameters:
+    uploaded_file: Streamlit UploadedFile
+    key (str): 위젯 및 세션 상태 키 접두어 (도구별로 구분)
+    preview_pages (int): 추출 중 미리 보여줄 앞 페이지 수
+    separator (str): 페이지 사이 구분 문자열
+    normalize (bool): 프롬프트용 텍스트 정리(text_normalizer) 적용 여부
+
+    Returns:
+    str: 추출된 텍스트
+    """
+    # 프로세스 풀 작업자가 streamlit을 불러오지 않도록 함수 안에서 import
+    import streamlit as st
+
+    extension = get_extension(uploaded_file.name)
+    if extension != "pdf":
+        return _finish_pages(extract_pages(uploaded_file), normalize, separator,
+                             join_lines=extension in HARD_WRAP_EXTENSIONS)
+
+    data = _read_bytes(uploaded_file)
+    total_pages = count_pdf_pages(data)
+    if total_pages == 0:
+        return ""
+
+    # 페이지 범위 선택
+    col1, col2 = st.columns(2)
+    with col1:
+        start_page = st.number_input("시작 페이지", min_value=1, max_value=total_pages, value=1, key=f"{key}_start")
+    with col2:
+        end_page = st.number_input("끝 페이지", min_value=int(start_page), max_value=total_pages,
+                                   value=total_pages, key=f"{key}_end")
+    start, end = int(start_page) - 1, int(end_page)
+
+    # 전체 범위는 다른 도구의 extract_pages와 같은 캐시 키를 사용
+    page_range = None if (start, end) == (0, total_pages) else (start, end)
+    cache_key = ExtractionCache.make_key(data, extension, page_range)
+    cached = extraction_cache.get(cache_key)
+    if cached is not None:
+        return _finish_pages(cached.split(PAGE_BREAK), normalize, separator)
+
+    # 추출 중지로 멈춘 결과가 있으면 그대로 사용
+    state_key = f"{key}_partial"
+    partial = st.session_state.get(state_key)
+    if partial and partial["cache_key"] == cache_key:
+        if partial["stopped"] or st.button("추출 중지", key=f"{key}_stop"):
+            partial["stopped"] = True
+            st.info(f"{len(partial['pages'])}/{end - start} 페이지까지만 추출했습니다. 페이지 범위를 바꾸면 다시 추출합니다.")
+            return _finish_pages(partial["pages"], normalize, separator)
+    else:
+        st.button("추출 중지", key=f"{key}_stop")
+
+    # 세션 상태에 진행 중인 페이지를 모아 두어 중지 시에도 결과 보존
+    partial = {"cache_key": cache_key, "pages": [], "stopped": False}
+    st.session_state[state_key] = partial
+
+    progress_bar = st.progress(0.0)
+    preview = st.empty()
+    page_count = end - start
+    for page_number, page_text in iter_pdf_pages_parallel(data, start, end):
+        partial["pages"].append(page_text)
+        done = len(partial["pages"])
+        progress_bar.progress(done / page_count, text=f"{page_number + 1}페이지 추출 중... ({done}/{page_count})")
+        if done <= preview_pages:
+            preview.text(separator.join(partial["pages"])[:1000])
+    progress_bar.empty()
+    preview.empty()
+
+    pages = partial["pages"]
+    extraction_cache.put(cache_key, PAGE_BREAK.join(pages))
+    del st.session_state[state_key]
+    return _finish_pages(pages, normalize, separator)
@@ -1,21 +1,32 @@
 import streamlit as st
 import io
-import tempfile
 import os
+import copy
 import json
+import hashlib
+import struct
+import zlib
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
-from pptx.enum.shapes import MSO_SHAPE
-import PyPDF2
-import docx
+from pptx.enum.shapes import MSO_SHAPE, PP_PLACEHOLDER
+from pptx.oxml.ns import qn
+from pptx.oxml.shapes.picture import CT_Picture
+from lxml import etree
 import re
 import time
 import openai
 from openai import OpenAI
 import google.generativeai as genai
 from dotenv import load_dotenv
+from document_extractor import extract_text_with_progress
+from text_normalizer import OUTLINE_PATTERNS
+from ppt_text_fit import fit_slide, fit_slides
+from ppt_thumbnail import thumbnails_available, thumbnail_cache
 
 # API 키 로드
 load_dotenv()
@@ -365,41 +376,6 @@ ENHANCED_TEMPLATES = {
     }
 }
 
-# 기본 데이터 처리 및 추출 함수
-def extract_text_from_pdf(pdf_file):
-    """PDF 파일에서 텍스트 추출"""
-    text = ""
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-        temp_file.write(pdf_file.read())
-        temp_path = temp_file.name
-    
-    try:
-        with open(temp_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n\n"
-    finally:
-        os.unlink(temp_path)
-    
-    return text
-
-def extract_text_from_docx(docx_file):
-    """Word 파일에서 텍스트 추출"""
-    text = ""
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as temp_file:
-        temp_file.write(docx_file.read())
-        temp_path = temp_file.name
-    
-    try:
-        doc = docx.Document(temp_path)
-        for para in doc.paragraphs:
-            text += para.text + "\n"
-    finally:
-        os.unlink(temp_path)
-    
-    return text
-
 # AI 기반 슬라이드 분석 및 생성 관련 함수들
 
 def enhance_with_openai(text, num_slides, api_key, temperature=0.7):
@@ -795,67 +771,246 @@ def fallback_parse_document(text, min_slides=5):
     
     return slides
 
+# 기호로 시작하는 수준 (슬라이드에서는 기호를 떼고 불릿으로 표시)
+SYMBOL_LEVELS = {2, 5, 8}
+
+# 문장이 끝난 줄로 보는 끝 글자 (이어지는 줄 병합 판단용)
+SENTENCE_END = re.compile(r"[.!?:다음함됨임]$")
+
+
+def classify_outline_line(line):
+    """줄의 번호 체계 수준과 표시할 텍스트 (번호가 없으면 수준 None)"""
+    for level, pattern in OUTLINE_PATTERNS:
+        match = pattern.match(line)
+        if match:
+            return level, match.group(1).strip() if level in SYMBOL_LEVELS else line
+    return None, line
+
+
+def parse_outline_to_slides(text):
+    """
+    AI 없이 문서의 번호 체계를 슬라이드 구조로 바로 변환 (빠른 초안 모드)
+
+    각 줄을 한 번만 분류한 뒤, 문서에 나타난 가장 상위 번호 수준을 슬라이드 제목으로,
+    그 아래 항목을 불릿으로 사용한다. 번호 체계가 없으면 fallback_parse_document를 사용한다.
+
+    Parameters:
+    text (str): 문서 텍스트
+
+    Returns:
+    list: 슬라이드 dict 리스트 (첫 슬라이드는 제목 슬라이드)
+    """
+    lines = []
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line:
+            lines.append(classify_outline_line(line))
+
+    levels = [level for level, _ in lines if level is not None]
+    if not levels:
+        return fallback_parse_document(text)
+
+    # 두 번 이상 나온 가장 상위 수준을 슬라이드 구분으로 사용
+    counts = {}
+    for level in levels:
+        counts[level] = counts.get(level, 0) + 1
+    repeated = [level for level, count in counts.items() if count >= 2]
+    slide_level = min(repeated) if repeated else min(levels)
+
+    preamble = []
+    sections = []
+    for level, line in lines:
+        if level is not None and level <= slide_level:
+            sections.append({"title": line, "content": []})
+        elif not sections:
+            preamble.append(line)
+        elif level is None and sections[-1]["content"] and not SENTENCE_END.search(sections[-1]["content"][-1]):
+            # 번호 없는 줄은 앞 항목이 끝나지 않았으면 이어 붙임
+            sections[-1]["content"][-1] += " " + line
+        else:
+            sections[-1]["content"].append(line)
+
+    # 제목 슬라이드: 앞부분의 첫 줄을 제목, 다음 짧은 줄을 부제목으로 사용
+    title = "프레젠테이션"
+    if preamble and len(preamble[0]) <= 60:
+        title = preamble.pop(0)
+    subtitle = "빠른 초안"
+    if preamble and len(preamble[0]) <= 40:
+        subtitle = preamble.pop(0)
+
+    slides = [{"title": title, "content": [subtitle]}]
+    if preamble:
+        slides.append({"title": "개요", "content": preamble})
+    slides.extend(sections)
+    return slides
+
+
+def slides_to_outline_text(slides):
+    """슬라이드 구조를 AI에 다시 보낼 수 있는 개요 텍스트로 변환"""
+    parts = []
+    for slide in slides:
+        parts.append(f"# {slide['title']}")
+        content = slide.get("content", [])
+        for point in content if isinstance(content, list) else [content]:
+            parts.append(f"- {point}")
+    return "\n".join(parts)
+
 # PPT 생성 및 스타일링 함수들
 
-def apply_background(slide, template):
-    """슬라이드 배경 스타일 적용"""
-    # 템플릿 정보에서 필요한 값 추출
-    colors = template["colors"]
-    bg_color = colors["bg_color"]
-    background_style = template["settings"].get("background_style", "solid")
-    
-    # 배경색 설정 (기본)
-    slide.background.fill.solid()
-    slide.background.fill.fore_color.rgb = RGBColor(*bg_color)
-    
-    # 그라데이션 배경
-    if background_style == "gradient" and template["settings"].get("gradient_stops"):
-        # 참고: python-pptx는 현재 그라데이션 배경을 직접 지원하지 않음
-        # 그라데이션 배경을 적용하려면 CustomXML 조작이 필요함
-        # 여기서는 단색으로 대체하고 실제 구현은 라이브러리의 향후 버전이나 확장 메서드가 필요
-        pass
-    
-    # 패턴 배경
-    elif background_style == "pattern" and template["settings"].get("pattern_style"):
-        # 참고: 패턴 배경도 직접 지원하지 않음
-        # 이것도 단색으로 대체
-        pass
-    
-    # 이미지 배경
-    elif background_style == "image" and template["settings"].get("background_image"):
-        # 이미지 배경 적용 로직
-        pass
-
-def apply_text_style(text_frame, color, font_name, font_size, bold=False, italic=False, alignment=PP_ALIGN.LEFT):
-    """텍스트 프레임에 스타일 적용"""
-    if isinstance(text_frame, object) and hasattr(text_frame, 'paragraphs'):
-        # 텍스트 프레임에 적용
-        for paragraph in text_frame.paragraphs:
-            paragraph.alignment = alignment
-            for run in paragraph.runs:
-                run.font.color.rgb = RGBColor(*color)
-                run.font.name = font_name
-                run.font.size = font_size
-                run.font.bold = bold
-                run.font.italic = italic
+# 템플릿 이름별로 스타일을 반영해 둔 기본 .pptx 바이트 (프로세스당 한 번만 생성)
+_compiled_templates = {}
+
+# 레이아웃에 배치한 슬라이드 번호 텍스트 상자 이름 (전체 슬라이드 수를 덱마다 기록)
+SLIDE_NUMBER_SHAPE = "Slide Number Total"
+
+# 단락 속성(a:pPr)에서 불릿 관련 요소 태그
+_BULLET_TAGS = {qn("a:buClrTx"), qn("a:buClr"), qn("a:buSzTx"), qn("a:buFontTx"), qn("a:buFont"),
+                qn("a:buNone"), qn("a:buAutoNum"), qn("a:buChar"), qn("a:buBlip")}
+
+
+def _rgb_hex(color):
+    """(R, G, B) 튜플을 XML용 16진수 문자열로 변환"""
+    return "%02X%02X%02X" % tuple(color)
+
+
+def _get_level1_style(placeholder):
+    """레이아웃 자리표시자의 a:lstStyle/a:lvl1pPr 요소 (없으면 생성)"""
+    lst_style = placeholder._element.txBody.find(qn("a:lstStyle"))
+    lvl1 = lst_style.find(qn("a:lvl1pPr"))
+    if lvl1 is None:
+        lvl1 = etree.Element(qn("a:lvl1pPr"))
+        def_ppr = lst_style.find(qn("a:defPPr"))
+        lst_style.insert(1 if def_ppr is not None else 0, lvl1)
+    return lvl1
+
+
+def _set_level_style(ppr, font, color, alignment, bullet=None):
+    """
+    단락 수준 스타일(a:lvl1pPr)에 폰트·색상·정렬·불릿을 기록
+
+    Parameters:
+    ppr: a:lvl1pPr 요소
+    font (dict): 템플릿 폰트 정보 (name, size, bold, italic)
+    color (tuple): 텍스트 색상 (R, G, B)
+    alignment: PP_ALIGN 값
+    bullet (tuple, optional): (불릿 문자, 불릿 색상). None이면 불릿 없음
+    """
+    ppr.set("algn", PP_ALIGN.to_xml(alignment))
+
+    # 기존 불릿 설정 제거 후 새 불릿 설정 삽입 (스키마 순서: 불릿 -> tabLst -> defRPr)
+    for child in list(ppr):
+        if child.tag in _BULLET_TAGS:
+            ppr.remove(child)
+    insert_at = len(ppr)
+    for index, child in enumerate(ppr):
+        if child.tag in (qn("a:tabLst"), qn("a:defRPr"), qn("a:extLst")):
+            insert_at = index
+            break
+    if bullet:
+        bullet_char, bullet_color = bullet
+        bu_clr = etree.Element(qn("a:buClr"))
+        etree.SubElement(bu_clr, qn("a:srgbClr")).set("val", _rgb_hex(bullet_color))
+        bu_char = etree.Element(qn("a:buChar"))
+        bu_char.set("char", bullet_char)
+        ppr.insert(insert_at, bu_clr)
+        ppr.insert(insert_at + 1, bu_char)
     else:
-        # 단일 단락에 적용
-        text_frame.alignment = alignment
-        for run in text_frame.runs:
-            run.font.color.rgb = RGBColor(*color)
-            run.font.name = font_name
-            run.font.size = font_size
-            run.font.bold = bold
-            run.font.italic = italic
-
-def customize_bullet(paragraph, bullet_style, bullet_color):
-    """불릿 스타일 커스터마이징"""
-    # 불릿 스타일은 현재 python-pptx에서 직접 지원하지 않음
-    # 기본 불릿만 설정하고 스타일 변경은 지원하지 않음
+        ppr.insert(insert_at, etree.Element(qn("a:buNone")))
+
+    # 기본 글자 속성 (a:ln 외 자식은 새로 구성)
+    def_rpr = ppr.find(qn("a:defRPr"))
+    if def_rpr is None:
+        def_rpr = etree.Element(qn("a:defRPr"))
+        ext_lst = ppr.find(qn("a:extLst"))
+        if ext_lst is not None:
+            ext_lst.addprevious(def_rpr)
+        else:
+            ppr.append(def_rpr)
+    def_rpr.set("sz", str(int(font["size"].pt * 100)))
+    def_rpr.set("b", "1" if font.get("bold") else "0")
+    def_rpr.set("i", "1" if font.get("italic") else "0")
+    for child in list(def_rpr):
+        if child.tag != qn("a:ln"):
+            def_rpr.remove(child)
+    fill = etree.SubElement(def_rpr, qn("a:solidFill"))
+    etree.SubElement(fill, qn("a:srgbClr")).set("val", _rgb_hex(color))
+    # 한글이 동아시아 글꼴(ea)로 표시되므로 latin과 ea를 함께 지정
+    etree.SubElement(def_rpr, qn("a:latin")).set("typeface", font["name"])
+    etree.SubElement(def_rpr, qn("a:ea")).set("typeface", font["name"])
+
+
+def compile_template(template_name):
+    """
+    템플릿 스타일을 슬라이드 마스터와 레이아웃 자리표시자에 미리 반영한 .pptx 바이트 반환
+
+    배경색, 제목/부제목/본문 폰트·색상·정렬과 불릿을 레이아웃에 기록해 두므로
+    생성되는 슬라이드는 텍스트만 넣으면 서식을 상속받는다. 결과는 템플릿별로 캐시된다.
+
+    Parameters:
+    template_name (str): ENHANCED_TEMPLATES 템플릿 이름 (없으면 기본 템플릿)
+
+    Returns:
+    bytes: 스타일이 반영된 빈 프레젠테이션 파일 바이트
+    """
+    if template_name not in ENHANCED_TEMPLATES:
+        template_name = "기본 템플릿"
+    if template_name in _compiled_templates:
+        return _compiled_templates[template_name]
+
+    template = ENHANCED_TEMPLATES[template_name]
+    colors = template["colors"]
+    fonts = template["fonts"]
+    styles = template["styles"]
+
+    prs = Presentation()
+
+    # 배경은 슬라이드 마스터에 한 번만 지정 (그라데이션·패턴은 python-pptx 미지원으로 단색 사용)
+    prs.slide_master.background.fill.solid()
+    prs.slide_master.background.fill.fore_color.rgb = RGBColor(*colors["bg_color"])
+
+    title_slide_layout = prs.slide_layouts[0]  # 제목 슬라이드
+    content_slide_layout = prs.slide_layouts[1]  # 제목 및 내용 슬라이드
+    for layout in (title_slide_layout, content_slide_layout):
+        for placeholder in layout.placeholders:
+            ph_type = placeholder.placeholder_format.type
+            if ph_type in (PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE):
+                _set_level_style(_get_level1_style(placeholder), fonts["title_font"],
+                                 colors["title_color"], styles["title_align"])
+            elif placeholder.placeholder_format.idx != 1:
+                continue
+            elif layout is title_slide_layout:
+                _set_level_style(_get_level1_style(placeholder), fonts["subtitle_font"],
+                                 colors["accent_color"], styles["title_align"])
+            else:
+                _set_level_style(_get_level1_style(placeholder), fonts["body_font"],
+                                 colors["text_color"], styles["body_align"],
+                                 bullet=(styles.get("bullet_style", "•"), colors["bullet_color"]))
+
+    # 푸터·슬라이드 번호·로고·액센트 라인은 레이아웃에 한 번만 배치하여 모든 슬라이드가 공유
+    settings = template["settings"]
+    decorated_layouts = [content_slide_layout]
+    if settings.get("footer_on_title", False):  # 첫 슬라이드에는 보통 푸터를 넣지 않음 (설정 가능)
+        decorated_layouts.append(title_slide_layout)
+    for layout in decorated_layouts:
+        scratch_slide = _new_scratch_slide()
+        add_footer(scratch_slide, settings.get("footer_text", "© 2025 남양주시"),
+                   colors["footer_color"], fonts["footer_font"])
+        if styles.get("slide_number", True):
+            add_slide_number_field(scratch_slide, colors["footer_color"], fonts["footer_font"])
+        _move_shapes_to_layout(scratch_slide, layout)
+        if settings.get("include_logo", False) and settings.get("logo_path"):
+            add_logo(layout, settings["logo_path"])
     
-    # 불릿 활성화
-    if hasattr(paragraph, '_p') and hasattr(paragraph._p, 'get_or_add_pPr'):
-        paragraph._p.get_or_add_pPr().set('bullet', '1')
+    # 제목 슬라이드 액센트 라인 (미니멀리즘 템플릿 등에서 사용)
+    if settings.get("accent_line", False):
+        scratch_slide = _new_scratch_slide()
+        add_accent_line(scratch_slide, colors["accent_color"], width=Inches(2), height=Inches(0.05))
+        _move_shapes_to_layout(scratch_slide, title_slide_layout)
+
+    output = io.BytesIO()
+    prs.save(output)
+    _compiled_templates[template_name] = output.getvalue()
+    return _compiled_templates[template_name]
 
 def add_footer(slide, footer_text, footer_color, footer_font):
     """슬라이드에 푸터 추가"""
@@ -900,20 +1055,57 @@ def add_slide_number(slide, current_number, total_slides, footer_color, footer_f
         run.font.size = footer_font["size"]
         run.font.color.rgb = RGBColor(*footer_color)
 
-def add_logo(slide, logo_path):
-    """슬라이드에 로고 추가"""
+def add_slide_number_field(slide, footer_color, footer_font):
+    """현재 번호를 슬라이드 번호 필드로 표시하는 '번호/전체' 텍스트 상자 추가 (레이아웃 배치용)"""
+    add_slide_number(slide, "‹#›", 0, footer_color, footer_font)
+    number_shape = slide.shapes[-1]
+    number_shape.name = SLIDE_NUMBER_SHAPE
+    
+    # 첫 런을 복제해 슬라이드 번호 필드로 바꾸고, 원래 런에는 '/전체'만 남김
+    run = number_shape.text_frame.paragraphs[-1].runs[0]
+    field = copy.deepcopy(run._r)
+    field.tag = qn("a:fld")
+    field.set("id", "{B6F15528-21DE-4FAA-801E-634DDDAF4B2B}")
+    field.set("type", "slidenum")
+    field.find(qn("a:t")).text = "‹#›"
+    run._r.addprevious(field)
+    run.text = "/0"
+
+def set_slide_number_total(layout, total_slides):
+    """레이아웃의 슬라이드 번호 상자에 전체 슬라이드 수 기록"""
+    for shape in layout.shapes:
+        if shape.name == SLIDE_NUMBER_SHAPE:
+            shape.text_frame.paragraphs[-1].runs[-1].text = f"/{total_slides}"
+
+def add_logo(layout, logo_path):
+    """레이아웃에 로고 추가 (레이아웃을 쓰는 모든 슬라이드가 같은 이미지 파트를 공유)"""
     # 이미지 파일이 존재하는지 확인
     if not os.path.exists(logo_path):
         return
     
-    # 로고 이미지 추가
+    # 로고 이미지 위치
     left = Inches(9.0)
     top = Inches(0.3)
     width = Inches(0.8)
     height = Inches(0.4)
     
-    # 이미지 추가 (실제 크기 비율 유지)
-    slide.shapes.add_picture(logo_path, left, top, width, height)
+    # 이미지 파트는 패키지 안에서 한 번만 추가되고 관계 ID로 참조됨
+    image_part, rId = layout.part.get_or_add_image_part(logo_path)
+    picture = CT_Picture.new_pic(layout.shapes._next_shape_id, "Logo", "", rId, left, top, width, height)
+    layout.shapes._spTree.insert_element_before(picture, "p:extLst")
+
+def _new_scratch_slide():
+    """레이아웃에 옮길 도형을 만들기 위한 임시 슬라이드 (레이아웃은 도형 추가 API가 없음)"""
+    scratch = Presentation()
+    return scratch.slides.add_slide(scratch.slide_layouts[6])
+
+def _move_shapes_to_layout(scratch_slide, layout):
+    """임시 슬라이드의 도형을 레이아웃으로 옮김 (도형 ID는 레이아웃 기준으로 재부여)"""
+    sp_tree = layout.shapes._spTree
+    for shape in list(scratch_slide.shapes):
+        element = shape._element
+        element.find(".//" + qn("p:cNvPr")).set("id", str(layout.shapes._next_shape_id))
+        sp_tree.insert_element_before(element, "p:extLst")
 
 def add_accent_line(slide, color, width=Inches(2), height=Inches(0.05)):
     """상단 액센트 라인 추가 (미니멀 디자인 등에서 사용)"""
@@ -927,160 +1119,53 @@ def add_accent_line(slide, color, width=Inches(2), height=Inches(0.05)):
     line_shape.fill.fore_color.rgb = RGBColor(*color)
     line_shape.line.fill.background()  # 테두리 없음
 
-def create_enhanced_ppt(slides, template_name="기본 템플릿"):
-    """향상된 PPT 템플릿으로 생성"""
-    prs = Presentation()
-    
-    # 선택한 템플릿 정보
-    template = ENHANCED_TEMPLATES.get(template_name, ENHANCED_TEMPLATES["기본 템플릿"])
+def fill_slide(slide, slide_data, is_title=False):
+    """슬라이드 자리표시자에 제목과 내용 채우기 (기존 텍스트는 교체)"""
+    content = slide_data.get("content", [])
+    points = content if isinstance(content, list) else [str(content)]
     
-    # 색상 정보 추출
-    colors = template["colors"]
-    bg_color = colors["bg_color"]
-    title_color = colors["title_color"]
-    text_color = colors["text_color"]
-    accent_color = colors["accent_color"]
-    bullet_color = colors["bullet_color"]
-    footer_color = colors["footer_color"]
+    if is_title:
+        # 제목과 부제목 설정
+        slide.shapes.title.text = slide_data.get("title", "프레젠테이션")
+        slide.placeholders[1].text = str(points[0]) if points else ""
+        return
     
-    # 폰트 정보 추출
-    fonts = template["fonts"]
-    title_font = fonts["title_font"]
-    subtitle_font = fonts["subtitle_font"]
-    body_font = fonts["body_font"]
-    footer_font = fonts["footer_font"]
+    # 제목 설정
+    slide.shapes.title.text = slide_data.get("title", "슬라이드")
     
-    # 스타일 정보 추출
-    styles = template["styles"]
-    title_align = styles["title_align"]
-    body_align = styles["body_align"]
-    margins = styles.get("margins", {})
-    bullet_style = styles.get("bullet_style", "•")
-    slide_number = styles.get("slide_number", True)
+    # 내용 설정 (첫 단락부터 채움)
+    tf = slide.placeholders[1].text_frame
+    tf.clear()
+    for idx, point in enumerate(points):
+        p = tf.paragraphs[0] if idx == 0 else tf.add_paragraph()
+        p.text = str(point)
+        # 텍스트 맞춤으로 줄인 글자 크기는 해당 슬라이드에만 지정
+        if "font_size" in slide_data:
+            for run in p.runs:
+                run.font.size = Pt(slide_data["font_size"])
+
+def create_enhanced_ppt(slides, template_name="기본 템플릿", fit_text=True):
+    """향상된 PPT 템플릿으로 생성 (서식·배경·푸터·로고는 compile_template의 레이아웃에서 상속)"""
+    # 본문이 넘치는 슬라이드는 글자 크기를 줄이거나 (계속) 슬라이드로 나눔
+    if fit_text:
+        template = ENHANCED_TEMPLATES.get(template_name, ENHANCED_TEMPLATES["기본 템플릿"])
+        slides = fit_slides(slides, template["fonts"]["body_font"])
     
-    # 기타 설정 추출
-    settings = template["settings"]
-    footer_text = settings.get("footer_text", "© 2025 남양주시")
-    include_logo = settings.get("include_logo", False)
-    background_style = settings.get("background_style", "solid")
+    # 템플릿별로 캐시된 기본 덱 바이트에서 복제
+    prs = Presentation(io.BytesIO(compile_template(template_name)))
     
     # 슬라이드 레이아웃 가져오기
     title_slide_layout = prs.slide_layouts[0]  # 제목 슬라이드
     content_slide_layout = prs.slide_layouts[1]  # 제목 및 내용 슬라이드
     
-    # 슬라이드 생성
+    # 슬라이드 번호의 전체 수는 덱마다 레이아웃에 한 번만 기록
+    for layout in (title_slide_layout, content_slide_layout):
+        set_slide_number_total(layout, len(slides))
+    
+    # 슬라이드 생성 (첫 번째 슬라이드는 제목 슬라이드)
     for i, slide_data in enumerate(slides):
-        if i == 0:  # 첫 번째 슬라이드는 제목 슬라이드로 생성
-            slide = prs.slides.add_slide(title_slide_layout)
-            
-            # 배경 스타일 적용
-            apply_background(slide, template)
-            
-            # 제목 설정
-            title = slide.shapes.title
-            title.text = slide_data.get("title", "프레젠테이션")
-            
-            # 제목 텍스트 스타일 적용
-            apply_text_style(title.text_frame, 
-                            color=title_color,
-                            font_name=title_font["name"],
-                            font_size=title_font["size"],
-                            bold=title_font["bold"],
-                            italic=title_font["italic"],
-                            alignment=title_align)
-            
-            # 부제목 설정
-            if "content" in slide_data and slide_data["content"]:
-                subtitle = slide.placeholders[1]
-                if isinstance(slide_data["content"], list):
-                    subtitle.text = slide_data["content"][0]
-                else:
-                    subtitle.text = str(slide_data["content"])
-                
-                # 부제목 텍스트 스타일 적용
-                apply_text_style(subtitle.text_frame, 
-                                color=accent_color,
-                                font_name=subtitle_font["name"],
-                                font_size=subtitle_font["size"],
-                                bold=subtitle_font["bold"],
-                                italic=subtitle_font["italic"],
-                                alignment=title_align)
-            
-            # 제목 슬라이드에 액센트 라인 추가 (미니멀리즘 템플릿 등에서 사용)
-            if settings.get("accent_line", False):
-                add_accent_line(slide, accent_color, width=Inches(2), height=Inches(0.05))
-            
-        else:
-            # 내용 슬라이드 생성
-            slide = prs.slides.add_slide(content_slide_layout)
-            
-            # 배경 스타일 적용
-            apply_background(slide, template)
-            
-            # 제목 설정
-            title = slide.shapes.title
-            title.text = slide_data.get("title", "슬라이드")
-            
-            # 제목 텍스트 스타일 적용
-            apply_text_style(title.text_frame, 
-                            color=title_color,
-                            font_name=title_font["name"],
-                            font_size=title_font["size"],
-                            bold=title_font["bold"],
-                            italic=title_font["italic"],
-                            alignment=title_align)
-            
-            # 내용 설정
-            content_placeholder = slide.placeholders[1]
-            tf = content_placeholder.text_frame
-            tf.clear()
-            
-            # 콘텐츠가 리스트인 경우 (불릿 포인트)
-            if "content" in slide_data:
-                content = slide_data["content"]
-                if isinstance(content, list):
-                    for idx, point in enumerate(content):
-                        p = tf.add_paragraph()
-                        p.text = point
-                        p.level = 0
-                        
-                        # 본문 텍스트 스타일 적용
-                        apply_text_style(p, 
-                                        color=text_color,
-                                        font_name=body_font["name"],
-                                        font_size=body_font["size"],
-                                        bold=body_font["bold"],
-                                        italic=body_font["italic"],
-                                        alignment=body_align)
-                        
-                        # 불릿 스타일 커스터마이징
-                        customize_bullet(p, bullet_style, bullet_color)
-                else:
-                    # 문자열인 경우
-                    p = tf.add_paragraph()
-                    p.text = str(content)
-                    
-                    # 본문 텍스트 스타일 적용
-                    apply_text_style(p, 
-                                    color=text_color,
-                                    font_name=body_font["name"],
-                                    font_size=body_font["size"],
-                                    bold=body_font["bold"],
-                                    italic=body_font["italic"],
-                                    alignment=body_align)
-        
-        # 공통 요소 추가 (푸터, 로고, 슬라이드 번호 등)
-        if i > 0 or settings.get("footer_on_title", False):  # 첫 슬라이드에는 보통 푸터를 넣지 않음 (설정 가능)
-            # 푸터 추가
-            add_footer(slide, footer_text, footer_color, footer_font)
-            
-            # 슬라이드 번호 추가
-            if slide_number:
-                add_slide_number(slide, i+1, len(slides), footer_color, footer_font)
-            
-            # 로고 추가 (설정된 경우)
-            if include_logo and settings.get("logo_path"):
-                add_logo(slide, settings["logo_path"])
+        slide = prs.slides.add_slide(title_slide_layout if i == 0 else content_slide_layout)
+        fill_slide(slide, slide_data, is_title=(i == 0))
     
     # 메모리 스트림에 PPT 저장
     output = io.BytesIO()
@@ -1089,6 +1174,308 @@ def create_enhanced_ppt(slides, template_name="기본 템플릿"):
     
     return output
 
+def enhance_slides(text, num_slides, model_provider, temperature):
+    """선택한 AI 모델로 슬라이드 구조 생성"""
+    if model_provider == "OpenAI GPT-4o":
+        return enhance_with_openai(text, num_slides, OPENAI_API_KEY, temperature)
+    return enhance_with_gemini(text, num_slides, GEMINI_API_KEY, temperature)
+
+# 모든 템플릿을 한 번에 만들 때 사용할 작업 프로세스 수 상한
+MAX_RENDER_WORKERS = 4
+
+# 썸네일 미리보기 한 페이지에 표시할 슬라이드 수와 열 수
+THUMBNAILS_PER_PAGE = 12
+THUMBNAIL_COLUMNS = 3
+
+def plan_key(slides):
+    """슬라이드 계획의 내용 해시 (같은 계획이면 같은 키)"""
+    data = json.dumps(slides, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+def fit_plan_slide(index, slide, template_name):
+    """슬라이드 계획의 한 슬라이드를 본문 영역에 맞춘 슬라이드 리스트 (제목 슬라이드는 그대로)"""
+    if index == 0:
+        return [slide]
+    body_font = ENHANCED_TEMPLATES[template_name]["fonts"]["body_font"]
+    return fit_slide(slide, body_font["name"], int(body_font["size"].pt))
+
+def _read_zip_entries(data):
+    """ZIP 바이트에서 파트 이름별 압축된 원본 데이터를 읽음 (다시 압축하지 않고 재사용)"""
+    entries = OrderedDict()
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        for info in archive.infolist():
+            # 로컬 파일 헤더(30바이트 + 이름 + 추가 필드) 뒤에 압축 데이터가 이어짐
+            name_length, extra_length = struct.unpack("<HH", data[info.header_offset + 26:info.header_offset + 30])
+            start = info.header_offset + 30 + name_length + extra_length
+            raw = data[start:start + info.compress_size]
+            entries[info.filename] = (info.compress_type, info.CRC, info.file_size, raw)
+    return entries
+
+def _deflate_entry(blob):
+    """파트 XML을 ZIP 항목용으로 압축"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    raw = compressor.compress(blob) + compressor.flush()
+    return (zipfile.ZIP_DEFLATED, zlib.crc32(blob), len(blob), raw)
+
+def _assemble_zip(entries):
+    """압축된 파트 항목들로 ZIP(.pptx) 바이트 조립"""
+    output = io.BytesIO()
+    central = []
+    for name, (method, crc, size, raw) in entries.items():
+        encoded = name.encode("utf-8")
+        offset = output.tell()
+        # 날짜/시간 필드는 1980-01-01 00:00 (0x0021, 0)으로 고정
+        output.write(struct.pack("<IHHHHHIIIHH", 0x04034B50, 20, 0, method, 0, 0x21,
+                                 crc, len(raw), size, len(encoded), 0))
+        output.write(encoded)
+        output.write(raw)
+        central.append(struct.pack("<IHHHHHHIIIHHHHHII", 0x02014B50, 20, 20, 0, method, 0, 0x21,
+                                   crc, len(raw), size, len(encoded), 0, 0, 0, 0, 0, offset) + encoded)
+    central_offset = output.tell()
+    central_data = b"".join(central)
+    output.write(central_data)
+    output.write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, len(central), len(central),
+                             len(central_data), central_offset, 0))
+    return output.getvalue()
+
+class IncrementalDeck:
+    """
+    슬라이드 하나를 고치면 그 슬라이드의 XML 파트만 다시 만드는 PPT 덱
+
+    파트별 압축 데이터를 캐시해 두고, 편집된 슬라이드 파트만 새로 압축해 패키지를 다시 조립한다.
+    편집으로 (계속) 슬라이드 수가 바뀌어 전체 슬라이드 수가 달라지면 덱 전체를 다시 만든다.
+    """
+
+    def __init__(self, slides, template_name, groups=None, data=None):
+        self.template_name = template_name
+        self.plan = list(slides)
+        if groups is None or data is None:
+            self._rebuild()
+        else:
+            self.groups = groups
+            self.data = data
+            self._prs = None
+            self._entries = None
+
+    @property
+    def slides(self):
+        """본문 맞춤이 반영된 전체 슬라이드 리스트"""
+        return [slide for group in self.groups for slide in group]
+
+    def _rebuild(self):
+        """덱 전체 다시 생성"""
+        self.groups = [fit_plan_slide(i, slide, self.template_name) for i, slide in enumerate(self.plan)]
+        self.data = create_enhanced_ppt(self.slides, self.template_name, fit_text=False).getvalue()
+        self._prs = None
+        self._entries = None
+
+    def update_slide(self, index, slide_data):
+        """
+        슬라이드 계획의 index번째 슬라이드를 바꾸고 PPT 바이트 갱신
+
+        Parameters:
+        index (int): 슬라이드 계획 순서
+        slide_data (dict): {"title": 제목, "content": 불릿 리스트}
+
+        Returns:
+        bool: 해당 슬라이드만 다시 만들었으면 True, 덱 전체를 다시 만들었으면 False
+        """
+        self.plan[index] = slide_data
+        group = fit_plan_slide(index, slide_data, self.template_name)
+        if len(group) != len(self.groups[index]):
+            self._rebuild()
+            return False
+
+        # 처음 편집할 때만 패키지를 열고 파트 캐시 생성
+        if self._prs is None:
+            self._prs = Presentation(io.BytesIO(self.data))
+            self._entries = _read_zip_entries(self.data)
+
+        start = sum(len(previous) for previous in self.groups[:index])
+        for offset, fitted in enumerate(group):
+            slide = self._prs.slides[start + offset]
+            fill_slide(slide, fitted, is_title=(start + offset == 0))
+            self._entries[slide.part.partname.lstrip("/")] = _deflate_entry(slide.part.blob)
+        self.groups[index] = group
+        self.data = _assemble_zip(self._entries)
+        return True
+
+def render_template(slides, template_name):
+    """
+    슬라이드 계획을 한 템플릿으로 PPT 생성 (작업 프로세스에서 실행)
+
+    Parameters:
+    slides (list): 슬라이드 dict 리스트
+    template_name (str): ENHANCED_TEMPLATES 템플릿 이름
+
+    Returns:
+    tuple: (템플릿 이름, 계획 슬라이드별 본문 맞춤 결과 리스트, PPT 바이트)
+    """
+    # 본문이 넘치는 슬라이드는 글자 크기 조정 또는 (계속) 슬라이드로 분할
+    groups = [fit_plan_slide(i, slide, template_name) for i, slide in enumerate(slides)]
+    fitted = [slide for group in groups for slide in group]
+    return template_name, groups, create_enhanced_ppt(fitted, template_name, fit_text=False).getvalue()
+
+def render_all_templates(slides, max_workers=None):
+    """
+    같은 슬라이드 계획으로 모든 템플릿의 PPT를 생성
+
+    템플릿마다 작업 프로세스에서 병렬로 만들고, CPU가 하나이거나 프로세스를
+    만들 수 없는 환경에서는 순서대로 만든다.
+
+    Parameters:
+    slides (list): 슬라이드 dict 리스트
+    max_workers (int, optional): 작업 프로세스 수. None이면 CPU 코어 수 (최대 MAX_RENDER_WORKERS)
+
+    Returns:
+    dict: 템플릿 이름 -> IncrementalDeck
+    """
+    names = list(ENHANCED_TEMPLATES.keys())
+    num_workers = min(max_workers or os.cpu_count() or 1, MAX_RENDER_WORKERS, len(names))
+
+    results = None
+    if num_workers >= 2:
+        try:
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                futures = [executor.submit(render_template, slides, name) for name in names]
+                results = [future.result() for future in futures]
+        except (OSError, RuntimeError):
+            # 프로세스 생성이 막힌 환경에서는 단일 프로세스로 대체
+            results = None
+    if results is None:
+        results = [render_template(slides, name) for name in names]
+
+    return {name: IncrementalDeck(slides, name, groups, data) for name, groups, data in results}
+
+def get_template_variants(slides):
+    """세션에 캐시된 템플릿별 덱 (슬라이드 계획이 바뀌었을 때만 다시 생성)"""
+    key = plan_key(slides)
+    cached = st.session_state.get("ppt_variants")
+    if not cached or cached["key"] != key:
+        with st.spinner("모든 템플릿으로 PPT 생성 중..."):
+            cached = {"key": key, "decks": render_all_templates(slides)}
+        st.session_state.ppt_variants = cached
+    return cached["decks"]
+
+def apply_slide_edit(index, slide_data):
+    """편집한 슬라이드만 모든 템플릿 덱에 반영하고 세션의 슬라이드 계획 갱신"""
+    plan = list(st.session_state.slides_preview)
+    plan[index] = slide_data
+    
+    start_time = time.perf_counter()
+    cached = st.session_state.ppt_variants
+    partial = all([deck.update_slide(index, slide_data) for deck in cached["decks"].values()])
+    elapsed = (time.perf_counter() - start_time) * 1000
+    
+    # 덱은 이미 갱신되었으므로 새 계획의 키만 기록 (전체 재생성 방지)
+    cached["key"] = plan_key(plan)
+    st.session_state.slides_preview = plan
+    scope = "해당 슬라이드만" if partial else "슬라이드 수가 바뀌어 전체를"
+    st.session_state.ppt_edit_message = f"슬라이드 {index + 1} 수정 반영: {scope} 다시 만들었습니다. ({elapsed:.0f}ms)"
+
+def show_slide_editor():
+    """슬라이드 계획 편집기 (제목과 불릿을 고치면 해당 슬라이드만 다시 생성)"""
+    plan = st.session_state.slides_preview
+    index = st.selectbox(
+        "편집할 슬라이드",
+        range(len(plan)),
+        format_func=lambda i: f"{i+1}. {plan[i]['title']}",
+        key="ppt_edit_index"
+    )
+    content = plan[index].get("content", [])
+    points = content if isinstance(content, list) else [str(content)]
+    
+    with st.form("ppt_edit_form"):
+        title = st.text_input("제목", value=plan[index].get("title", ""))
+        label = "부제목" if index == 0 else "내용 (한 줄에 한 항목)"
+        body = st.text_area(label, value="\n".join(str(point) for point in points), height=200)
+        submitted = st.form_submit_button("수정 반영", use_container_width=True)
+    
+    if submitted:
+        lines = [line.strip() for line in body.splitlines() if line.strip()]
+        apply_slide_edit(index, {"title": title.strip() or plan[index].get("title", ""), "content": lines})
+        st.rerun()
+    
+    if st.session_state.get("ppt_edit_message"):
+        st.caption(st.session_state.ppt_edit_message)
+
+def show_slide_thumbnails(slides, template_name):
+    """템플릿 색상·폰트로 그린 슬라이드 썸네일을 페이지 단위로 표시 (썸네일은 내용 해시로 캐시)"""
+    template = ENHANCED_TEMPLATES[template_name]
+    total = len(slides)
+    num_pages = (total + THUMBNAILS_PER_PAGE - 1) // THUMBNAILS_PER_PAGE
+    page = 1
+    if num_pages > 1:
+        page = st.number_input("미리보기 페이지", min_value=1, max_value=num_pages, value=1, step=1,
+                               key="ppt_thumbnail_page")
+    
+    start = (page - 1) * THUMBNAILS_PER_PAGE
+    cols = st.columns(THUMBNAIL_COLUMNS)
+    for i in range(start, min(start + THUMBNAILS_PER_PAGE, total)):
+        png = thumbnail_cache.get_or_render(slides[i], template_name, template, i, total)
+        with cols[(i - start) % THUMBNAIL_COLUMNS]:
+            st.image(png, caption=f"{i+1}. {slides[i]['title']}", use_container_width=True)
+
+def show_ppt_result(slides, template_name):
+    """슬라이드 계획으로 모든 템플릿의 PPT를 만들어 구조 미리보기와 다운로드 버튼 표시"""
+    variants = get_template_variants(slides)
+    selected = variants[template_name]
+    slides = selected.slides
+    
+    # 파일명 설정
+    current_time = time.strftime("%Y%m%d_%H%M%S")
+    filename = f"presentation_{current_time}.pptx"
+    
+    # 다운로드 버튼 표시
+    st.success(f"PPT 생성이 완료되었습니다! ({len(slides)}개 슬라이드)")
+    
+    # 슬라이드 구조 미리보기
+    with st.expander("슬라이드 구조 미리보기", expanded=True):
+        if thumbnails_available():
+            thumbnail_tab, text_tab = st.tabs(["🖼️ 썸네일", "📝 텍스트"])
+            with thumbnail_tab:
+                show_slide_thumbnails(slides, template_name)
+        else:
+            text_tab = st.container()
+        
+        with text_tab:
+            for i, slide in enumerate(slides):
+                st.markdown(f"**슬라이드 {i+1}: {slide['title']}**")
+                if isinstance(slide['content'], list):
+                    for point in slide['content']:
+                        st.markdown(f"- {point}")
+                else:
+                    st.text(str(slide['content']))
+    
+    # 슬라이드 편집 (편집한 슬라이드만 다시 생성)
+    with st.expander("✏️ 슬라이드 편집"):
+        show_slide_editor()
+    
+    # PPT 다운로드 버튼 (선택한 템플릿)
+    st.download_button(
+        label=f"📥 PPT 파일 다운로드 ({template_name})",
+        data=selected.data,
+        file_name=filename,
+        mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        use_container_width=True,
+        key="ppt_download"
+    )
+    
+    # 다른 템플릿 버전 (AI 재호출 없이 같은 슬라이드 계획으로 생성)
+    with st.expander("다른 템플릿으로 받기"):
+        others = [name for name in variants if name != template_name]
+        cols = st.columns(2)
+        for i, name in enumerate(others):
+            with cols[i % 2]:
+                st.download_button(
+                    label=f"📥 {name}",
+                    data=variants[name].data,
+                    file_name=f"presentation_{current_time}_{name.replace(' ', '_')}.pptx",
+                    mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                    use_container_width=True,
+                    key=f"ppt_download_{name}"
+                )
+
 # 메인 함수 - Streamlit UI 및 실행 로직
 def run():
     st.title("📊 AI 기반 문서 PPT 변환기")
@@ -1246,15 +1633,15 @@ def run():
     document_text = ""
     
     if input_method == "문서 업로드":
-        uploaded_file = st.file_uploader("PDF 또는 Word 문서를 업로드하세요", type=["pdf", "docx"])
+        uploaded_file = st.file_uploader("PDF, Word 또는 한글(HWPX) 문서를 업로드하세요", type=["pdf", "docx", "hwpx"])
         
         if uploaded_file is not None:
             with st.spinner("문서에서 텍스트를 추출하는 중..."):
                 # 파일 유형에 따라 텍스트 추출
-                if uploaded_file.name.endswith('.pdf'):
-                    document_text = extract_text_from_pdf(uploaded_file)
-                elif uploaded_file.name.endswith('.docx'):
-                    document_text = extract_text_from_docx(uploaded_file)
+                try:
+                    document_text = extract_text_with_progress(uploaded_file, key="ppt_extract", normalize=True)
+                except Exception as e:
+                    st.error(f"문서 읽기 오류: {str(e)}")
                 
                 if document_text:
                     st.session_state.document_text = document_text
@@ -1272,68 +1659,57 @@ def run():
         )
         document_text = st.session_state.document_text
     
+    # 생성 방식 선택
+    generation_mode = st.radio(
+        "생성 방식",
+        ["AI 분석", "빠른 초안 (AI 미사용)"],
+        horizontal=True,
+        help="빠른 초안은 Ⅰ./1./가./○ 등 문서의 번호 체계를 AI 호출 없이 바로 슬라이드로 바꿉니다."
+    )
+    
     # PPT 변환 버튼
     if document_text and st.button("PPT 생성하기", type="primary", use_container_width=True):
-        with st.spinner("PPT 파일 생성 중..."):
-            # 진행 상황 표시
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            # 1단계: 문서 분석
-            status_text.text("문서 분석 중...")
-            progress_bar.progress(25)
-            
-            # 2단계: AI로 슬라이드 구조 생성
-            status_text.text("AI로 문서 구조 분석 중...")
-            
-            # 선택한 AI 모델에 따라 처리
-            if model_provider == "OpenAI GPT-4o":
-                slides = enhance_with_openai(document_text, num_slides, OPENAI_API_KEY, temperature)
-            else:  # Google Gemini
-                slides = enhance_with_gemini(document_text, num_slides, GEMINI_API_KEY, temperature)
-            
-            # 세션에 슬라이드 미리보기 저장
-            st.session_state.slides_preview = slides
-            
-            progress_bar.progress(50)
-            
-            # 3단계: 향상된 PPT 템플릿으로 생성
-            status_text.text("PowerPoint 파일 생성 중...")
-            ppt_file = create_enhanced_ppt(slides, template_name)
-            progress_bar.progress(75)
-            
-            # 4단계: 완료
-            status_text.text("완료!")
-            progress_bar.progress(100)
-            
-            # 파일명 설정
-            current_time = time.strftime("%Y%m%d_%H%M%S")
-            filename = f"presentation_{current_time}.pptx"
-            
-            # 다운로드 버튼 표시
-            st.success(f"PPT 생성이 완료되었습니다! ({len(slides)}개 슬라이드)")
-            
-            # 슬라이드 구조 미리보기
-            with st.expander("슬라이드 구조 미리보기", expanded=True):
-                for i, slide in enumerate(slides):
-                    st.markdown(f"**슬라이드 {i+1}: {slide['title']}**")
-                    if isinstance(slide['content'], list):
-                        for point in slide['content']:
-                            st.markdown(f"- {point}")
-                    else:
-                        st.text(str(slide['content']))
-            
-            # PPT 다운로드 버튼
-            st.download_button(
-                label="📥 PPT 파일 다운로드",
-                data=ppt_file,
-                file_name=filename,
-                mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                use_container_width=True
-            )
-            
-            # 세션 상태 업데이트
-            st.session_state.ppt_generated = True
+        if generation_mode == "빠른 초안 (AI 미사용)":
+            slides = parse_outline_to_slides(document_text)
+            st.session_state.ppt_quick_draft = True
+        else:
+            with st.spinner("PPT 파일 생성 중..."):
+                # 진행 상황 표시
+                progress_bar = st.progress(0)
+                status_text = st.empty()
+                
+                # 1단계: 문서 분석
+                status_text.text("문서 분석 중...")
+                progress_bar.progress(25)
+                
+                # 2단계: AI로 슬라이드 구조 생성
+                status_text.text("AI로 문서 구조 분석 중...")
+                slides = enhance_slides(document_text, num_slides, model_provider, temperature)
+                
+                # 3단계: 완료
+                status_text.text("완료!")
+                progress_bar.progress(100)
+            st.session_state.ppt_quick_draft = False
+        
+        # 세션에 슬라이드 계획 저장 (템플릿 변경 시에도 다시 생성하지 않음)
+        st.session_state.slides_preview = slides
+        st.session_state.ppt_generated = True
+        st.session_state.ppt_edit_message = ""
+    
+    # 생성 결과 표시
+    if st.session_state.ppt_generated and st.session_state.slides_preview:
+        # 빠른 초안은 필요할 때만 AI로 다듬기
+        if st.session_state.get("ppt_quick_draft"):
+            if st.button("🤖 AI로 초안 다듬기", use_container_width=True):
+                with st.spinner("AI로 초안을 다듬는 중..."):
+                    draft = st.session_state.slides_preview
+                    st.session_state.slides_preview = enhance_slides(
+                        slides_to_outline_text(draft), len(draft), model_provider, temperature
+                    )
+                st.session_state.ppt_quick_draft = False
+                st.rerun()
+        
+        show_ppt_result(st.session_state.slides_preview, template_name)
     
     # 사용 방법 안내
     st.markdown("---")
@@ -1341,7 +1717,7 @@ def run():
     ### 💡 사용 방법
     
     1. **문서 업로드** 또는 **텍스트 직접 입력**을 선택하세요.
-    2. PDF나 Word 문서를 업로드하거나 텍스트를 입력하세요.
+    2. PDF, Word 또는 한글(HWPX) 문서를 업로드하거나 텍스트를 입력하세요.
     3. **PPT 생성하기** 버튼을 클릭하세요.
     4. 생성된 PPT 파일을 다운로드하세요.
     
@@ -1352,7 +1728,7 @@ def run():
     - 다양한 디자인 템플릿 지원
     - 세련된 폰트와 색상 조합
     - 자동 푸터 및 슬라이드 번호 추가
-    - PDF 및 Word 문서 지원
+    - PDF, Word 및 한글(HWPX) 문서 지원
     """)
 
 if __name__ == "__main__":
@@ -0,0 +1,228 @@
+import os
+import unicodedata
+from functools import lru_cache
+
+# Pillow 패키지 체크 (없으면 문자 폭 근사치로 측정)
+try:
+    from PIL import ImageFont
+    pil_available = True
+except ImportError:
+    pil_available = False
+
+# 기본 템플릿 본문 자리표시자 크기 (포인트) - 폭 8229600 EMU, 높이 4525963 EMU
+BODY_WIDTH_PT = 648.0
+BODY_HEIGHT_PT = 356.4
+
+# 텍스트 프레임 좌우/상하 여백과 1수준 불릿 들여쓰기 (포인트)
+BODY_INSET_X_PT = 7.2 * 2
+BODY_INSET_Y_PT = 3.6 * 2
+BULLET_INDENT_PT = 27.0
+
+# 줄 간격(글자 크기 대비)과 단락 앞 간격(마스터 bodyStyle의 spcBef 20%)
+LINE_SPACING = 1.2
+PARAGRAPH_SPACING = 0.2
+
+# 글자 크기를 줄일 수 있는 한도 (원래 크기 대비 비율, 최소 포인트)
+MIN_FONT_SCALE = 0.8
+MIN_FONT_PT = 14
+
+# 이어지는 슬라이드 제목 접미사
+CONTINUED_SUFFIX = " (계속)"
+
+# 템플릿 폰트 이름별 글꼴 파일 후보
+FONT_FILES = {
+    "맑은 고딕": ["malgun.ttf", "MalgunGothic.ttf"],
+    "나눔스퀘어": ["NanumSquareR.ttf", "NanumSquare.ttf", "NanumSquareOTF_acR.otf"],
+    "굴림": ["gulim.ttc", "Gulim.ttf"],
+}
+
+# 템플릿 폰트가 없을 때 대신 쓸 한글 글꼴 파일 (Linux 배포판·macOS 기본 한글 글꼴 순)
+CJK_FALLBACK_FILES = [
+    "NanumGothic.ttf", "NanumBarunGothic.ttf", "NotoSansCJK-Regular.ttc", "NotoSansCJKkr-Regular.otf",
+    "NotoSansKR-Regular.otf", "NotoSansKR-Regular.ttf", "UnDotum.ttf", "AppleSDGothicNeo.ttc",
+]
+
+# 글꼴 파일을 찾을 폴더 (Windows, macOS, Linux)
+FONT_DIRS = [
+    "C:/Windows/Fonts",
+    os.path.expanduser("~/Library/Fonts"),
+    "/Library/Fonts",
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.expanduser("~/.fonts"),
+]
+
+
+@lru_cache(maxsize=None)
+def _font_index():
+    """설치된 글꼴 파일 이름(소문자) -> 경로 색인 (프로세스당 한 번만 탐색)"""
+    index = {}
+    for font_dir in FONT_DIRS:
+        if not os.path.isdir(font_dir):
+            continue
+        for root, _, files in os.walk(font_dir):
+            for name in files:
+                index.setdefault(name.lower(), os.path.join(root, name))
+    return index
+
+
+@lru_cache(maxsize=None)
+def korean_font_available():
+    """템플릿 폰트나 대체 한글 글꼴 파일이 하나라도 설치되어 있는지 여부"""
+    index = _font_index()
+    candidates = [name for names in FONT_FILES.values() for name in names] + CJK_FALLBACK_FILES
+    return any(name.lower() in index for name in candidates)
+
+
+@lru_cache(maxsize=64)
+def load_font(font_name, size_pt):
+    """템플릿 폰트에 해당하는 Pillow 글꼴 (없으면 대체 한글 글꼴, 그것도 없으면 None)"""
+    if not pil_available:
+        return None
+    index = _font_index()
+    for file_name in FONT_FILES.get(font_name, []) + CJK_FALLBACK_FILES:
+        path = index.get(file_name.lower())
+        if path:
+            try:
+                return ImageFont.truetype(path, size_pt)
+            except OSError:
+                continue
+    return None
+
+
+def _approximate_width(text, size_pt):
+    """글꼴 파일이 없을 때의 폭 근사치 (전각 문자 1em, 공백 0.3em, 그 외 0.55em)"""
+    width = 0.0
+    for char in text:
+        if char == " ":
+            width += 0.3
+        elif unicodedata.east_asian_width(char) in ("W", "F"):
+            width += 1.0
+        else:
+            width += 0.55
+    return width * size_pt
+
+
+@lru_cache(maxsize=65536)
+def measure_text_width(text, font_name, size_pt):
+    """
+    텍스트 폭 측정 (포인트). (폰트, 크기, 텍스트)별로 결과를 캐시한다.
+
+    Parameters:
+    text (str): 측정할 텍스트
+    font_name (str): 템플릿 폰트 이름
+    size_pt (int): 글자 크기 (포인트)
+    """
+    font = load_font(font_name, size_pt)
+    if font is not None:
+        return font.getlength(text)
+    return _approximate_width(text, size_pt)
+
+
+def count_wrapped_lines(text, font_name, size_pt, width_pt):
+    """주어진 폭에서 단어 단위로 줄바꿈했을 때의 줄 수"""
+    space = measure_text_width(" ", font_name, size_pt)
+    lines = 1
+    line_width = 0.0
+    for word in text.split():
+        word_width = measure_text_width(word, font_name, size_pt)
+        # 한 줄보다 긴 단어는 폭만큼 나누어 차지
+        if word_width > width_pt:
+            if line_width:
+                lines += 1
+            extra, line_width = divmod(word_width, width_pt)
+            lines += int(extra)
+            continue
+        needed = word_width if line_width == 0 else line_width + space + word_width
+        if needed > width_pt:
+            lines += 1
+            line_width = word_width
+        else:
+            line_width = needed
+    return lines
+
+
+def body_height(points, font_name, size_pt):
+    """불릿 목록을 본문 자리표시자에 넣었을 때 필요한 높이 (포인트)"""
+    width = BODY_WIDTH_PT - BODY_INSET_X_PT - BULLET_INDENT_PT
+    height = 0.0
+    for point in points:
+        lines = count_wrapped_lines(str(point), font_name, size_pt, width)
+        height += lines * size_pt * LINE_SPACING + size_pt * PARAGRAPH_SPACING
+    return height
+
+
+def fits(points, font_name, size_pt):
+    """불릿 목록이 본문 자리표시자 높이 안에 들어가는지 여부"""
+    return body_height(points, font_name, size_pt) <= BODY_HEIGHT_PT - BODY_INSET_Y_PT
+
+
+def _shrunk_size(points, font_name, base_size):
+    """한도 안에서 글자 크기를 줄여 들어가는 가장 큰 크기 (없으면 None)"""
+    min_size = max(MIN_FONT_PT, int(base_size * MIN_FONT_SCALE))
+    for size in range(int(base_size) - 1, min_size - 1, -1):
+        if fits(points, font_name, size):
+            return size
+    return None
+
+
+def _pack_points(points, font_name, size_pt):
+    """불릿을 순서대로 슬라이드 높이에 맞게 묶음 (한 불릿은 나누지 않음)"""
+    chunks = [[]]
+    for point in points:
+        if chunks[-1] and not fits(chunks[-1] + [point], font_name, size_pt):
+            chunks.append([])
+        chunks[-1].append(point)
+    return chunks
+
+
+def fit_slide(slide, font_name, base_size):
+    """
+    내용 슬라이드 하나를 본문 영역에 맞춤
+
+    원래 크기로 들어가면 그대로, 한도 안에서 줄여 들어가면 "font_size"를 지정하고,
+    그래도 넘치면 불릿을 나누어 "(계속)" 슬라이드를 이어 붙인다.
+
+    Parameters:
+    slide (dict): {"title": 제목, "content": 불릿 리스트}
+    font_name (str): 본문 폰트 이름
+    base_size (int): 템플릿 본문 글자 크기 (포인트)
+
+    Returns:
+    list: 맞춰진 슬라이드 dict 리스트
+    """
+    points = slide.get("content", [])
+    if not isinstance(points, list) or not points or fits(points, font_name, base_size):
+        return [slide]
+
+    size = _shrunk_size(points, font_name, base_size)
+    if size is not None:
+        return [dict(slide, font_size=size)]
+
+    title = slide.get("title", "슬라이드")
+    fitted = []
+    for index, chunk in enumerate(_pack_points(points, font_name, base_size)):
+        part = dict(slide, title=title if index == 0 else title + CONTINUED_SUFFIX, content=chunk)
+        # 불릿 하나가 너무 긴 경우에는 가능한 만큼 줄임
+        if not fits(chunk, font_name, base_size):
+            part["font_size"] = _shrunk_size(chunk, font_name, base_size) or max(MIN_FONT_PT, int(base_size * MIN_FONT_SCALE))
+        fitted.append(part)
+    return fitted
+
+
+def fit_slides(slides, body_font):
+    """
+    슬라이드 계획 전체를 본문 영역에 맞춤 (첫 슬라이드는 제목 슬라이드라 그대로 둠)
+
+    Parameters:
+    slides (list): 슬라이드 dict 리스트
+    body_font (dict): 템플릿 본문 폰트 정보 (name, size)
+
+    Returns:
+    list: 글자 크기 조정 및 이어지는 슬라이드가 반영된 슬라이드 리스트
+    """
+    base_size = int(body_font["size"].pt)
+    fitted = slides[:1]
+    for slide in slides[1:]:
+        fitted.extend(fit_slide(slide, body_font["name"], base_size))
+    return fitted
@@ -0,0 +1,224 @@
+import io
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from pptx.enum.text import PP_ALIGN
+from ppt_text_fit import korean_font_available, load_font
+
+# Pillow 패키지 체크 (없으면 썸네일 미리보기를 사용하지 않음)
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    pil_available = True
+except ImportError:
+    pil_available = False
+
+# 기본 슬라이드 크기 (포인트, 10 x 7.5인치)
+SLIDE_WIDTH_PT = 720.0
+SLIDE_HEIGHT_PT = 540.0
+
+# 자리표시자 위치 (left, top, width, height 포인트) - python-pptx 기본 레이아웃 기준
+TITLE_SLIDE_TITLE_BOX = (54.0, 167.75, 612.0, 115.75)
+TITLE_SLIDE_SUBTITLE_BOX = (108.0, 306.0, 504.0, 138.0)
+CONTENT_TITLE_BOX = (36.0, 21.6, 648.0, 90.0)
+CONTENT_BODY_BOX = (36.0, 126.0, 648.0, 356.4)
+FOOTER_BOX = (36.0, 504.0, 648.0, 21.6)
+SLIDE_NUMBER_BOX = (669.6, 504.0, 36.0, 21.6)
+ACCENT_LINE_BOX = (36.0, 72.0, 144.0, 3.6)
+
+# 기본 썸네일 폭 (픽셀)과 캐시 개수
+THUMBNAIL_WIDTH = 320
+THUMBNAIL_CACHE_SIZE = 256
+
+# 불릿 들여쓰기 (포인트)
+BULLET_INDENT_PT = 27.0
+
+
+def thumbnails_available():
+    """썸네일을 그릴 수 있는지 여부 (Pillow와 한글 글꼴이 모두 있어야 글자가 깨지지 않음)"""
+    return pil_available and korean_font_available()
+
+
+def thumbnail_key(slide, template_name, index, total, width):
+    """슬라이드 내용·템플릿·번호·크기로 만든 썸네일 캐시 키"""
+    data = json.dumps([slide, template_name, index, total, width], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _font(font_info, scale, size_pt=None):
+    """템플릿 폰트를 썸네일 배율에 맞는 Pillow 글꼴로 변환 (한글 글꼴 파일이 없으면 기본 글꼴)"""
+    size = max(6, round((size_pt or font_info["size"].pt) * scale))
+    font = load_font(font_info["name"], size)
+    if font is not None:
+        return font
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        # Pillow 10.1 미만은 크기를 지정할 수 없음
+        return ImageFont.load_default()
+
+
+def _wrap(text, font, width):
+    """글자 폭 기준 줄바꿈 (띄어쓰기 단위, 한 줄보다 긴 단어는 글자 단위로 나눔)"""
+    lines = []
+    line = ""
+    for word in text.split():
+        candidate = f"{line} {word}" if line else word
+        if font.getlength(candidate) <= width:
+            line = candidate
+            continue
+        if line:
+            lines.append(line)
+        line = ""
+        for char in word:
+            if line and font.getlength(line + char) > width:
+                lines.append(line)
+                line = ""
+            line += char
+    if line:
+        lines.append(line)
+    return lines or [""]
+
+
+def _line_height(font):
+    """글꼴의 줄 높이 (픽셀)"""
+    ascent, descent = font.getmetrics()
+    return int((ascent + descent) * 1.15)
+
+
+def _draw_text_box(draw, box, lines, font, color, align, anchor="top"):
+    """상자 안에 줄 목록을 그림 (상자를 넘는 줄은 생략)"""
+    left, top, width, height = box
+    line_height = _line_height(font)
+    visible = lines[:max(1, int(height // line_height))]
+    y = top + (height - line_height * len(visible)) / 2 if anchor == "middle" else top
+    for line in visible:
+        line_width = font.getlength(line)
+        if align == PP_ALIGN.CENTER:
+            x = left + (width - line_width) / 2
+        elif align == PP_ALIGN.RIGHT:
+            x = left + width - line_width
+        else:
+            x = left
+        draw.text((x, y), line, font=font, fill=color)
+        y += line_height
+
+
+def _scaled(box, scale):
+    """포인트 단위 상자를 픽셀 단위로 변환"""
+    return tuple(value * scale for value in box)
+
+
+def render_thumbnail(slide, template, index, total, width=THUMBNAIL_WIDTH):
+    """
+    슬라이드 하나를 템플릿 색상·폰트로 그린 PNG 썸네일 생성
+
+    Parameters:
+    slide (dict): {"title": 제목, "content": 불릿 리스트 또는 문자열, "font_size"(선택)}
+    template (dict): ENHANCED_TEMPLATES 템플릿 정보
+    index (int): 슬라이드 순서 (0이면 제목 슬라이드)
+    total (int): 전체 슬라이드 수
+    width (int): 썸네일 폭 (픽셀)
+
+    Returns:
+    bytes: PNG 이미지 바이트
+    """
+    colors = template["colors"]
+    fonts = template["fonts"]
+    styles = template["styles"]
+    settings = template["settings"]
+    scale = width / SLIDE_WIDTH_PT
+
+    image = Image.new("RGB", (width, round(SLIDE_HEIGHT_PT * scale)), colors["bg_color"])
+    draw = ImageDraw.Draw(image)
+
+    content = slide.get("content", [])
+    points = content if isinstance(content, list) else [str(content)]
+
+    if index == 0:
+        title_box = _scaled(TITLE_SLIDE_TITLE_BOX, scale)
+        title_font = _font(fonts["title_font"], scale)
+        _draw_text_box(draw, title_box, _wrap(slide.get("title", "프레젠테이션"), title_font, title_box[2]),
+                       title_font, colors["title_color"], styles["title_align"], anchor="middle")
+        if points:
+            subtitle_box = _scaled(TITLE_SLIDE_SUBTITLE_BOX, scale)
+            subtitle_font = _font(fonts["subtitle_font"], scale)
+            _draw_text_box(draw, subtitle_box, _wrap(str(points[0]), subtitle_font, subtitle_box[2]),
+                           subtitle_font, colors["accent_color"], styles["title_align"])
+        if settings.get("accent_line", False):
+            left, top, line_width, line_height = _scaled(ACCENT_LINE_BOX, scale)
+            draw.rectangle([left, top, left + line_width, top + max(1, line_height)], fill=colors["accent_color"])
+    else:
+        title_box = _scaled(CONTENT_TITLE_BOX, scale)
+        title_font = _font(fonts["title_font"], scale)
+        _draw_text_box(draw, title_box, _wrap(slide.get("title", "슬라이드"), title_font, title_box[2]),
+                       title_font, colors["title_color"], styles["title_align"], anchor="middle")
+
+        # 불릿 목록 (텍스트 맞춤으로 줄인 글자 크기가 있으면 반영)
+        left, top, body_width, body_height = _scaled(CONTENT_BODY_BOX, scale)
+        body_font = _font(fonts["body_font"], scale, slide.get("font_size"))
+        indent = BULLET_INDENT_PT * scale
+        line_height = _line_height(body_font)
+        bullet = styles.get("bullet_style", "•")
+        y = top
+        for point in points:
+            lines = _wrap(str(point), body_font, body_width - indent)
+            if y + line_height > top + body_height:
+                break
+            draw.text((left, y), bullet, font=body_font, fill=colors["bullet_color"])
+            for line in lines:
+                if y + line_height > top + body_height:
+                    break
+                draw.text((left + indent, y), line, font=body_font, fill=colors["text_color"])
+                y += line_height
+            y += line_height * 0.2
+
+    # 푸터와 슬라이드 번호 (제목 슬라이드는 footer_on_title 설정일 때만)
+    if index > 0 or settings.get("footer_on_title", False):
+        footer_font = _font(fonts["footer_font"], scale)
+        _draw_text_box(draw, _scaled(FOOTER_BOX, scale), [settings.get("footer_text", "© 2025 남양주시")],
+                       footer_font, colors["footer_color"], PP_ALIGN.CENTER)
+        if styles.get("slide_number", True):
+            _draw_text_box(draw, _scaled(SLIDE_NUMBER_BOX, scale), [f"{index + 1}/{total}"],
+                           footer_font, colors["footer_color"], PP_ALIGN.RIGHT)
+
+    output = io.BytesIO()
+    image.save(output, format="PNG", optimize=True)
+    return output.getvalue()
+
+
+class ThumbnailCache:
+    """
+    슬라이드 썸네일 PNG 캐시 (내용·템플릿 해시 키, LRU 방식)
+
+    같은 슬라이드를 다시 미리 볼 때 이미지를 다시 그리지 않는다.
+    """
+
+    def __init__(self, max_entries=THUMBNAIL_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_render(self, slide, template_name, template, index, total, width=THUMBNAIL_WIDTH):
+        """캐시된 썸네일 반환 (없으면 그려서 저장)"""
+        key = thumbnail_key(slide, template_name, index, total, width)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        png = render_thumbnail(slide, template, index, total, width)
+        with self._lock:
+            self._entries[key] = png
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return png
+
+    def clear(self):
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+
+# 앱 전체에서 공유하는 썸네일 캐시
+thumbnail_cache = ThumbnailCache()
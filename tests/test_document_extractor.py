@@ -0,0 +1,47 @@
+import io
+import os
+import sys
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from document_extractor import extract_text_from_hwpx
+
+HWPX_NAMESPACES = (
+    'xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section" '
+    'xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph"'
+)
+
+
+def _paragraph(*runs):
+    return "<hp:p>" + "".join(f"<hp:run>{run}</hp:run>" for run in runs) + "</hp:p>"
+
+
+def _table(rows):
+    cells = "".join(
+        "<hp:tr>" + "".join(f"<hp:tc><hp:subList>{cell}</hp:subList></hp:tc>" for cell in row) + "</hp:tr>"
+        for row in rows
+    )
+    return f"<hp:tbl>{cells}</hp:tbl>"
+
+
+def _make_hwpx(body):
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, "w") as archive:
+        archive.writestr("Contents/section0.xml", f'<?xml version="1.0" encoding="UTF-8"?><hs:sec {HWPX_NAMESPACES}>{body}</hs:sec>')
+    return output.getvalue()
+
+
+def test_hwpx_table():
+    table = _table([[_paragraph("<hp:t>항목</hp:t>"), _paragraph("<hp:t>예산</hp:t>")],
+                    [_paragraph("<hp:t>도로</hp:t>"), _paragraph("<hp:t>1,200</hp:t>")]])
+    text = extract_text_from_hwpx(_make_hwpx(_paragraph("<hp:t>예산 현황</hp:t>") + _paragraph(table)))
+    assert text == "예산 현황\n\n| 항목 | 예산 |\n| --- | --- |\n| 도로 | 1,200 |"
+
+
+def test_hwpx_nested_table_is_flattened_once():
+    inner = _table([[_paragraph("<hp:t>INNER</hp:t>"), _paragraph("<hp:t>A</hp:t>")],
+                    [_paragraph("<hp:t>B</hp:t>"), _paragraph("<hp:t>C</hp:t>")]])
+    outer = _table([[_paragraph("<hp:t>outer</hp:t>", inner), _paragraph("<hp:t>next</hp:t>")]])
+    text = extract_text_from_hwpx(_make_hwpx(_paragraph(outer)))
+    assert text == "| outer [INNER / A; B / C] | next |\n| --- | --- |"
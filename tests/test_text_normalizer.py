@@ -0,0 +1,32 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from text_normalizer import normalize_pages
+
+# 예산 표 (DOCX/HWPX 추출기가 만드는 마크다운 표 행)
+TABLE_ROWS = [
+    "| 도로 포장 및 보도 정비 사업 | 1,200,000,000 | 2025년 상반기 착공 |",
+    "| 버스 승강장 스마트 쉘터 설치 | 450,000,000 | 2025년 하반기 설치 |",
+    "| 교차로 신호 체계 개선 및 정비 | 380,000,000 | 2026년 상반기 완료 |",
+]
+
+
+def test_table_rows_are_not_joined():
+    text, _ = normalize_pages(["\n".join(["2025년 교통 예산 현황", *TABLE_ROWS])])
+    assert text.splitlines()[1:] == TABLE_ROWS
+
+
+def test_wrapped_line_is_not_joined_onto_table_row():
+    wrapped = "도로 포장 사업은 주민 설명회를 거쳐 관계 부서와 협의한 뒤 공사 구간과 착공 일정을 확정하여"
+    text, _ = normalize_pages(["\n".join([wrapped, "시민 여러분께 알려드릴 예정입니다.", *TABLE_ROWS])])
+    lines = text.splitlines()
+    assert lines[0] == wrapped + " 시민 여러분께 알려드릴 예정입니다."
+    assert lines[1:] == TABLE_ROWS
+
+
+def test_join_lines_false_keeps_line_structure():
+    lines = ["도로 포장 사업은 주민 설명회를 거쳐 관계 부서와 협의한 뒤 착공 일정을 확정하여", "알려드립니다."]
+    text, _ = normalize_pages(["\n".join(lines)], join_lines=False)
+    assert text.splitlines() == lines
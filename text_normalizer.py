@@ -0,0 +1,185 @@
+import re
+import math
+
+# 페이지 위/아래에서 머리글·바닥글 후보로 볼 줄 수
+EDGE_LINES = 3
+
+# 머리글·바닥글로 판단할 최소 반복 페이지 비율
+REPEAT_RATIO = 0.5
+
+# 끊긴 줄로 볼 최소 줄 길이 (전체 줄 길이 상위 10% 지점 대비 비율)
+WRAP_RATIO = 0.9
+
+# 번호 체계로 시작하는 줄이 이 비율 이상이면 개조식 문서로 보고 줄을 잇지 않음
+OUTLINE_LINE_RATIO = 0.3
+
+# 공문서 번호 체계 패턴 (숫자가 작을수록 상위 수준, Ⅰ./□/1./가./○/(1)/(가)/-/※ 순서)
+# ppt_generator의 빠른 초안 파서와 줄 정리가 함께 사용
+OUTLINE_PATTERNS = [
+    (1, re.compile(r"^(?:[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩ]+|[IVX]+)[.)]\s*(.+)$")),
+    (2, re.compile(r"^[□■]\s*(.+)$")),
+    (3, re.compile(r"^\d{1,2}[.)]\s+(.+)$")),
+    (4, re.compile(r"^[가-하][.)]\s*(.+)$")),
+    (5, re.compile(r"^[○●◦ㅇ]\s*(.+)$")),
+    (6, re.compile(r"^(?:\(\d{1,2}\)|[①-⑳])\s*(.+)$")),
+    (7, re.compile(r"^(?:\([가-하]\)|[가-하]\))\s*(.+)$")),
+    (8, re.compile(r"^[-–—·•*▶▷◆◇☞]\s*(.+)$")),
+    (9, re.compile(r"^※\s*(.+)$")),
+]
+
+# 미리 컴파일한 정규식 패턴
+_EDGE_DIGITS = re.compile(r"^\d+|\d+$")
+_PAGE_NUMBER = re.compile(
+    r"^(?:[-–—]\s*\d+\s*[-–—]|\d+\s*/\s*\d+|\d+|(?:page|p\.|페이지)\s*\d+(?:\s*/\s*\d+)?|\d+\s*(?:쪽|페이지))$",
+    re.IGNORECASE,
+)
+_HYPHEN_BREAK = re.compile(r"([A-Za-z])-\n([a-z])")
+_SPACES = re.compile(r"[ \t 　]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+_SENTENCE_END = re.compile(r"[.!?。:;)\]」』\"'”’]$|[다요함음됨임]\.?$")
+# 개조식 문장에서 흔한 명사형 끝말 (이 말로 끝나는 줄은 끝난 줄로 봄)
+_NOMINAL_END = re.compile(r"(?:예정|필요|대두|사항|완료|추진|실시|개최|검토|강화|확대|마련|구축|운영|지원|계획|현황|결과|요청|협조|중|등)$")
+_HANGUL = re.compile(r"[가-힣]")
+_NON_SPACE = re.compile(r"\S")
+
+
+def estimate_tokens(text):
+    """
+    프롬프트 토큰 수 추정
+
+    한글 음절은 1토큰, 그 외 공백이 아닌 문자는 4자당 1토큰으로 계산하는 근사치
+    """
+    hangul = len(_HANGUL.findall(text))
+    others = len(_NON_SPACE.findall(text)) - hangul
+    return hangul + math.ceil(others / 4)
+
+
+def _line_key(line):
+    """앞뒤 숫자를 무시한 비교용 키 (예: '계획서 3'과 '계획서 4'를 같은 줄로 취급)"""
+    return _EDGE_DIGITS.sub("#", line.strip())
+
+
+def _edge_indexes(lines):
+    """페이지 위/아래 가장자리에 있는 내용 줄의 인덱스 집합 (짧은 페이지는 첫 줄과 끝 줄만)"""
+    content = [index for index, line in enumerate(lines) if line]
+    depth = EDGE_LINES if len(content) > EDGE_LINES * 3 else 1
+    return set(content[:depth] + content[-depth:])
+
+
+def _find_repeated_lines(pages):
+    """여러 페이지의 위/아래 가장자리에 반복되는 줄(머리글·바닥글) 키 집합"""
+    if len(pages) < 3:
+        return set()
+
+    page_counts = {}
+    for lines in pages:
+        for key in {_line_key(lines[index]) for index in _edge_indexes(lines)}:
+            page_counts[key] = page_counts.get(key, 0) + 1
+
+    min_pages = max(3, math.ceil(len(pages) * REPEAT_RATIO))
+    return {key for key, count in page_counts.items() if count >= min_pages}
+
+
+def is_outline_line(line):
+    """번호 체계(OUTLINE_PATTERNS)로 시작하는 줄인지 여부"""
+    return any(pattern.match(line) for _, pattern in OUTLINE_PATTERNS)
+
+
+def _join_broken_lines(lines, wrap_width):
+    """
+    줄 폭에서 강제로 끊긴 문장을 다시 이어 붙임
+
+    앞 줄이 줄 폭을 거의 채웠고 문장·명사형 끝말로 끝나지 않았으며
+    다음 줄이 번호 체계로 시작하지 않을 때만 잇는다. 표 행(|로 시작)은 잇지 않는다.
+    """
+    merged = []
+    for line in lines:
+        if (
+            merged
+            and merged[-1]
+            and line
+            and len(merged[-1]) >= wrap_width
+            and not _SENTENCE_END.search(merged[-1])
+            and not _NOMINAL_END.search(merged[-1])
+            and not is_outline_line(line)
+            and not merged[-1].startswith("|")
+            and not line.startswith("|")
+        ):
+            merged[-1] = merged[-1] + " " + line
+        else:
+            merged.append(line)
+    return merged
+
+
+def normalize_pages(pages, join_lines=True):
+    """
+    추출된 페이지 텍스트를 프롬프트용으로 정리
+
+    - 여러 페이지에 반복되는 머리글/바닥글 제거
+    - 쪽 번호 줄 제거
+    - 영문 하이픈 줄바꿈 복원 및 줄 폭에서 끊긴 문장 연결 (번호 체계 위주의 개조식 문서는 줄을 잇지 않음)
+    - 연속 공백과 빈 줄 축소
+
+    Parameters:
+    pages (list): 페이지별 텍스트 리스트
+    join_lines (bool): 줄 폭에서 끊긴 줄을 이을지 여부 (강제 줄바꿈이 없는 DOCX/HWPX 텍스트는 False)
+
+    Returns:
+    tuple: (정리된 텍스트, 통계 dict)
+    """
+    original = "\n\n".join(pages)
+    page_lines = [[_SPACES.sub(" ", line).strip() for line in page.splitlines()] for page in pages]
+    repeated = _find_repeated_lines(page_lines)
+
+    # 줄 폭 기준: 전체 줄 길이의 상위 10% 지점의 WRAP_RATIO
+    lengths = sorted(len(line) for lines in page_lines for line in lines if line)
+    wrap_width = lengths[int(len(lengths) * 0.9)] * WRAP_RATIO if lengths else 0
+
+    # 개조식 문서는 번호 체계 파서(빠른 초안)가 줄 구조를 그대로 받아야 하므로 줄을 잇지 않음
+    content_lines = [line for lines in page_lines for line in lines if line]
+    outline_lines = sum(1 for line in content_lines if is_outline_line(line))
+    join_lines = join_lines and outline_lines < len(content_lines) * OUTLINE_LINE_RATIO
+
+    removed_lines = 0
+    cleaned_pages = []
+    for lines in page_lines:
+        edges = _edge_indexes(lines)
+        kept = []
+        for index, line in enumerate(lines):
+            if index in edges and (_line_key(line) in repeated or _PAGE_NUMBER.match(line)):
+                removed_lines += 1
+                continue
+            kept.append(line)
+        page_text = "\n".join(_join_broken_lines(kept, wrap_width) if join_lines else kept)
+        page_text = _HYPHEN_BREAK.sub(r"\1\2", page_text)
+        cleaned_pages.append(page_text.strip())
+
+    text = _BLANK_LINES.sub("\n\n", "\n\n".join(page for page in cleaned_pages if page))
+
+    original_tokens = estimate_tokens(original)
+    normalized_tokens = estimate_tokens(text)
+    stats = {
+        "original_chars": len(original),
+        "normalized_chars": len(text),
+        "original_tokens": original_tokens,
+        "normalized_tokens": normalized_tokens,
+        "saved_tokens": original_tokens - normalized_tokens,
+        "removed_lines": removed_lines,
+    }
+    return text, stats
+
+
+def normalize_text(text):
+    """페이지 구분이 없는 텍스트 정리 (공백·쪽 번호·끊긴 줄만 처리)"""
+    return normalize_pages([text])
+
+
+def format_stats(stats):
+    """정리 통계를 사용자 안내 문구로 변환"""
+    if stats["original_tokens"] == 0:
+        return "정리할 텍스트가 없습니다."
+    ratio = stats["saved_tokens"] / stats["original_tokens"] * 100
+    return (
+        f"프롬프트 정리: 추정 토큰 {stats['original_tokens']:,} → {stats['normalized_tokens']:,} "
+        f"({stats['saved_tokens']:,}개, {ratio:.1f}% 절감, 반복 머리글/바닥글 {stats['removed_lines']:,}줄 제거)"
+    )
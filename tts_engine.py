@@ -0,0 +1,1281 @@
+import os
+import re
+import csv
+import json
+import queue
+import zipfile
+import zlib
+import hashlib
+import shutil
+import subprocess
+import asyncio
+import inspect
+import threading
+import time
+import unicodedata
+import tempfile
+from abc import ABC, abstractmethod
+from io import BytesIO
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from gtts import gTTS
+
+# edge-tts 패키지 체크
+try:
+    import edge_tts
+    edge_tts_available = True
+    # edge-tts 7.0부터 단어 경계 이벤트를 받으려면 boundary 옵션을 지정해야 함
+    _edge_boundary_option = "boundary" in inspect.signature(edge_tts.Communicate.__init__).parameters
+except ImportError:
+    edge_tts_available = False
+    _edge_boundary_option = False
+
+# ffmpeg 실행 파일 체크 (없으면 음성 압축은 무음 정리만 수행)
+FFMPEG_PATH = shutil.which("ffmpeg")
+ffmpeg_available = FFMPEG_PATH is not None
+
+# 조각 하나의 목표 글자 수 (문장 경계에서 이 길이 근처로 나눔)
+TARGET_CHUNK_CHARS = 400
+
+# 바로 듣기 모드의 첫 조각 목표 글자 수 (첫 조각을 짧게 해 재생을 빨리 시작)
+FIRST_CHUNK_CHARS = 100
+
+# 동시에 합성할 최대 조각 수 (TTS 서비스에 보내는 동시 요청 상한)
+MAX_CONCURRENCY = 4
+
+# 조각 경계로 삼을 문장의 비율 (문장 해시를 이 값으로 나눈 나머지가 0이면 경계)
+ANCHOR_MODULUS = 4
+
+# 오디오 캐시 폴더와 최대 크기 (TTS_CACHE_DIR, TTS_CACHE_MAX_MB 환경 변수로 변경)
+AUDIO_CACHE_DIR = os.getenv("TTS_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "tts_audio_cache")
+AUDIO_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_MB", "500")) * 1024 * 1024
+
+# 일괄 변환에서 동시에 처리할 항목 수, 항목당 재시도 횟수, 재시도 대기 시간(초, 시도마다 늘어남)
+BATCH_CONCURRENCY = 2
+BATCH_RETRIES = 2
+BATCH_RETRY_DELAY = 1.0
+
+# Edge TTS 음성 목록 캐시 유효 시간(초)과 조회 실패 후 재시도 간격(초), 조회 제한 시간(초)
+VOICE_CATALOG_TTL = 24 * 60 * 60
+VOICE_CATALOG_RETRY = 60
+VOICE_CATALOG_TIMEOUT = 10
+
+# Edge TTS 조각 하나의 합성 제한 시간(초)
+EDGE_SYNTHESIS_TIMEOUT = 120
+
+# 자막 한 줄의 최대 글자 수와, 자막을 나눌 단어 사이 쉼 길이(초)
+CAPTION_MAX_CHARS = 32
+CAPTION_MAX_GAP = 0.6
+
+# 음성 압축 출력 형식 (형식 -> (ffmpeg 코덱, 컨테이너, MIME 형식, 확장자))와 비트레이트 선택지
+COMPACT_FORMATS = {
+    "mp3": ("libmp3lame", "mp3", "audio/mp3", "mp3"),
+    "ogg": ("libopus", "ogg", "audio/ogg", "ogg"),
+}
+COMPACT_BITRATES = ["24k", "32k", "48k", "64k"]
+COMPACT_DEFAULT_BITRATE = "32k"
+COMPACT_TIMEOUT = 300
+
+# 무음 정리 시 남길 쉼 길이(초) - 이보다 긴 무음 구간만 줄임
+SILENCE_KEEP_SECONDS = 0.3
+
+# 이어지는 공통 문장 묶음을 따로 합성할 최소 글자 수 (짧은 인사말까지 나누면 조각만 잘게 쪼개짐)
+SHARED_SENTENCE_MIN_CHARS = 15
+
+# 기본 대체 음성
+DEFAULT_EDGE_VOICE = "en-US-AriaNeural"
+
+# 화면에서 고른 모델 대신 사용할 엔진 (TTS_ENGINE=local 이면 네트워크 없이 부하 테스트)
+# 등록되지 않은 이름이면 파일 끝에서 경고를 출력하고 무시
+ENGINE_OVERRIDE = os.getenv("TTS_ENGINE")
+
+# 로컬 합성 엔진의 글자당 재생 시간(초, 1배속)과 단어 사이 쉼(초), 조각 앞뒤 무음(초)
+LOCAL_SECONDS_PER_CHAR = 0.12
+LOCAL_WORD_GAP = 0.05
+LOCAL_EDGE_SILENCE = 0.4
+
+# 미리 컴파일한 정규식 패턴
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?。…])[\"'”’)\]]*\s+|\n+")
+_CLAUSE_BREAK = re.compile(r"(?<=[,，、;:])\s+")
+_WHITESPACE = re.compile(r"\s+")
+_UNSAFE_FILE_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+
+def split_sentences(text):
+    """
+    한국어 문장 경계(마침표·물음표·느낌표·줄바꿈)로 텍스트 분할
+
+    Parameters:
+    text (str): 원문 텍스트
+
+    Returns:
+    list: 공백을 정리한 문장 리스트
+    """
+    return [sentence.strip() for sentence in _SENTENCE_BREAK.split(text) if sentence.strip()]
+
+
+def _split_long_sentence(sentence, target_chars):
+    """목표 길이보다 긴 문장을 쉼표, 그다음 띄어쓰기 위치에서 나눔"""
+    pieces = []
+    for clause in _CLAUSE_BREAK.split(sentence):
+        words = clause.split() if len(clause) > target_chars else [clause]
+        for word in words:
+            if pieces and len(pieces[-1]) + 1 + len(word) <= target_chars:
+                pieces[-1] = f"{pieces[-1]} {word}"
+            else:
+                pieces.append(word)
+    return pieces
+
+
+def _is_anchor(sentence):
+    """내용으로 정해지는 조각 경계 문장 여부 (편집한 곳 밖의 조각 경계가 바뀌지 않도록 함)"""
+    return zlib.crc32(sentence.encode("utf-8")) % ANCHOR_MODULUS == 0
+
+
+def chunk_text(text, target_chars=TARGET_CHUNK_CHARS, first_chunk_chars=None, shared=None):
+    """
+    문장 단위로 나눈 뒤 목표 글자 수 근처까지 이어 붙여 합성 조각 생성
+
+    목표 길이의 절반을 넘긴 조각은 경계 문장(_is_anchor)에서 닫으므로,
+    일부 문장만 고친 텍스트는 고친 부분의 조각만 달라져 캐시된 조각을 다시 쓸 수 있다.
+    이어지는 공통 문장(shared)은 앞뒤 문장과 합치지 않고 따로 한 조각으로 묶어 여러 텍스트에서 같은 조각으로 재사용한다.
+
+    Parameters:
+    text (str): 원문 텍스트
+    target_chars (int): 조각 하나의 목표 글자 수
+    first_chunk_chars (int, optional): 첫 조각만 이 글자 수를 넘기면 바로 닫음
+    shared (set, optional): 따로 조각으로 만들 공통 문장 집합 (normalize_for_cache로 정규화한 문장)
+
+    Returns:
+    list: 순서대로 정렬된 조각 텍스트 리스트
+    """
+    chunks = []
+    closed = True
+    block = []
+
+    def add(sentence):
+        nonlocal closed
+        parts = [sentence] if len(sentence) <= target_chars else _split_long_sentence(sentence, target_chars)
+        for part in parts:
+            if not closed and len(chunks[-1]) + 1 + len(part) <= target_chars:
+                chunks[-1] = f"{chunks[-1]} {part}"
+            else:
+                chunks.append(part)
+            closed = len(chunks[-1]) >= target_chars // 2 and _is_anchor(part)
+            if first_chunk_chars and len(chunks) == 1 and len(chunks[0]) >= first_chunk_chars:
+                closed = True
+
+    def flush_block():
+        # 공통 문장 묶음이 충분히 길면 혼자 한 조각, 짧으면 일반 문장처럼 이어 붙임
+        nonlocal closed
+        joined = " ".join(block)
+        if len(joined) >= SHARED_SENTENCE_MIN_CHARS:
+            chunks.append(joined)
+            closed = True
+        else:
+            for sentence in block:
+                add(sentence)
+        block.clear()
+
+    for sentence in split_sentences(text):
+        if shared and len(sentence) <= target_chars and normalize_for_cache(sentence) in shared:
+            if block and len(" ".join(block)) + 1 + len(sentence) > target_chars:
+                flush_block()
+            block.append(sentence)
+            continue
+        if block:
+            flush_block()
+        add(sentence)
+    if block:
+        flush_block()
+    return chunks
+
+
+def strip_id3(data):
+    """MP3 바이트 앞뒤의 ID3 태그를 떼고 오디오 프레임만 반환"""
+    start = 0
+    if data[:3] == b"ID3" and len(data) >= 10:
+        # ID3v2 크기는 7비트씩 나눈 synchsafe 정수, 바닥글 플래그가 있으면 10바이트 추가
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        start = 10 + size + (10 if data[5] & 0x10 else 0)
+    end = len(data)
+    if end - start >= 128 and data[end - 128:end - 125] == b"TAG":
+        end -= 128
+    return data[start:end]
+
+
+def concat_mp3(parts):
+    """
+    MP3 조각들을 다시 인코딩하지 않고 프레임 단위로 이어 붙임
+
+    Parameters:
+    parts (list): 순서대로 정렬된 MP3 바이트 리스트
+
+    Returns:
+    bytes: 하나로 합친 MP3 바이트
+    """
+    return b"".join(strip_id3(part) for part in parts)
+
+
+# MPEG 오디오 Layer III 비트레이트(kbps)와 샘플레이트(Hz) 표 (버전 비트 3=MPEG1, 2=MPEG2, 0=MPEG2.5)
+_MP3_BITRATES = {
+    True: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    False: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_MP3_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+def _iter_mp3_frames(data):
+    """MP3 바이트의 Layer III 프레임을 (시작 위치, 끝 위치, 재생 시간(초))으로 차례로 반환 (디코딩 없음)"""
+    position = 0
+    while position + 4 <= len(data):
+        header = data[position:position + 4]
+        if header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+            position += 1
+            continue
+        version = (header[1] >> 3) & 3
+        layer = (header[1] >> 1) & 3
+        bitrate_index = header[2] >> 4
+        rate_index = (header[2] >> 2) & 3
+        # Layer III 프레임 헤더가 아니면 다음 바이트에서 다시 찾음
+        if version == 1 or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+            position += 1
+            continue
+        mpeg1 = version == 3
+        samples = 1152 if mpeg1 else 576
+        sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+        bitrate = _MP3_BITRATES[mpeg1][bitrate_index] * 1000
+        size = samples // 8 * bitrate // sample_rate + ((header[2] >> 1) & 1)
+        yield position, position + size, samples / sample_rate
+        position += size
+
+
+def mp3_duration(data):
+    """MP3 프레임 헤더를 세어 재생 시간(초) 계산 (디코딩 없음)"""
+    return sum(seconds for _, _, seconds in _iter_mp3_frames(strip_id3(data)))
+
+
+def _frame_side_info(data, start, end):
+    """
+    Layer III 프레임의 사이드 정보 해석
+
+    Returns:
+    tuple: (main_data_begin(바이트), 무음 여부, 프레임의 주 데이터 영역 크기(바이트))
+    """
+    mpeg1 = (data[start + 1] >> 3) & 3 == 3
+    mono = data[start + 3] >> 6 == 3
+    channels = 1 if mono else 2
+    offset = start + 4 + (0 if data[start + 1] & 1 else 2)  # 보호 비트가 0이면 CRC 2바이트
+    if mpeg1:
+        side_bytes, begin_bits, private_bits, granules, block_bits = (17 if mono else 32), 9, (5 if mono else 3), 2, 59
+        header_bits = begin_bits + private_bits + 4 * channels
+    else:
+        side_bytes, begin_bits, private_bits, granules, block_bits = (9 if mono else 17), 8, (1 if mono else 2), 1, 63
+        header_bits = begin_bits + private_bits
+    side = int.from_bytes(data[offset:offset + side_bytes], "big")
+    total_bits = side_bytes * 8
+
+    def bits(position, count):
+        return (side >> (total_bits - position - count)) & ((1 << count) - 1)
+
+    # 모든 그래뉼·채널의 part2_3_length가 0이면 스펙트럼 데이터가 없는 완전한 무음 프레임
+    silent = all(bits(header_bits + block * block_bits, 12) == 0 for block in range(granules * channels))
+    return bits(0, begin_bits), silent, end - offset - side_bytes
+
+
+def trim_silence(data, keep_seconds=SILENCE_KEEP_SECONDS):
+    """
+    MP3에서 keep_seconds보다 긴 무음 프레임 구간을 keep_seconds만 남기고 줄임 (디코딩·재인코딩 없음)
+
+    조각을 이어 붙인 경계의 앞뒤 무음처럼 스펙트럼 데이터가 없는 프레임만 지우며,
+    다음 프레임이 비트 저장소(main_data_begin)로 참조하는 앞 프레임은 남겨 음질 손상이 없다.
+
+    Parameters:
+    data (bytes): MP3 바이트
+    keep_seconds (float): 무음 구간마다 남길 길이(초)
+
+    Returns:
+    tuple: (MP3 바이트, 지운 구간 [원래 시각(초), 지운 길이(초)] 리스트)
+    """
+    data = strip_id3(data)
+    output = bytearray()
+    removed = []
+    run = []
+    elapsed = 0.0
+
+    def flush(needed_bytes):
+        # 끝에서부터 keep_seconds와 다음 프레임이 참조하는 바이트를 채울 만큼 남김
+        kept_seconds, kept_bytes, keep_from = 0.0, 0, len(run)
+        while keep_from > 0 and (kept_seconds < keep_seconds or kept_bytes < needed_bytes):
+            keep_from -= 1
+            kept_seconds += run[keep_from][2]
+            kept_bytes += run[keep_from][4]
+        if keep_from:
+            removed.append([run[0][3], sum(frame[2] for frame in run[:keep_from])])
+        for start, end, _, _, _ in run[keep_from:]:
+            output.extend(data[start:end])
+        run.clear()
+
+    for start, end, seconds in _iter_mp3_frames(data):
+        if end > len(data):
+            break
+        main_data_begin, silent, data_bytes = _frame_side_info(data, start, end)
+        if silent:
+            run.append((start, end, seconds, elapsed, data_bytes))
+        else:
+            if run:
+                flush(main_data_begin)
+            output.extend(data[start:end])
+        elapsed += seconds
+    flush(0)
+    return bytes(output), removed
+
+
+def shift_words(words, removed):
+    """무음 정리로 지운 구간만큼 단어 경계 시각을 앞으로 당김"""
+    shifted = []
+    for start, duration, word in words:
+        shift = sum(length for position, length in removed if position < start)
+        shifted.append([max(0.0, start - shift), duration, word])
+    return shifted
+
+
+def reencode_audio(data, audio_format="mp3", bitrate=COMPACT_DEFAULT_BITRATE, mono=True):
+    """
+    ffmpeg로 음성을 다시 인코딩 (표준 입출력으로 스트리밍해 PCM을 파이썬 메모리에 올리지 않음)
+
+    Parameters:
+    data (bytes): MP3 바이트
+    audio_format (str): 출력 형식 (COMPACT_FORMATS의 키)
+    bitrate (str): 비트레이트 (예: 32k)
+    mono (bool): 모노로 변환할지 여부
+
+    Returns:
+    bytes: 인코딩된 음성 바이트
+    """
+    if not ffmpeg_available:
+        raise ValueError("음성 형식이나 비트레이트를 바꾸려면 ffmpeg가 필요합니다.")
+    codec, container, _, _ = COMPACT_FORMATS[audio_format]
+    command = [FFMPEG_PATH, "-hide_banner", "-loglevel", "error", "-f", "mp3", "-i", "pipe:0", "-vn"]
+    if mono:
+        command += ["-ac", "1"]
+    command += ["-c:a", codec, "-b:a", bitrate, "-f", container, "pipe:1"]
+    try:
+        result = subprocess.run(command, input=data, capture_output=True, timeout=COMPACT_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        raise Exception("음성 압축 오류: 제한 시간을 넘었습니다.")
+    if result.returncode != 0 or not result.stdout:
+        raise Exception(f"음성 압축 오류: {result.stderr.decode('utf-8', 'replace').strip()}")
+    return result.stdout
+
+
+def compact_audio(data, audio_format="mp3", bitrate=None, mono=True, trim=True, keep_seconds=SILENCE_KEEP_SECONDS):
+    """
+    다운로드용 음성 압축 (긴 무음 정리 후 필요하면 형식·비트레이트를 바꿔 다시 인코딩)
+
+    Parameters:
+    data (bytes): MP3 바이트
+    audio_format (str): 출력 형식 (COMPACT_FORMATS의 키)
+    bitrate (str, optional): 비트레이트 (None이면 MP3는 다시 인코딩하지 않음)
+    mono (bool): 다시 인코딩할 때 모노로 변환할지 여부 (MP3에 bitrate가 None이면 적용되지 않음)
+    trim (bool): 긴 무음 구간을 줄일지 여부
+    keep_seconds (float): 무음 구간마다 남길 길이(초)
+
+    Returns:
+    tuple: (음성 바이트, 정보 dict {"original_bytes", "compact_bytes", "removed", "trimmed_seconds", "mime", "extension"})
+    """
+    original_bytes = len(data)
+    removed = []
+    if trim:
+        data, removed = trim_silence(data, keep_seconds)
+    if audio_format != "mp3" or bitrate:
+        data = reencode_audio(data, audio_format, bitrate or COMPACT_DEFAULT_BITRATE, mono)
+    _, _, mime, extension = COMPACT_FORMATS[audio_format]
+    return data, {
+        "original_bytes": original_bytes,
+        "compact_bytes": len(data),
+        "removed": removed,
+        "trimmed_seconds": sum(length for _, length in removed),
+        "mime": mime,
+        "extension": extension,
+    }
+
+
+# 자막 구간을 끝내는 문장 부호
+_CUE_END = (".", "?", "!", "。", "？", "！")
+
+
+def build_cues(words, max_chars=CAPTION_MAX_CHARS, max_gap=CAPTION_MAX_GAP):
+    """
+    단어 경계 목록을 자막 구간으로 묶음 (문장이 끝나거나 글자 수 한도, 긴 쉼에서 새 구간)
+
+    Parameters:
+    words (list): [시작(초), 길이(초), 단어] 리스트
+    max_chars (int): 자막 한 구간의 최대 글자 수
+    max_gap (float): 이 시간(초)보다 길게 쉬면 구간을 나눔
+
+    Returns:
+    list: [시작(초), 끝(초), 자막 텍스트] 리스트
+    """
+    cues = []
+    for start, duration, word in words:
+        if (cues and not cues[-1][2].endswith(_CUE_END) and len(cues[-1][2]) + 1 + len(word) <= max_chars
+                and start - cues[-1][1] <= max_gap):
+            cues[-1][1] = start + duration
+            cues[-1][2] = f"{cues[-1][2]} {word}"
+        else:
+            cues.append([start, start + duration, word])
+    return cues
+
+
+def _timestamp(seconds, separator):
+    """초를 자막 시각 문자열로 변환 (예: 00:01:02,345)"""
+    milliseconds = int(round(seconds * 1000))
+    hours, milliseconds = divmod(milliseconds, 3600000)
+    minutes, milliseconds = divmod(milliseconds, 60000)
+    secs, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{milliseconds:03d}"
+
+
+def format_srt(cues):
+    """자막 구간을 SRT 형식 문자열로 변환"""
+    blocks = [
+        f"{number}\n{_timestamp(start, ',')} --> {_timestamp(end, ',')}\n{text}\n"
+        for number, (start, end, text) in enumerate(cues, 1)
+    ]
+    return "\n".join(blocks)
+
+
+def format_vtt(cues):
+    """자막 구간을 WebVTT 형식 문자열로 변환"""
+    blocks = [f"{_timestamp(start, '.')} --> {_timestamp(end, '.')}\n{text}\n" for start, end, text in cues]
+    return "WEBVTT\n\n" + "\n".join(blocks)
+
+
+def normalize_for_cache(text):
+    """캐시 키용 텍스트 정규화 (유니코드 NFC, 연속 공백 하나로)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def find_shared_sentences(texts, min_count=2):
+    """
+    여러 텍스트에 걸쳐(또는 한 텍스트 안에서) 반복되는 문장 찾기 (고정 인사말·맺음말 등)
+
+    Parameters:
+    texts (list): 텍스트 리스트
+    min_count (int): 공통 문장으로 볼 최소 등장 횟수
+
+    Returns:
+    set: normalize_for_cache로 정규화한 공통 문장 집합
+    """
+    counts = Counter()
+    for text in texts:
+        counts.update(normalize_for_cache(sentence) for sentence in split_sentences(text))
+    return {sentence for sentence, count in counts.items() if count >= min_count}
+
+
+class AudioCache:
+    """
+    TTS 오디오 캐시 클래스
+    (엔진, 음성, 언어, 속도, 정규화 텍스트)의 SHA-256 해시를 키로 디스크에 MP3를 보관하고
+    전체 크기(부가 정보 .json 포함)가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+    """
+    def __init__(self, cache_dir=AUDIO_CACHE_DIR, max_bytes=AUDIO_CACHE_MAX_BYTES):
+        """
+        오디오 캐시 초기화
+
+        Parameters:
+        cache_dir (str): 캐시 폴더 경로
+        max_bytes (int): 캐시 최대 크기 (바이트)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # 기존 캐시 파일을 마지막 사용 시각(수정 시각) 순으로 색인
+        files = []
+        for name in os.listdir(cache_dir):
+            if name.endswith(".mp3"):
+                stat = os.stat(os.path.join(cache_dir, name))
+                files.append((stat.st_mtime, name[:-4], stat.st_size + self._meta_size(name[:-4])))
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+
+        # 누적 적중 통계 (프로세스를 다시 시작해도 유지)
+        try:
+            with open(self._stats_path(), "r", encoding="utf-8") as file:
+                saved = json.load(file)
+            self.hits, self.misses = saved.get("hits", 0), saved.get("misses", 0)
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def make_key(engine, voice, language, speed, text):
+        """합성 설정과 정규화한 텍스트로 캐시 키 생성"""
+        data = json.dumps([engine, voice, language, round(float(speed), 2), normalize_for_cache(text)], ensure_ascii=False)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".mp3")
+
+    def _meta_path(self, key):
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def _stats_path(self):
+        return os.path.join(self.cache_dir, "stats.json")
+
+    def _meta_size(self, key):
+        """부가 정보 파일 크기 (없으면 0)"""
+        try:
+            return os.path.getsize(self._meta_path(key))
+        except OSError:
+            return 0
+
+    def get(self, key):
+        """캐시된 오디오 조회 (없으면 None)"""
+        with self._lock:
+            known = key in self._entries
+        if known:
+            try:
+                with open(self._path(key), "rb") as file:
+                    data = file.read()
+                # 수정 시각을 갱신해 다시 시작해도 최근 사용 순서 유지
+                os.utime(self._path(key))
+            except OSError:
+                data = None
+        else:
+            data = None
+
+        with self._lock:
+            if data is None:
+                self.misses += 1
+                if known:
+                    self._total_bytes -= self._entries.pop(key, 0)
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+        return data
+
+    def get_meta(self, key):
+        """오디오와 함께 저장한 부가 정보(단어 경계 등) 조회 (없으면 None)"""
+        try:
+            with open(self._meta_path(key), "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, data, meta=None):
+        """오디오(와 부가 정보)를 캐시에 저장하고 한도를 넘으면 오래된 항목 삭제"""
+        temp_path = self._path(key) + f".{threading.get_ident()}.tmp"
+        try:
+            if meta is not None:
+                with open(temp_path, "w", encoding="utf-8") as file:
+                    json.dump(meta, file, ensure_ascii=False)
+                os.replace(temp_path, self._meta_path(key))
+            with open(temp_path, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, self._path(key))
+        except OSError as e:
+            print(f"오디오 캐시 저장 오류: {e}")
+            return
+
+        size = len(data) + self._meta_size(key)
+        evicted = []
+        with self._lock:
+            self._total_bytes += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                old_key, size = self._entries.popitem(last=False)
+                self._total_bytes -= size
+                evicted.append(old_key)
+        for old_key in evicted:
+            for path in (self._path(old_key), self._meta_path(old_key)):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def save_stats(self):
+        """누적 적중 통계를 파일에 저장"""
+        with self._lock:
+            stats = {"hits": self.hits, "misses": self.misses}
+        try:
+            with open(self._stats_path(), "w", encoding="utf-8") as file:
+                json.dump(stats, file)
+        except OSError as e:
+            print(f"오디오 캐시 통계 저장 오류: {e}")
+
+    def stats(self):
+        """
+        캐시 통계
+
+        Returns:
+        dict: hits, misses, hit_rate(%), entries, size_mb, max_mb
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups * 100 if lookups else 0.0,
+                "entries": len(self._entries),
+                "size_mb": self._total_bytes / (1024 * 1024),
+                "max_mb": self.max_bytes / (1024 * 1024),
+            }
+
+
+# 프로세스 전체에서 공유하는 오디오 캐시
+audio_cache = AudioCache()
+
+
+class SynthesisWindow:
+    """
+    합성 창 클래스 (일괄 변환 한 번처럼 함께 처리하는 범위)
+    창 안에서 같은 키의 조각은 한 번만 합성하고, 동시에 요청되면 먼저 시작한 합성 결과를 함께 기다려 사용
+    """
+    def __init__(self):
+        """합성 창 초기화"""
+        self._lock = threading.Lock()
+        self._futures = {}
+        self.requests = 0
+        self.syntheses = 0
+
+    def run(self, key, synthesize):
+        """
+        키별로 한 번만 합성 (실패하면 결과를 남기지 않아 재시도할 때 다시 합성)
+
+        Parameters:
+        key (hashable): 조각 키 (엔진, 음성, 언어, 속도, 텍스트를 구분해야 함)
+        synthesize (callable): 인자 없이 합성 결과를 반환하는 함수
+
+        Returns:
+        합성 결과 (synthesize의 반환값)
+        """
+        with self._lock:
+            self.requests += 1
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._futures[key] = future
+                self.syntheses += 1
+        if owner:
+            try:
+                future.set_result(synthesize())
+            except Exception as e:
+                with self._lock:
+                    self._futures.pop(key, None)
+                    self.syntheses -= 1
+                future.set_exception(e)
+        return future.result()
+
+    def add_cached(self, count):
+        """오디오 캐시에서 바로 가져온 공통 조각 수를 요청 수에 더함 (합성 없이 재사용한 횟수)"""
+        with self._lock:
+            self.requests += count
+
+    def stats(self):
+        """합성 창 통계 (조각 요청 수, 실제 합성 수, 줄인 합성 수)"""
+        with self._lock:
+            return {"requests": self.requests, "syntheses": self.syntheses, "saved": self.requests - self.syntheses}
+
+
+def synthesize_chunked(text, synthesize, target_chars=TARGET_CHUNK_CHARS, max_workers=MAX_CONCURRENCY,
+                       on_progress=None, cache=None, cache_params=None, on_ready=None, first_chunk_chars=None,
+                       with_timing=False, shared=None, window=None):
+    """
+    긴 텍스트를 조각으로 나누어 동시에 합성한 뒤 순서대로 이어 붙임
+
+    cache와 cache_params가 주어지면 조각마다 캐시를 먼저 확인하고, 캐시에 없는 조각만 합성한다.
+    공통 문장 조각과 한 텍스트 안에서 반복되는 조각은 합성 창(window)에서 한 번만 합성해 필요한 곳마다 이어 붙인다.
+
+    Parameters:
+    text (str): 합성할 텍스트 (길이 제한 없음)
+    synthesize (callable): 조각 텍스트를 받아 MP3 바이트를 반환하는 함수
+    target_chars (int): 조각 하나의 목표 글자 수
+    max_workers (int): 동시에 합성할 최대 조각 수
+    on_progress (callable, optional): (완료 조각 수, 전체 조각 수)를 받는 진행률 콜백 (호출한 스레드에서 실행)
+    cache (AudioCache, optional): 조각 단위 오디오 캐시 (cache_params와 함께 지정)
+    cache_params (tuple, optional): 캐시 키용 (엔진, 음성, 언어, 속도)
+    on_ready (callable, optional): 앞에서부터 이어서 준비된 조각들을 (시작 순서, MP3 바이트 리스트)로 받는 콜백
+                                   (호출한 스레드에서 실행, 바로 듣기용)
+    first_chunk_chars (int, optional): 첫 조각 목표 글자 수 (바로 듣기 시작을 앞당김)
+    with_timing (bool): True이면 synthesize가 (MP3 바이트, 단어 경계 리스트)를 반환하고,
+                        조각별 단어 경계를 전체 오디오 기준 시각으로 합쳐 함께 반환
+    shared (set, optional): 따로 조각으로 만들 공통 문장 집합 (find_shared_sentences 결과)
+    window (SynthesisWindow, optional): 여러 텍스트가 함께 쓰는 합성 창 (없으면 이 텍스트 안에서만 중복 제거)
+
+    Returns:
+    bytes: 전체 MP3 바이트 (with_timing이면 (MP3 바이트, [시작(초), 길이(초), 단어] 리스트))
+    """
+    if cache is not None and cache_params is None:
+        raise ValueError("캐시를 사용하려면 cache_params(엔진, 음성, 언어, 속도)가 필요합니다.")
+    chunks = chunk_text(text, target_chars, first_chunk_chars, shared)
+    if not chunks:
+        raise ValueError("합성할 텍스트가 없습니다.")
+
+    results = [None] * len(chunks)
+    timings = [None] * len(chunks)
+    keys = [None] * len(chunks)
+    pending = []
+    for index, chunk in enumerate(chunks):
+        if cache_params is not None:
+            keys[index] = AudioCache.make_key(*cache_params, chunk)
+        if cache is not None:
+            results[index] = cache.get(keys[index])
+            # 단어 경계가 필요한데 캐시에 없으면 다시 합성
+            if with_timing and results[index] is not None:
+                timings[index] = cache.get_meta(keys[index])
+                if timings[index] is None:
+                    results[index] = None
+        if results[index] is None:
+            pending.append(index)
+
+    # 앞에서부터 빈틈없이 준비된 조각을 순서대로 전달
+    next_ready = 0
+    def emit_ready():
+        nonlocal next_ready
+        start = next_ready
+        while next_ready < len(chunks) and results[next_ready] is not None:
+            next_ready += 1
+        if on_ready and next_ready > start:
+            on_ready(start, results[start:next_ready])
+
+    done = len(chunks) - len(pending)
+    if on_progress and done:
+        on_progress(done, len(chunks))
+    emit_ready()
+
+    # 공통 문장 조각과 이 텍스트 안에서 반복되는 조각은 합성 창을 거쳐 한 번만 합성
+    window = window or SynthesisWindow()
+    texts = [normalize_for_cache(chunk) for chunk in chunks]
+    repeats = Counter(texts[index] for index in pending)
+    def is_shared(index):
+        return bool(shared) and all(normalize_for_cache(sentence) in shared for sentence in split_sentences(chunks[index]))
+    window.add_cached(sum(1 for index in range(len(chunks)) if results[index] is not None and is_shared(index)))
+    def synthesize_once(index):
+        if repeats[texts[index]] > 1 or is_shared(index):
+            key = keys[index] or (synthesize, texts[index])
+            return window.run(key, lambda: synthesize(chunks[index]))
+        return synthesize(chunks[index])
+
+    if pending:
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(pending)))
+        try:
+            futures = {executor.submit(synthesize_once, index): index for index in pending}
+            for future in as_completed(futures):
+                index = futures[future]
+                if with_timing:
+                    results[index], timings[index] = future.result()
+                else:
+                    results[index] = future.result()
+                if cache is not None:
+                    cache.put(keys[index], results[index], timings[index])
+                done += 1
+                if on_progress:
+                    on_progress(done, len(chunks))
+                emit_ready()
+        except BaseException:
+            # 조각 합성 실패나 콜백 중단(Streamlit 재실행은 BaseException)이면 남은 조각을 취소하고 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+    if cache is not None:
+        cache.save_stats()
+    if not with_timing:
+        return concat_mp3(results)
+
+    # 조각별 단어 경계를 앞 조각들의 재생 시간만큼 밀어 전체 기준으로 합침
+    words = []
+    offset = 0.0
+    for audio, chunk_words in zip(results, timings):
+        words.extend([start + offset, duration, word] for start, duration, word in chunk_words)
+        offset += mp3_duration(audio)
+    return concat_mp3(results), words
+
+
+def parse_batch_csv(data):
+    """
+    일괄 변환 CSV 읽기 (열: filename, text, voice - voice는 생략 가능)
+
+    Parameters:
+    data (bytes): CSV 파일 바이트 (UTF-8 또는 엑셀에서 저장한 CP949)
+
+    Returns:
+    list: {"name", "text", "voice"} dict 리스트
+    """
+    try:
+        content = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        content = data.decode("cp949")
+
+    items = []
+    reader = csv.DictReader(content.splitlines())
+    for row in reader:
+        # 머리글보다 열이 많으면 DictReader가 남는 값을 None 키에 리스트로 넣음 (따옴표 없는 쉼표)
+        if None in row:
+            raise ValueError(f"CSV {reader.line_num}번째 줄의 열 개수가 머리글보다 많습니다. "
+                             "text에 쉼표가 있으면 큰따옴표(\"...\")로 감싸 주세요.")
+        row = {(key or "").strip().lower(): (value or "").strip() for key, value in row.items()}
+        if not row.get("text"):
+            continue
+        items.append({"name": row.get("filename") or f"item_{len(items) + 1}", "text": row["text"], "voice": row.get("voice", "")})
+    if not items and content.strip():
+        raise ValueError("CSV에 text 열이 없거나 내용이 비어 있습니다. (열: filename, text, voice)")
+    return items
+
+
+def batch_file_name(name, used, extension="mp3"):
+    """ZIP 안에서 겹치지 않는 안전한 음성 파일 이름"""
+    base = _UNSAFE_FILE_CHARS.sub("_", os.path.splitext(os.path.basename(name))[0]).strip() or "audio"
+    file_name = f"{base}.{extension}"
+    number = 2
+    while file_name in used:
+        file_name = f"{base}_{number}.{extension}"
+        number += 1
+    used.add(file_name)
+    return file_name
+
+
+def synthesize_batch(items, synthesize_item, max_workers=BATCH_CONCURRENCY, retries=BATCH_RETRIES, on_status=None,
+                     extension="mp3"):
+    """
+    여러 항목을 제한된 동시 처리 수로 합성해 ZIP으로 묶음 (완료되는 대로 ZIP에 추가)
+
+    Parameters:
+    items (list): {"name", "text", "voice"} dict 리스트
+    synthesize_item (callable): 항목 dict를 받아 음성 바이트를 반환하는 함수 (작업 스레드에서 실행)
+    max_workers (int): 동시에 처리할 최대 항목 수
+    retries (int): 실패한 항목의 재시도 횟수
+    on_status (callable, optional): 상태가 바뀔 때마다 항목별 상태 리스트를 받는 콜백 (호출한 스레드에서 실행)
+    extension (str): ZIP 안 음성 파일 확장자
+
+    Returns:
+    tuple: (ZIP 바이트, 항목별 상태 dict 리스트 {"name", "file", "status", "attempts", "error"})
+    """
+    used = set()
+    statuses = [
+        {"name": item["name"], "file": batch_file_name(item["name"], used, extension), "status": "대기", "attempts": 0, "error": ""}
+        for item in items
+    ]
+    events = queue.Queue()
+    stop = threading.Event()
+
+    def work(index):
+        for attempt in range(1, retries + 2):
+            if stop.is_set():
+                return
+            events.put((index, "진행 중", attempt, "", None))
+            try:
+                events.put((index, "완료", attempt, "", synthesize_item(items[index])))
+                return
+            except Exception as e:
+                if attempt > retries:
+                    events.put((index, "실패", attempt, str(e), None))
+                    return
+                events.put((index, "재시도 대기", attempt, str(e), None))
+                stop.wait(BATCH_RETRY_DELAY * attempt)
+
+    buffer = BytesIO()
+    # MP3, OGG는 이미 압축된 형식이라 ZIP에는 압축 없이 저장
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        if items:
+            executor = ThreadPoolExecutor(max_workers=min(max_workers, len(items)))
+            try:
+                for index in range(len(items)):
+                    executor.submit(work, index)
+                remaining = len(items)
+                while remaining:
+                    index, status, attempt, error, data = events.get()
+                    statuses[index].update(status=status, attempts=attempt, error=error)
+                    if status == "완료":
+                        archive.writestr(statuses[index]["file"], data)
+                    if status in ("완료", "실패"):
+                        remaining -= 1
+                    if on_status:
+                        on_status(statuses)
+            except BaseException:
+                # 콜백 중단(Streamlit 재실행)이면 대기 중인 항목을 취소하고 진행 중인 항목의 재시도도 멈춤
+                stop.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
+    return buffer.getvalue(), statuses
+
+
+def synthesize_google(text, lang, speed=1.0):
+    """Google TTS로 음성 생성 (0.9배 미만이면 느린 음성)"""
+    try:
+        tts = gTTS(text=text, lang=lang, slow=(speed < 0.9))
+        audio_bytes = BytesIO()
+        tts.write_to_fp(audio_bytes)
+        return audio_bytes.getvalue()
+    except Exception as e:
+        raise Exception(f"Google TTS 오류: {str(e)}")
+
+
+def edge_rate(speed):
+    """속도 배율을 edge-tts rate 문자열로 변환 (예: 1.2 -> '+20%')"""
+    return f"{int(round((speed - 1.0) * 100)):+d}%"
+
+
+class AsyncLoopThread:
+    """
+    백그라운드 asyncio 이벤트 루프 스레드 클래스
+    프로세스당 하나의 루프를 계속 실행해 두고, 다른 스레드에서 코루틴을 제출해 결과를 받음
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop = None
+
+    def _ensure_started(self):
+        """처음 사용할 때 이벤트 루프와 스레드 시작"""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="tts-async-loop", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro, timeout=None):
+        """
+        코루틴을 루프에서 실행하고 결과를 기다림 (여러 스레드에서 동시에 호출 가능)
+
+        Parameters:
+        coro (coroutine): 실행할 코루틴
+        timeout (float, optional): 최대 대기 시간(초). 넘으면 작업을 취소하고 TimeoutError 발생
+
+        Returns:
+        코루틴의 반환값
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+        try:
+            return future.result(timeout)
+        except Exception:
+            # 시간 초과 등으로 기다림을 멈추면 루프의 작업도 취소
+            future.cancel()
+            raise
+
+
+# 프로세스 전체에서 공유하는 비동기 작업 루프
+async_worker = AsyncLoopThread()
+
+
+async def list_edge_voices():
+    """Edge TTS 음성 목록 조회"""
+    try:
+        voices = await asyncio.wait_for(edge_tts.VoicesManager.create(), VOICE_CATALOG_TIMEOUT)
+        return voices.voices
+    except Exception as e:
+        raise Exception(f"음성 목록 가져오기 실패: {str(e)}")
+
+
+class VoiceCatalog:
+    """
+    Edge TTS 음성 목록 캐시 클래스
+    프로세스당 한 번 목록을 받아 두고, 유효 시간이 지나면 기존 목록을 쓰면서 백그라운드 스레드로 갱신
+    """
+    def __init__(self, ttl=VOICE_CATALOG_TTL):
+        """
+        음성 목록 캐시 초기화
+
+        Parameters:
+        ttl (int): 목록 유효 시간 (초)
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._voices = []
+        self._names = frozenset()
+        self._by_language = {}
+        self._loaded_at = 0.0
+        self._failed_at = 0.0
+        self._refreshing = False
+
+    def _fetch(self):
+        """음성 목록을 받아 이름 집합과 언어별 색인을 새로 만듦"""
+        voices = async_worker.submit(list_edge_voices(), VOICE_CATALOG_TIMEOUT + 5)
+
+        by_language = {}
+        for voice in sorted(voices, key=lambda v: v["ShortName"]):
+            by_language.setdefault(voice["ShortName"].split("-")[0], []).append(voice["ShortName"])
+        with self._lock:
+            self._voices = voices
+            self._names = frozenset(voice["ShortName"] for voice in voices)
+            self._by_language = by_language
+            self._loaded_at = time.time()
+
+    def _refresh_in_background(self):
+        """백그라운드 갱신 스레드 본문 (실패하면 기존 목록 유지)"""
+        try:
+            self._fetch()
+        except Exception:
+            with self._lock:
+                self._failed_at = time.time()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _ensure_loaded(self):
+        """목록이 없으면 바로 받고, 오래되었으면 백그라운드 갱신 시작"""
+        if not edge_tts_available:
+            return
+        now = time.time()
+        with self._lock:
+            loaded = bool(self._names)
+            expired = now - self._loaded_at > self.ttl
+            recently_failed = now - self._failed_at < VOICE_CATALOG_RETRY
+            start_refresh = loaded and expired and not self._refreshing and not recently_failed
+            if start_refresh:
+                self._refreshing = True
+        if start_refresh:
+            threading.Thread(target=self._refresh_in_background, daemon=True).start()
+        elif not loaded and not recently_failed:
+            try:
+                self._fetch()
+            except Exception:
+                with self._lock:
+                    self._failed_at = time.time()
+
+    def voices(self, locale_prefix=None):
+        """
+        음성 정보 리스트 (ShortName, Gender, Locale 등)
+
+        Parameters:
+        locale_prefix (str, optional): Locale 접두어 (예: "ko", "zh-CN")
+
+        Returns:
+        list: 이름순 음성 dict 리스트 (목록을 받지 못하면 빈 리스트)
+        """
+        self._ensure_loaded()
+        with self._lock:
+            voices = self._voices
+        if locale_prefix:
+            voices = [voice for voice in voices if voice["Locale"].startswith(locale_prefix)]
+        return sorted(voices, key=lambda v: v["ShortName"])
+
+    def is_available(self, voice_name):
+        """음성 이름이 목록에 있는지 확인 (집합 조회)"""
+        self._ensure_loaded()
+        return voice_name in self._names
+
+    def resolve(self, voice_name):
+        """
+        사용할 수 있는 음성으로 확인 (없으면 같은 언어의 다른 음성이나 기본 음성)
+
+        Returns:
+        tuple: (음성 이름, 대체 안내 메시지 또는 None)
+        """
+        self._ensure_loaded()
+        with self._lock:
+            names, by_language = self._names, self._by_language
+        # 목록을 받지 못한 경우에는 선택한 음성으로 그대로 시도
+        if not names or voice_name in names:
+            return voice_name, None
+
+        matching_voices = by_language.get(voice_name.split("-")[0])
+        if matching_voices:
+            return matching_voices[0], f"지정한 음성을 찾을 수 없어 {matching_voices[0]}(으)로 대체합니다."
+        return DEFAULT_EDGE_VOICE, f"호환되는 음성을 찾을 수 없어 기본 음성({DEFAULT_EDGE_VOICE})을 사용합니다."
+
+
+# 프로세스 전체에서 공유하는 음성 목록 캐시
+voice_catalog = VoiceCatalog()
+
+
+def resolve_edge_voice(voice_name):
+    """사용할 수 있는 Edge TTS 음성으로 확인 (voice_catalog.resolve 참조)"""
+    return voice_catalog.resolve(voice_name)
+
+
+async def synthesize_edge_async(text, voice_name, speed=1.0, with_timing=False):
+    """
+    Edge TTS 패키지 API로 음성 생성 (스트림을 한 번 읽으며 오디오와 단어 경계를 함께 모음)
+
+    Returns:
+    bytes: MP3 바이트 (with_timing이면 (MP3 바이트, [시작(초), 길이(초), 단어] 리스트))
+    """
+    options = {"rate": edge_rate(speed)}
+    if with_timing and _edge_boundary_option:
+        options["boundary"] = "WordBoundary"
+    communicate = edge_tts.Communicate(text, voice_name, **options)
+
+    audio = bytearray()
+    words = []
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            audio.extend(chunk["data"])
+        elif chunk["type"] == "WordBoundary":
+            # offset, duration은 100나노초 단위
+            words.append([chunk["offset"] / 1e7, chunk["duration"] / 1e7, chunk["text"]])
+    return (bytes(audio), words) if with_timing else bytes(audio)
+
+
+def synthesize_edge(text, voice_name, speed=1.0, with_timing=False):
+    """Edge TTS로 음성 생성 (백그라운드 이벤트 루프에서 실행하고 메모리에서 바이트로 받음)"""
+    if not edge_tts_available:
+        raise Exception("Microsoft Edge TTS를 사용하려면 edge-tts 패키지가 필요합니다.")
+    try:
+        return async_worker.submit(synthesize_edge_async(text, voice_name, speed, with_timing), EDGE_SYNTHESIS_TIMEOUT)
+    except Exception as e:
+        raise Exception(f"Edge TTS 오류: {str(e) or type(e).__name__}")
+
+
+class TTSEngine(ABC):
+    """
+    TTS 엔진 인터페이스
+    조각 하나를 MP3 바이트로 합성하는 synthesize를 구현하고 register_engine으로 등록하면
+    화면과 조각 합성, 캐시, 일괄 변환에서 같은 방식으로 사용할 수 있음
+    (synthesize를 구현하지 않은 엔진은 인스턴스를 만들 때 TypeError 발생)
+    """
+    name = None
+    label = None
+    supports_timing = False
+
+    @abstractmethod
+    def synthesize(self, text, voice, language, speed=1.0, with_timing=False):
+        """
+        조각 하나를 음성으로 합성
+
+        Parameters:
+        text (str): 합성할 텍스트
+        voice (str): 음성 이름 (음성을 고를 수 없는 엔진은 무시)
+        language (str): 언어 코드 (예: ko)
+        speed (float): 속도 배율
+        with_timing (bool): 단어 경계도 함께 반환할지 여부 (supports_timing인 엔진만)
+
+        Returns:
+        bytes: MP3 바이트 (with_timing이면 (MP3 바이트, [시작(초), 길이(초), 단어] 리스트))
+        """
+
+
+class GoogleEngine(TTSEngine):
+    """gTTS 엔진 어댑터 (음성 선택, 단어 경계 없음)"""
+    name = "google"
+    label = "Google TTS"
+
+    def synthesize(self, text, voice, language, speed=1.0, with_timing=False):
+        if with_timing:
+            raise ValueError("Google TTS는 단어 경계 정보를 제공하지 않습니다.")
+        return synthesize_google(text, language, speed)
+
+
+class EdgeEngine(TTSEngine):
+    """edge-tts 엔진 어댑터"""
+    name = "edge"
+    label = "Microsoft Edge TTS"
+    supports_timing = True
+
+    def synthesize(self, text, voice, language, speed=1.0, with_timing=False):
+        return synthesize_edge(text, voice, speed, with_timing)
+
+
+# 로컬 합성 엔진이 만드는 MP3 프레임 (MPEG2 Layer III, 48kbps, 24kHz, 모노 - 프레임당 0.024초, 144바이트)
+_LOCAL_FRAME_HEADER = bytes([0xFF, 0xF3, 0x64, 0xC4])
+_LOCAL_FRAME_SECONDS = 576 / 24000
+_LOCAL_FRAME_BYTES = 144
+
+
+class LocalEngine(TTSEngine):
+    """
+    네트워크 없이 쓰는 결정적 로컬 합성 엔진 (테스트와 벤치마크용)
+    글자 수에 비례하는 길이의 MP3와 단어 경계를 만들고, 같은 입력에는 항상 같은 바이트를 반환
+    (단어 구간은 데이터가 있는 프레임, 단어 사이와 조각 앞뒤 쉼은 무음 프레임 - 재생하면 모두 무음)
+    latency로 TTS 서비스의 응답 지연을 흉내 낼 수 있음
+    """
+    name = "local"
+    label = "로컬 합성 엔진 (테스트용)"
+    supports_timing = True
+
+    def __init__(self, seconds_per_char=LOCAL_SECONDS_PER_CHAR, latency=0.0, latency_per_char=0.0):
+        """
+        로컬 합성 엔진 초기화
+
+        Parameters:
+        seconds_per_char (float): 1배속에서 글자 하나의 재생 시간(초)
+        latency (float): 요청마다 기다릴 시간(초)
+        latency_per_char (float): 글자당 추가로 기다릴 시간(초)
+        """
+        self.seconds_per_char = seconds_per_char
+        self.latency = latency
+        self.latency_per_char = latency_per_char
+        self.calls = 0
+        self.chars = 0
+        self._lock = threading.Lock()
+
+    def reset_stats(self):
+        """합성 요청 수와 글자 수 초기화"""
+        with self._lock:
+            self.calls = 0
+            self.chars = 0
+
+    def synthesize(self, text, voice, language, speed=1.0, with_timing=False):
+        with self._lock:
+            self.calls += 1
+            self.chars += len(text)
+        delay = self.latency + self.latency_per_char * len(text)
+        if delay > 0:
+            time.sleep(delay)
+
+        # 단어마다 글자 수만큼의 길이와 단어 사이 쉼을 배정 (조각 앞뒤에는 실제 TTS처럼 쉼을 둠)
+        words = []
+        position = LOCAL_EDGE_SILENCE
+        for word in text.split():
+            duration = len(word) * self.seconds_per_char / speed
+            words.append([round(position, 3), round(duration, 3), word])
+            position += duration + LOCAL_WORD_GAP / speed
+        total = position + LOCAL_EDGE_SILENCE
+
+        # 단어 구간 프레임: part2_3_length가 0이 아닌 사이드 정보 뒤에 입력 해시를 채워 입력마다 다른 바이트를 만듦
+        digest = hashlib.sha256(f"{voice}|{language}|{speed}|{text}".encode("utf-8")).digest()
+        body_size = _LOCAL_FRAME_BYTES - len(_LOCAL_FRAME_HEADER)
+        voiced = _LOCAL_FRAME_HEADER + (b"\x00\xff" + digest * 5)[:body_size]
+        silent = _LOCAL_FRAME_HEADER + bytes(body_size)
+
+        audio = bytearray()
+        word_index = 0
+        for frame in range(max(1, int(total / _LOCAL_FRAME_SECONDS + 0.5))):
+            moment = frame * _LOCAL_FRAME_SECONDS
+            while word_index < len(words) and moment >= words[word_index][0] + words[word_index][1]:
+                word_index += 1
+            in_word = word_index < len(words) and moment >= words[word_index][0]
+            audio.extend(voiced if in_word else silent)
+        audio = bytes(audio)
+        return (audio, words) if with_timing else audio
+
+
+# 등록된 TTS 엔진 (이름 -> 엔진)
+ENGINES = {}
+
+
+def register_engine(engine):
+    """TTS 엔진 등록 (같은 이름이 있으면 교체)"""
+    if not isinstance(engine, TTSEngine):
+        raise TypeError(f"TTSEngine 인스턴스만 등록할 수 있습니다: {engine!r}")
+    if not engine.name:
+        raise ValueError(f"TTS 엔진 이름(name)이 없습니다: {type(engine).__name__}")
+    ENGINES[engine.name] = engine
+    return engine
+
+
+def get_engine(name):
+    """이름으로 등록된 TTS 엔진 조회"""
+    if name not in ENGINES:
+        raise ValueError(f"알 수 없는 TTS 엔진입니다: {name} (사용 가능: {', '.join(ENGINES)})")
+    return ENGINES[name]
+
+
+register_engine(GoogleEngine())
+register_engine(EdgeEngine())
+register_engine(LocalEngine())
+
+# 잘못된 TTS_ENGINE 값은 화면을 그릴 때마다 오류를 내지 않도록 시작할 때 한 번만 확인
+if ENGINE_OVERRIDE and ENGINE_OVERRIDE not in ENGINES:
+    print(f"TTS_ENGINE 설정 무시: 알 수 없는 TTS 엔진입니다: {ENGINE_OVERRIDE} (사용 가능: {', '.join(ENGINES)})")
+    ENGINE_OVERRIDE = None
@@ -1,34 +1,10 @@
 import streamlit as st
-import os
 import base64
-import tempfile
-import asyncio
-import subprocess
-from io import BytesIO
-from gtts import gTTS
 from PIL import Image
 import time
-
-# python-docx 패키지 체크
-try:
-    from docx import Document
-    docx_available = True
-except ImportError:
-    docx_available = False
-
-# PyPDF2 패키지 체크
-try:
-    import PyPDF2
-    pdf_available = True
-except ImportError:
-    pdf_available = False
-
-# edge-tts 패키지 체크
-try:
-    import edge_tts
-    edge_tts_available = True
-except ImportError:
-    edge_tts_available = False
+import document_extractor
+import tts_engine
+from tts_engine import edge_tts_available
 
 def run():
     # 사이드바 설정
@@ -74,8 +50,19 @@ def run():
                 "프랑스어": ["fr-FR-DeniseNeural (여성)", "fr-FR-HenriNeural (남성)"]
             }
             
-            voice_options = edge_voices.get(language, ["기본 음성"])
-            selected_voice = st.selectbox("음성 선택", voice_options)
+            # 캐시된 음성 목록에서 선택한 언어의 음성 표시 (목록을 받지 못하면 기본 목록 사용)
+            gender_label = {"Female": "여성", "Male": "남성"}
+            catalog_voices = tts_engine.voice_catalog.voices(lang_code[language])
+            voice_options = [
+                f"{voice['ShortName']} ({gender_label.get(voice.get('Gender'), voice.get('Gender', ''))})"
+                for voice in catalog_voices
+            ] or edge_voices.get(language, ["기본 음성"])
+            default_voice = edge_voices.get(language, [""])[0]
+            selected_voice = st.selectbox(
+                "음성 선택",
+                voice_options,
+                index=voice_options.index(default_voice) if default_voice in voice_options else 0
+            )
             
             # 음성 이름 추출 (괄호 앞 부분)
             voice_name = selected_voice.split(" (")[0] if " (" in selected_voice else selected_voice
@@ -83,6 +70,40 @@ def run():
         # 음성 속도 조절
         speed = st.slider("🔊 음성 속도", min_value=0.5, max_value=1.5, value=1.0, step=0.1)
         
+        # 긴 텍스트는 앞부분부터 바로 재생
+        progressive = st.checkbox("🎧 생성 중 바로 듣기", value=True,
+                                  help="먼저 합성된 앞부분 조각부터 재생하고, 완료되면 전체 파일을 제공합니다.")
+        
+        # 단어 경계 정보로 자막 파일 생성 (단어 경계를 주는 엔진만)
+        if tts_engine.ENGINE_OVERRIDE:
+            st.caption(f"⚙️ TTS_ENGINE 설정으로 '{tts_engine.ENGINE_OVERRIDE}' 엔진을 사용합니다.")
+            timing_available = tts_engine.get_engine(tts_engine.ENGINE_OVERRIDE).supports_timing
+        else:
+            timing_available = model_provider == "Microsoft Edge TTS" and edge_tts_available
+        captions = st.checkbox("📝 자막 파일 만들기 (SRT/VTT)", value=False, disabled=not timing_available,
+                               help="Microsoft Edge TTS가 보내는 단어 경계 정보로 음성과 같은 시각의 자막을 만듭니다.")
+        captions = captions and timing_available
+        
+        # 다운로드 파일 압축 (긴 무음 정리, 형식·비트레이트 변경)
+        with st.expander("🗜️ 음성 파일 압축"):
+            compact = st.checkbox("압축 사용", value=False,
+                                  help="합성이 끝난 음성을 줄여 메모리와 다운로드 크기를 아낍니다. 캐시에는 원본 조각이 남습니다.")
+            trim = st.checkbox("긴 무음 줄이기", value=True, disabled=not compact,
+                               help=f"조각 사이의 긴 무음을 {tts_engine.SILENCE_KEEP_SECONDS}초만 남기고 줄입니다. 자막 시각도 함께 맞춥니다.")
+            if tts_engine.ffmpeg_available:
+                audio_format = st.selectbox("파일 형식", list(tts_engine.COMPACT_FORMATS), disabled=not compact,
+                                            format_func=lambda fmt: {"mp3": "MP3", "ogg": "OGG (Opus)"}.get(fmt, fmt))
+                bitrate = st.selectbox("비트레이트", [None] + tts_engine.COMPACT_BITRATES, disabled=not compact,
+                                       format_func=lambda rate: "원본 유지" if rate is None else f"{rate}bps")
+                # 모노 변환은 다시 인코딩할 때만 적용 (MP3 + 원본 유지는 무음 정리만 함)
+                reencode = audio_format != "mp3" or bitrate is not None
+                mono = st.checkbox("모노로 변환", value=True, disabled=not (compact and reencode),
+                                   help="비트레이트를 고르거나 OGG로 바꿀 때 함께 적용됩니다.")
+            else:
+                st.caption("ffmpeg가 설치되어 있지 않아 형식·비트레이트 변경 없이 무음 정리만 합니다.")
+                audio_format, bitrate, mono = "mp3", None, True
+        compaction = (audio_format, bitrate, mono, trim) if compact else None
+        
         st.divider()
         st.caption("© 2025 남양주시 AI TTS 변환기")
 
@@ -143,8 +164,8 @@ def run():
         st.session_state.tts_text = ""
     if "audio_data" not in st.session_state:
         st.session_state.audio_data = None
-    if "last_model" not in st.session_state:
-        st.session_state.last_model = None
+    if "last_engine" not in st.session_state:
+        st.session_state.last_engine = None
     if "last_voice" not in st.session_state:
         st.session_state.last_voice = None
     if "last_text" not in st.session_state:
@@ -153,122 +174,108 @@ def run():
         st.session_state.last_speed = None
     if "last_language" not in st.session_state:
         st.session_state.last_language = None
+    if "captions" not in st.session_state:
+        st.session_state.captions = None
+    if "last_captions" not in st.session_state:
+        st.session_state.last_captions = False
+    if "audio_format" not in st.session_state:
+        st.session_state.audio_format = ("audio/mp3", "mp3")
+    if "compact_info" not in st.session_state:
+        st.session_state.compact_info = None
+    if "last_compaction" not in st.session_state:
+        st.session_state.last_compaction = None
     
-    # Google TTS로 음성 생성하는 함수
-    def generate_google_tts(text, language, speed):
-        try:
-            tts = gTTS(text=text, lang=lang_code[language], slow=(speed < 0.9))
-            audio_bytes = BytesIO()
-            tts.write_to_fp(audio_bytes)
-            audio_bytes.seek(0)
-            return audio_bytes.read()
-        except Exception as e:
-            raise Exception(f"Google TTS 오류: {str(e)}")
-    
-    # Edge TTS로 음성 생성하는 함수 (명령줄 직접 실행 방식)
-    def generate_edge_tts_cmd(text, voice_name, speed):
-        try:
-            # 임시 파일 생성
-            text_file = tempfile.NamedTemporaryFile(delete=False, suffix='.txt', mode='w', encoding='utf-8')
-            text_file.write(text)
-            text_file.close()
-            
-            output_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
-            output_file.close()
-            
-            # 속도 값 계산
-            speed_percent = int((speed - 1.0) * 100)
-            rate_option = f"--rate={speed_percent:+d}%" if speed != 1.0 else ""
-            
-            # edge-tts 명령줄 도구 직접 실행
-            cmd = f"edge-tts --voice {voice_name} --file {text_file.name} {rate_option} --write-media {output_file.name}"
-            process = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            
-            if process.returncode != 0:
-                raise Exception(f"Edge TTS 명령 실패: {process.stderr}")
-            
-            # 결과 파일 읽기
-            with open(output_file.name, "rb") as f:
-                audio_data = f.read()
-            
-            # 임시 파일 삭제
-            os.unlink(text_file.name)
-            os.unlink(output_file.name)
-            
-            return audio_data
-        except Exception as e:
-            raise Exception(f"Edge TTS 오류: {str(e)}")
+    # 사이드바 설정으로 실제 사용할 엔진 이름 (TTS_ENGINE 설정 우선, edge-tts가 없으면 Google TTS)
+    def selected_engine_name():
+        if tts_engine.ENGINE_OVERRIDE:
+            return tts_engine.ENGINE_OVERRIDE
+        if model_provider == "Microsoft Edge TTS" and edge_tts_available:
+            return "edge"
+        return "google"
     
-    async def list_edge_voices():
-        try:
-            voices = await edge_tts.VoicesManager.create()
-            return voices.voices
-        except Exception as e:
-            raise Exception(f"음성 목록 가져오기 실패: {str(e)}")
-
-    # Edge TTS로 음성 생성하는 비동기 함수 (API 사용 방식)
-    async def generate_edge_tts_async(text, voice_name, speed):
-        try:
-            # 사용 가능한 음성 목록 확인
-            voices = await list_edge_voices()
-            available_voices = [v["ShortName"] for v in voices]
-            
-            # 음성 이름 확인 및 수정
-            if voice_name not in available_voices:
-                # 대체 음성 찾기
-                language_code = voice_name.split('-')[0]
-                matching_voices = [v for v in available_voices if v.startswith(language_code)]
-                
-                if matching_voices:
-                    voice_name = matching_voices[0]
-                    st.info(f"지정한 음성을 찾을 수 없어 {voice_name}(으)로 대체합니다.")
-                else:
-                    # 기본 영어 음성으로 대체
-                    voice_name = "en-US-AriaNeural"
-                    st.warning(f"호환되는 음성을 찾을 수 없어 기본 음성({voice_name})을 사용합니다.")
-            
-            # 간단한 방식으로 시도
-            communicate = edge_tts.Communicate(text, voice_name)
-            
-            # 임시 출력 파일 생성
-            output_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
-            output_file.close()
-            
-            # 가장 기본적인 방식으로 시도 - 추가 매개변수 없이
-            await communicate.save(output_file.name)
-            
-            # 결과 파일 읽기
-            with open(output_file.name, "rb") as f:
-                audio_data = f.read()
-            
-            # 임시 파일 삭제
-            os.unlink(output_file.name)
-            
-            return audio_data
-        except Exception as e:
-            raise Exception(f"Edge TTS 비동기 오류: {str(e)}")
+    # 선택한 모델의 조각 합성 함수 (반환: 합성 함수, 엔진 이름, 음성)
+    def make_synthesizer(selected_voice=None, with_timing=False):
+        voice = None
+        engine = tts_engine.get_engine(selected_engine_name())
+        if tts_engine.ENGINE_OVERRIDE:
+            # 환경 변수로 지정한 엔진 사용 (예: 부하 테스트용 로컬 엔진)
+            voice = selected_voice
+        elif engine.name == "edge":
+            # 캐시된 음성 목록에서 확인 (없는 음성이면 같은 언어의 음성으로 대체)
+            voice, message = tts_engine.resolve_edge_voice(selected_voice or voice_name)
+            if message:
+                st.info(message)
+        elif model_provider == "Microsoft Edge TTS":
+            st.warning("Microsoft Edge TTS 사용 불가. Google TTS를 사용합니다.")
+        
+        with_timing = with_timing and engine.supports_timing
+        synthesize = lambda chunk: engine.synthesize(chunk, voice, lang_code[language], speed, with_timing)
+        return synthesize, engine.name, voice
     
-    # Edge TTS 생성 통합 함수 (API와 명령줄 방식 모두 시도)
-    def generate_edge_tts(text, voice_name, speed):
-        try:
-            # 먼저 API 방식 시도
-            if edge_tts_available:
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    return loop.run_until_complete(generate_edge_tts_async(text, voice_name, speed))
-                except Exception as e:
-                    st.warning(f"Edge TTS API 방식 실패: {str(e)}. 명령줄 방식으로 시도합니다.")
-            
-            # 명령줄 방식 시도
-            return generate_edge_tts_cmd(text, voice_name, speed)
-            
-        except Exception as e:
-            # 모든 방식 실패 시
-            raise Exception(f"Edge TTS 생성 실패: {str(e)}")
+    # 선택한 모델로 음성 생성 (긴 텍스트는 문장 단위 조각으로 나누어 동시에 합성)
+    def generate_speech(text):
+        synthesize, engine, voice = make_synthesizer(with_timing=captions)
+        
+        progress_bar = st.progress(0, text="음성 조각 합성 중...")
+        def on_progress(done, total):
+            progress_bar.progress(done / total, text=f"음성 조각 합성 중... ({done}/{total})")
+        
+        # 바로 듣기: 앞에서부터 준비된 조각을 이어 붙인 음성 하나를 같은 자리에서 늘려 가며 자동 재생
+        # 다시 그리면 재생이 처음으로 돌아가므로, 재생 시작 후 흐른 시간(이미 받은 음성 길이 이내)부터 이어서 재생
+        player = st.empty() if progressive else None
+        ready = {"parts": [], "duration": 0.0, "started": None}
+        def on_ready(start, parts):
+            now = time.monotonic()
+            position = 0.0 if ready["started"] is None else min(now - ready["started"], ready["duration"])
+            ready["parts"].extend(parts)
+            audio = tts_engine.concat_mp3(ready["parts"])
+            ready["duration"] = tts_engine.mp3_duration(audio)
+            ready["started"] = now - position
+            with player.container():
+                st.caption(f"🎧 바로 듣기 (1~{len(ready['parts'])}번째 조각 준비됨)")
+                st.audio(audio, format="audio/mp3", start_time=position, autoplay=True)
+        
+        # 같은 설정으로 합성한 적 있는 조각은 오디오 캐시에서 재사용
+        result = tts_engine.synthesize_chunked(
+            text, synthesize, on_progress=on_progress,
+            cache=tts_engine.audio_cache, cache_params=(engine, voice, lang_code[language], speed),
+            on_ready=on_ready if progressive else None,
+            first_chunk_chars=tts_engine.FIRST_CHUNK_CHARS if progressive else None,
+            with_timing=captions
+        )
+        progress_bar.empty()
+        
+        audio_data, words = result if captions else (result, None)
+        
+        # 압축: 세션에는 압축한 음성만 보관 (무음을 줄인 만큼 자막 시각도 당김)
+        st.session_state.audio_format = ("audio/mp3", "mp3")
+        st.session_state.compact_info = None
+        if compaction:
+            audio_data, info = tts_engine.compact_audio(audio_data, *compaction)
+            if words:
+                words = tts_engine.shift_words(words, info["removed"])
+            st.session_state.audio_format = (info["mime"], info["extension"])
+            st.session_state.compact_info = info
+        st.session_state.audio_data = audio_data
+        
+        # 자막은 합성할 때 받은 단어 경계로 바로 생성 (별도 정렬 작업 없음)
+        if captions:
+            cues = tts_engine.build_cues(words)
+            st.session_state.captions = {"srt": tts_engine.format_srt(cues), "vtt": tts_engine.format_vtt(cues)}
+        else:
+            st.session_state.captions = None
+        st.session_state.last_captions = captions
+        st.session_state.last_compaction = compaction
+        
+        # 현재 설정 저장
+        st.session_state.last_engine = engine
+        st.session_state.last_voice = voice
+        st.session_state.last_text = text
+        st.session_state.last_speed = speed
+        st.session_state.last_language = language
     
     # 입력 방식 선택 (탭 대신 라디오 버튼 사용)
-    input_method = st.radio("입력 방식 선택", ["텍스트 직접 입력", "파일 업로드"])
+    input_method = st.radio("입력 방식 선택", ["텍스트 직접 입력", "파일 업로드", "일괄 변환"])
     
     # 텍스트 직접 입력
     if input_method == "텍스트 직접 입력":
@@ -279,71 +286,45 @@ def run():
             "변환할 텍스트를 입력하세요",
             value=st.session_state.tts_text,
             height=200,
-            placeholder="여기에 음성으로 변환할 텍스트를 입력하세요. 길이 제한은 5000자입니다."
+            placeholder="여기에 음성으로 변환할 텍스트를 입력하세요. 긴 텍스트는 문장 단위로 나누어 변환합니다."
         )
         
         # 변환 버튼
         if st.button("🔊 음성으로 변환", type="primary", use_container_width=True):
             if text_input.strip():
-                if len(text_input) > 5000:
-                    st.warning("텍스트가 너무 깁니다. 5000자 이내로 입력해주세요.")
+                st.session_state.tts_text = text_input
+                
+                # 이전과 다른 설정인 경우에만 음성 다시 생성
+                settings_changed = (
+                    st.session_state.last_engine != selected_engine_name() or
+                    st.session_state.last_text != text_input or
+                    st.session_state.last_speed != speed or
+                    st.session_state.last_language != language or
+                    st.session_state.last_captions != captions or
+                    st.session_state.last_compaction != compaction
+                )
+                
+                if selected_engine_name() == "edge" and hasattr(st.session_state, 'last_voice'):
+                    settings_changed = settings_changed or (st.session_state.last_voice != voice_name)
+                
+                if settings_changed:
+                    with st.spinner("음성을 생성하고 있습니다..."):
+                        try:
+                            generate_speech(text_input)
+                            st.success("음성이 생성되었습니다!")
+                        except Exception as e:
+                            st.error(f"음성 생성 중 오류가 발생했습니다: {str(e)}")
                 else:
-                    st.session_state.tts_text = text_input
-                    
-                    # 이전과 다른 설정인 경우에만 음성 다시 생성
-                    settings_changed = (
-                        st.session_state.last_model != model_provider or
-                        st.session_state.last_text != text_input or
-                        st.session_state.last_speed != speed or
-                        st.session_state.last_language != language
-                    )
-                    
-                    if model_provider == "Microsoft Edge TTS" and hasattr(st.session_state, 'last_voice'):
-                        settings_changed = settings_changed or (st.session_state.last_voice != voice_name)
-                    
-                    if settings_changed:
-                        with st.spinner("음성을 생성하고 있습니다..."):
-                            try:
-                                if model_provider == "Google TTS":
-                                    st.session_state.audio_data = generate_google_tts(text_input, language, speed)
-                                    st.session_state.last_model = "Google TTS"
-                                    st.session_state.last_voice = None
-                                
-                                elif model_provider == "Microsoft Edge TTS" and (edge_tts_available or True):  # 명령줄 방식은 패키지 없이도 가능
-                                    st.session_state.audio_data = generate_edge_tts(text_input, voice_name, speed)
-                                    st.session_state.last_model = "Microsoft Edge TTS"
-                                    st.session_state.last_voice = voice_name
-                                
-                                else:
-                                    st.warning("Microsoft Edge TTS 사용 불가. Google TTS를 사용합니다.")
-                                    st.session_state.audio_data = generate_google_tts(text_input, language, speed)
-                                    st.session_state.last_model = "Google TTS"
-                                    st.session_state.last_voice = None
-                                
-                                # 현재 설정 저장
-                                st.session_state.last_text = text_input
-                                st.session_state.last_speed = speed
-                                st.session_state.last_language = language
-                                
-                                st.success("음성이 생성되었습니다!")
-                            
-                            except Exception as e:
-                                st.error(f"음성 생성 중 오류가 발생했습니다: {str(e)}")
-                    else:
-                        st.info("이전과 동일한 설정입니다. 이미 생성된 음성을 사용합니다.")
+                    st.info("이전과 동일한 설정입니다. 이미 생성된 음성을 사용합니다.")
             else:
                 st.warning("변환할 텍스트를 입력해주세요.")
     
     # 파일 업로드
-    else:
+    elif input_method == "파일 업로드":
         st.markdown('<p class="sub-title">파일에서 텍스트 추출</p>', unsafe_allow_html=True)
         
         # 지원 가능한 파일 형식 확인
-        supported_types = ["txt"]
-        if docx_available:
-            supported_types.append("docx")
-        if pdf_available:
-            supported_types.append("pdf")
+        supported_types = document_extractor.supported_types()
         
         uploaded_file = st.file_uploader("텍스트가 포함된 파일을 업로드하세요", 
                                         type=supported_types)
@@ -353,36 +334,8 @@ def run():
         if uploaded_file is not None:
             with st.spinner("파일에서 텍스트를 추출하고 있습니다..."):
                 try:
-                    # 파일 형식에 따른 처리
-                    if uploaded_file.name.endswith('.txt'):
-                        extracted_text = uploaded_file.read().decode('utf-8')
-                    
-                    elif uploaded_file.name.endswith('.docx') and docx_available:
-                        # 임시 파일로 저장
-                        with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp_file:
-                            tmp_file.write(uploaded_file.getvalue())
-                            tmp_path = tmp_file.name
-                        
-                        # docx 파일 읽기
-                        doc = Document(tmp_path)
-                        extracted_text = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-                        os.unlink(tmp_path)  # 임시 파일 삭제
-                    
-                    elif uploaded_file.name.endswith('.pdf') and pdf_available:
-                        # 임시 파일로 저장
-                        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                            tmp_file.write(uploaded_file.getvalue())
-                            tmp_path = tmp_file.name
-                        
-                        # PDF 파일 읽기
-                        with open(tmp_path, 'rb') as file:
-                            pdf_reader = PyPDF2.PdfReader(file)
-                            text_chunks = []
-                            for page_num in range(len(pdf_reader.pages)):
-                                page = pdf_reader.pages[page_num]
-                                text_chunks.append(page.extract_text())
-                            extracted_text = '\n'.join(text_chunks)
-                        os.unlink(tmp_path)  # 임시 파일 삭제
+                    # 파일 형식에 따른 처리 (PDF는 페이지 단위 진행률 표시)
+                    extracted_text = document_extractor.extract_text_with_progress(uploaded_file, key="tts_extract")
                     
                     # 추출된 텍스트 표시
                     if extracted_text:
@@ -400,38 +353,14 @@ def run():
                         # 변환 버튼
                         if st.button("🔊 파일 내용을 음성으로 변환", type="primary", use_container_width=True):
                             if edited_text.strip():
-                                if len(edited_text) > 5000:
-                                    st.warning("텍스트가 너무 깁니다. 5000자 이내로 입력해주세요.")
-                                else:
-                                    st.session_state.tts_text = edited_text
-                                    
-                                    with st.spinner("음성을 생성하고 있습니다..."):
-                                        try:
-                                            if model_provider == "Google TTS":
-                                                st.session_state.audio_data = generate_google_tts(edited_text, language, speed)
-                                                st.session_state.last_model = "Google TTS"
-                                                st.session_state.last_voice = None
-                                            
-                                            elif model_provider == "Microsoft Edge TTS" and (edge_tts_available or True):
-                                                st.session_state.audio_data = generate_edge_tts(edited_text, voice_name, speed)
-                                                st.session_state.last_model = "Microsoft Edge TTS"
-                                                st.session_state.last_voice = voice_name
-                                            
-                                            else:
-                                                st.warning("Microsoft Edge TTS 사용 불가. Google TTS를 사용합니다.")
-                                                st.session_state.audio_data = generate_google_tts(edited_text, language, speed)
-                                                st.session_state.last_model = "Google TTS"
-                                                st.session_state.last_voice = None
-                                            
-                                            # 현재 설정 저장
-                                            st.session_state.last_text = edited_text
-                                            st.session_state.last_speed = speed
-                                            st.session_state.last_language = language
-                                            
-                                            st.success("음성이 생성되었습니다!")
-                                        
-                                        except Exception as e:
-                                            st.error(f"음성 생성 중 오류가 발생했습니다: {str(e)}")
+                                st.session_state.tts_text = edited_text
+                                
+                                with st.spinner("음성을 생성하고 있습니다..."):
+                                    try:
+                                        generate_speech(edited_text)
+                                        st.success("음성이 생성되었습니다!")
+                                    except Exception as e:
+                                        st.error(f"음성 생성 중 오류가 발생했습니다: {str(e)}")
                             else:
                                 st.warning("변환할 텍스트가 없습니다.")
                     else:
@@ -440,6 +369,89 @@ def run():
                 except Exception as e:
                     st.error(f"파일 처리 중 오류가 발생했습니다: {str(e)}")
     
+    # 일괄 변환 (여러 파일 또는 CSV -> MP3 ZIP)
+    else:
+        st.markdown('<p class="sub-title">여러 문서를 한 번에 변환</p>', unsafe_allow_html=True)
+        st.caption("여러 파일을 올리거나 filename, text, voice 열이 있는 CSV를 올리면 항목마다 MP3를 만들어 ZIP으로 묶습니다. "
+                   "voice 열은 Microsoft Edge TTS에서만 사용되며 비워 두면 사이드바에서 선택한 음성을 사용합니다.")
+        
+        batch_files = st.file_uploader("파일 또는 CSV를 업로드하세요",
+                                       type=document_extractor.supported_types() + ["csv"],
+                                       accept_multiple_files=True)
+        
+        if batch_files and st.button("🔊 일괄 음성 변환", type="primary", use_container_width=True):
+            # 업로드 파일을 변환 항목으로 정리
+            items = []
+            for batch_file in batch_files:
+                try:
+                    if document_extractor.get_extension(batch_file.name) == "csv":
+                        items.extend(tts_engine.parse_batch_csv(batch_file.getvalue()))
+                    else:
+                        text = document_extractor.extract_text(batch_file)
+                        items.append({"name": batch_file.name, "text": text, "voice": ""})
+                except Exception as e:
+                    st.error(f"{batch_file.name} 읽기 오류: {str(e)}")
+            items = [item for item in items if item["text"].strip()]
+            
+            if items:
+                # 음성별 합성 함수는 작업 스레드 밖에서 미리 준비 (음성 확인 안내 표시 포함)
+                synthesizers = {}
+                for item in items:
+                    if item["voice"] not in synthesizers:
+                        synthesizers[item["voice"]] = make_synthesizer(item["voice"] or None)
+                
+                # 여러 항목에 반복되는 인사말·맺음말은 일괄 변환 한 번에 한 번만 합성해 함께 사용
+                shared = tts_engine.find_shared_sentences([item["text"] for item in items])
+                window = tts_engine.SynthesisWindow()
+                
+                def synthesize_item(item):
+                    synthesize, engine, voice = synthesizers[item["voice"]]
+                    audio_data = tts_engine.synthesize_chunked(
+                        item["text"], synthesize,
+                        cache=tts_engine.audio_cache, cache_params=(engine, voice, lang_code[language], speed),
+                        shared=shared, window=window
+                    )
+                    if compaction:
+                        audio_data = tts_engine.compact_audio(audio_data, *compaction)[0]
+                    return audio_data
+                
+                status_table = st.empty()
+                def on_status(statuses):
+                    status_table.dataframe(
+                        [{"파일": s["file"], "상태": s["status"], "시도": s["attempts"], "오류": s["error"]} for s in statuses],
+                        use_container_width=True
+                    )
+                
+                with st.spinner(f"{len(items)}개 항목을 음성으로 변환하고 있습니다..."):
+                    extension = tts_engine.COMPACT_FORMATS[compaction[0]][3] if compaction else "mp3"
+                    zip_data, statuses = tts_engine.synthesize_batch(items, synthesize_item, on_status=on_status,
+                                                                     extension=extension)
+                st.session_state.batch_zip = zip_data
+                st.session_state.batch_statuses = statuses
+                
+                window_stats = window.stats()
+                if window_stats["saved"]:
+                    st.caption(f"🔁 공통 문장 {len(shared)}개를 한 번씩만 합성해 조각 합성 {window_stats['saved']}건을 줄였습니다.")
+            else:
+                st.warning("변환할 텍스트가 없습니다.")
+        
+        # 일괄 변환 결과
+        if st.session_state.get("batch_zip"):
+            statuses = st.session_state.batch_statuses
+            succeeded = sum(1 for s in statuses if s["status"] == "완료")
+            if succeeded == len(statuses):
+                st.success(f"{succeeded}개 항목을 모두 변환했습니다!")
+            else:
+                st.warning(f"{len(statuses)}개 중 {succeeded}개 변환 완료, {len(statuses) - succeeded}개 실패")
+            
+            st.download_button(
+                label="🔽 음성 파일 일괄 다운로드 (ZIP)",
+                data=st.session_state.batch_zip,
+                file_name=f"tts_batch_{time.strftime('%Y%m%d_%H%M%S')}.zip",
+                mime="application/zip",
+                use_container_width=True
+            )
+    
     # 생성된 오디오 표시
     if st.session_state.audio_data:
         st.markdown("---")
@@ -448,26 +460,56 @@ def run():
         st.markdown('<div class="audio-box">', unsafe_allow_html=True)
         
         # 모델 및 설정 정보 표시
-        model_info = st.session_state.last_model or "Google TTS"
+        engine_name = st.session_state.last_engine or "google"
+        model_info = tts_engine.get_engine(engine_name).label or engine_name
         voice_info = ""
-        if model_info == "Microsoft Edge TTS" and st.session_state.last_voice:
+        if engine_name == "edge" and st.session_state.last_voice:
             voice_info = f" - {st.session_state.last_voice}"
             
         st.markdown(f"**사용 모델**: {model_info}{voice_info}")
         
+        # 압축 결과 표시
+        info = st.session_state.compact_info
+        if info:
+            saved = info["original_bytes"] - info["compact_bytes"]
+            st.caption(
+                f"🗜️ 압축: {info['original_bytes'] / 1024:,.0f}KB → {info['compact_bytes'] / 1024:,.0f}KB "
+                f"({saved / info['original_bytes']:.0%} 절약, 무음 {info['trimmed_seconds']:.1f}초 정리)"
+            )
+        
         # 오디오 컨트롤
-        st.audio(st.session_state.audio_data, format="audio/mp3")
+        mime, extension = st.session_state.audio_format
+        st.audio(st.session_state.audio_data, format=mime)
         
         # 다운로드 버튼
         current_time = time.strftime("%Y%m%d_%H%M%S")
-        model_suffix = "edge" if model_info == "Microsoft Edge TTS" else "google"
         st.download_button(
-            label="🔽 음성 파일 다운로드 (MP3)",
+            label=f"🔽 음성 파일 다운로드 ({extension.upper()})",
             data=st.session_state.audio_data,
-            file_name=f"tts_{model_suffix}_{current_time}.mp3",
-            mime="audio/mp3",
+            file_name=f"tts_{engine_name}_{current_time}.{extension}",
+            mime=mime,
             use_container_width=True
         )
+        
+        # 자막 파일 다운로드 버튼
+        if st.session_state.captions:
+            col1, col2 = st.columns(2)
+            with col1:
+                st.download_button(
+                    label="📝 자막 다운로드 (SRT)",
+                    data=st.session_state.captions["srt"].encode("utf-8"),
+                    file_name=f"tts_{engine_name}_{current_time}.srt",
+                    mime="application/x-subrip",
+                    use_container_width=True
+                )
+            with col2:
+                st.download_button(
+                    label="📝 자막 다운로드 (VTT)",
+                    data=st.session_state.captions["vtt"].encode("utf-8"),
+                    file_name=f"tts_{engine_name}_{current_time}.vtt",
+                    mime="text/vtt",
+                    use_container_width=True
+                )
         st.markdown('</div>', unsafe_allow_html=True)
     
     # 하단 정보 표시
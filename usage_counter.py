@@ -312,4 +312,19 @@ def admin_stats_page():
         else:
             st.info("필터링 후 표시할 앱 통계가 없습니다.")
     else:
-        st.info("사용 기록이 없습니다.")
\ No newline at end of file
+        st.info("사용 기록이 없습니다.")
+    
+    # TTS 오디오 캐시 적중률
+    st.subheader("🔊 TTS 오디오 캐시")
+    try:
+        from tts_engine import audio_cache
+    except ImportError:
+        st.info("TTS 패키지가 설치되지 않아 캐시 통계를 표시할 수 없습니다.")
+        return
+    
+    cache_stats = audio_cache.stats()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("적중률", f"{cache_stats['hit_rate']:.1f}%")
+    col2.metric("적중 / 미적중 (조각)", f"{cache_stats['hits']:,} / {cache_stats['misses']:,}")
+    col3.metric("캐시 크기", f"{cache_stats['size_mb']:.1f} / {cache_stats['max_mb']:.0f} MB")
+    st.caption(f"저장된 음성 조각 {cache_stats['entries']:,}개")
\ No newline at end of file